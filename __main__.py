@@ -0,0 +1,56 @@
+"""
+Summary:
+
+Command line entry point of Ulaavi, running without Qt.
+
+Usage:
+    python <ulaavi tool path> ingest <path> [<path> ...] --group G [--category root|A] [--recursive]
+                                         [--workers N] [--batch-size N] [--profile h264_intra]
+
+`ingest` converts the media of files or folders and adds them to a category of the library, see `_ingest`. The
+proxy directory, proxy resolution and library file are taken from the preferences of the user running it.
+"""
+
+# -------------------------------- built-in Modules ----------------------------------
+import argparse
+import os
+import sys
+
+# -------------------------------- Custom Modules ------------------------------------
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from data import config
+import _ingest
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog='ulaavi', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    ingest_parser = commands.add_parser('ingest', help='convert files or folders and add them to the library')
+    ingest_parser.add_argument('paths', nargs='+', help='files or folders to ingest')
+    ingest_parser.add_argument('--group', required=True, help='group of the library, created if missing')
+    ingest_parser.add_argument('--category', default='root',
+                               help='category of the group, e.g. "root|stock", created if missing (default: root)')
+    ingest_parser.add_argument('--recursive', action='store_true', help='ingest the sub-folders too')
+    ingest_parser.add_argument('--workers', type=int, default=0,
+                               help=f'conversions run at once (default: {_ingest.default_workers()})')
+    ingest_parser.add_argument('--batch-size', type=int, default=config.INGEST_BATCH_SIZE,
+                               help=f'entries added to the library per write (default: {config.INGEST_BATCH_SIZE})')
+    ingest_parser.add_argument('--profile', choices=config.PROXY_ENCODING_PROFILES,
+                               help='proxy encoding profile (default: the one of the preferences)')
+    args = parser.parse_args()
+
+    if args.category.split('|')[0] != 'root':
+        parser.error(f'the category must start with "root": {args.category}')
+
+    stats = _ingest.ingest(args.paths, args.group, args.category, recursive=args.recursive,
+                           workers=max(0, args.workers), batch_size=max(1, args.batch_size),
+                           encoding_profile=args.profile or '')
+
+    print(f'{stats["found"]} found, {stats["converted"]} converted, {stats["failed"]} failed')
+    sys.exit(1 if stats['failed'] else 0)
+
+
+if __name__ == '__main__':
+    main()
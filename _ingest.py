@@ -0,0 +1,277 @@
+"""
+Summary:
+
+This module ingests folders into the library without the Qt panel, e.g. to pre-build the proxies of a stock library
+overnight on render nodes. It is run from the command line, see `__main__`.
+
+`ingest` lists the media of each folder with `_utilities.get_dropped_files_with_proxy_path`, exactly like a drop on
+the panel, so sources whose proxy is already in the library are skipped and an interrupted ingest resumes where it
+stopped. The media are converted by `conversion._converter.Converter` on a pool of worker processes, and the converted
+entries are added to the library with `tool_data.Data.add_proxy_entries`, `config.INGEST_BATCH_SIZE` entries per
+write instead of one write per entry. Proxies are named after their source file, so sources of different sub-folders
+sharing a name cannot be ingested into the same category: all but the first are reported as failed. A proxy only exists once its conversion completed (it is rendered to a partial
+file first), so the proxies of an interrupted ingest whose entries were not written yet are added to the library by
+the next run, without converting them again. The worker processes and the ffmpeg threads of each are sized to the idle cores
+by `conversion._concurrency.plan`.
+
+The library is read and written through the storage backend selected in the preferences; the panel should not be
+adding files to the same library meanwhile.
+"""
+
+# -------------------------------- built-in Modules ----------------------------------
+import os
+import signal
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# -------------------------------- Custom Modules ------------------------------------
+from conversion import _concurrency
+from conversion import _converter
+from data import config
+from data import tool_data
+import _utilities
+
+
+def default_workers() -> int:
+    """
+    Get the number of conversions to run at once on this machine, see `_concurrency.plan`.
+
+    :return: Number of worker processes.
+    :rtype: int
+    """
+    return _concurrency.plan()[0]
+
+
+def list_sources(paths: Iterable[str],
+                 proxy_root_path: str,
+                 group: str,
+                 category: str,
+                 recursive: bool = False,
+                 ingested: Optional[Dict[str, str]] = None) -> Tuple[List[Tuple[str, str, bool]],
+                                                                      List[Tuple[str, str]]]:
+    """
+    List the media to convert, once per proxy path: the media without a proxy, and the media whose proxy exists but
+    is not in the library (e.g. an ingest was killed before writing its entry).
+
+    Media of different folders with the same name would be converted to the same proxy path, e.g. "a/clip.mov" and
+    "b/clip.mov" with `recursive`: only the first one is listed, the others are returned as collisions.
+
+    :param paths: Files or folders to ingest.
+    :type paths: Iterable[str]
+    :param proxy_root_path: The root directory where proxy files are stored.
+    :type proxy_root_path: str
+    :param group: The group name.
+    :type group: str
+    :param category: The category name, e.g. "root|stock".
+    :type category: str
+    :param recursive: Whether to list the sub-folders of the folders too.
+    :type recursive: bool
+    :param ingested: Source files by proxy file, of the entries of the category already in the library.
+    :type ingested: Dict[str, str], optional
+    :return: The source file, proxy file and whether the source is an image sequence, of each media to convert; and
+             the source file and the source it collides with, of each media sharing its proxy path with another one.
+    :rtype: Tuple[List[Tuple[str, str, bool]], List[Tuple[str, str]]]
+    """
+    ingested = ingested or {}
+    sources = {}
+    collisions = []
+
+    for path in paths:
+        path = os.path.abspath(path).replace('\\', '/')
+        folders = [path]
+        if recursive and os.path.isdir(path):
+            folders = [folder.replace('\\', '/') for folder, _, _ in os.walk(path)]
+
+        for folder in folders:
+            for source_file, proxy_file, is_image_seq in _utilities.get_dropped_files_with_proxy_path(
+                    file_path=folder, proxy_root_path=proxy_root_path, group=group, category=category,
+                    include_existing=True):
+                other_source = ingested.get(proxy_file) or sources.get(proxy_file, ('',))[0]
+                if other_source and other_source != source_file:
+                    collisions.append((source_file, other_source))
+                    continue
+
+                if proxy_file in ingested and os.path.isfile(proxy_file):
+                    continue
+                sources.setdefault(proxy_file, (source_file, proxy_file, is_image_seq))
+
+    return list(sources.values()), collisions
+
+
+def _ignore_interrupts() -> None:
+    """
+    Let the worker processes finish their conversion on Ctrl+C, the main process stops the ingest.
+
+    Ignoring SIGINT is not inherited by ffmpeg, which installs its own handler, so on POSIX the worker also leaves the
+    terminal's foreground process group (a new session): Ctrl+C then reaches neither the worker nor the ffmpeg and
+    ffprobe processes it starts. On Windows the running ffmpeg processes are interrupted too, and their conversions
+    fail.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    if hasattr(os, 'setsid'):
+        os.setsid()
+
+
+def _convert(source: Tuple[str, str, bool], settings: Dict) -> Tuple[str, str, Optional[dict], str]:
+    """
+    Convert a media in a worker process.
+
+    :param source: The source file, proxy file and whether the source is an image sequence.
+    :type source: Tuple[str, str, bool]
+    :param settings: The `res_width`, `res_height`, `filmstrip`, `thumbnail_from_proxy`, `encoding_profile` and
+                     `threads` of the conversion.
+    :type settings: Dict
+    :return: The source file, the proxy file, the media metadata (None if the conversion failed) and the failure.
+    :rtype: Tuple[str, str, Optional[dict], str]
+    """
+    source_file, proxy_file, is_image_seq = source
+    converter = _converter.Converter(source_file, proxy_file, is_image_seq, settings['res_width'],
+                                     settings['res_height'], filmstrip=settings['filmstrip'],
+                                     thumbnail_from_proxy=settings['thumbnail_from_proxy'],
+                                     encoding_profile=settings['encoding_profile'], threads=settings['threads'])
+    result = converter.convert()
+
+    return source_file, proxy_file, result[1] if result else None, converter.failure
+
+
+def _ingested_sources(data: tool_data.Data, group: str, category: str) -> Dict[str, str]:
+    """
+    Get the source files of the entries of a category, by proxy file.
+
+    :param data: The library.
+    :type data: tool_data.Data
+    :param group: The group name.
+    :type group: str
+    :param category: The category name, e.g. "root|stock".
+    :type category: str
+    :return: Source files by proxy file, empty if the category does not exist.
+    :rtype: Dict[str, str]
+    """
+    if group not in data.groups() or category not in data.categories(group):
+        return {}
+
+    return {entry['proxy']: entry['source'] for entry in data.data_obj.entries(group, category)}
+
+
+def _ensure_category(data: tool_data.Data, group: str, category: str) -> None:
+    """
+    Create the group and the category (with its parent categories) if they do not exist, like the panel does.
+
+    :param data: The library.
+    :type data: tool_data.Data
+    :param group: The group name.
+    :type group: str
+    :param category: The category name, e.g. "root|stock|clips".
+    :type category: str
+    """
+    if group not in data.groups():
+        data.add_group(group)
+
+    categories = set(data.categories(group))
+    parts = category.split('|')
+
+    for depth in range(min(2, len(parts)), len(parts) + 1):
+        parent = '|'.join(parts[:depth])
+        if parent not in categories:
+            data.add_category(group, parent)
+
+
+def ingest(paths: Iterable[str],
+           group: str,
+           category: str,
+           recursive: bool = False,
+           workers: int = 0,
+           batch_size: int = config.INGEST_BATCH_SIZE,
+           encoding_profile: str = '',
+           report: Callable[[str], None] = print) -> Dict[str, int]:
+    """
+    Convert the media of files or folders and add them to a category of the library.
+
+    Ctrl+C stops the ingest: queued conversions are dropped, running ones finish and are added to the library (on
+    Windows, running conversions are interrupted and reported as failed, see `_ignore_interrupts`).
+
+    :param paths: Files or folders to ingest.
+    :type paths: Iterable[str]
+    :param group: The group name.
+    :type group: str
+    :param category: The category name, e.g. "root|stock".
+    :type category: str
+    :param recursive: Whether to ingest the sub-folders of the folders too.
+    :type recursive: bool
+    :param workers: Number of conversions to run at once, `default_workers()` if 0.
+    :type workers: int
+    :param batch_size: Number of entries added to the library per write.
+    :type batch_size: int
+    :param encoding_profile: Encoding profile of the proxies, the one of the preferences if empty.
+    :type encoding_profile: str
+    :param report: Called with a line of text for each converted or failed media.
+    :type report: Callable[[str], None]
+    :return: Number of media `found`, `converted` and `failed`.
+    :rtype: Dict[str, int]
+    """
+    workers = workers or default_workers()
+    data = tool_data.Data()
+    preferences = data.preferences
+    settings = {'res_width': preferences.res_width,
+                'res_height': preferences.res_height,
+                'filmstrip': bool(preferences.filmstrip),
+                'thumbnail_from_proxy': preferences.thumbnail_source == 'proxy',
+                'encoding_profile': encoding_profile or preferences.encoding_profile,
+                'threads': _concurrency.threads_per_job(workers)}
+
+    sources, collisions = list_sources(paths, preferences.proxy, group, category, recursive,
+                                       _ingested_sources(data, group, category))
+    stats = {'found': len(sources) + len(collisions), 'converted': 0, 'failed': 0}
+
+    for source_file, other_source in collisions:
+        stats['failed'] += 1
+        report(f'[{stats["failed"]}/{stats["found"]}] ERROR: {source_file}: same proxy file as {other_source}')
+
+    if not sources:
+        data.data_obj.close()
+        return stats
+
+    _ensure_category(data, group, category)
+    entries = []
+
+    def collect(future: Future) -> None:
+        """Add the entry of a finished conversion to the pending batch, writing it once full."""
+        try:
+            source_file, proxy_file, metadata, failure = future.result()
+        except Exception as error:
+            stats['failed'] += 1
+            report(f'ERROR: {error}')
+            return
+
+        done = stats['converted'] + stats['failed'] + 1
+        if metadata is None:
+            stats['failed'] += 1
+            report(f'[{done}/{stats["found"]}] ERROR: {failure}')
+            return
+
+        stats['converted'] += 1
+        entries.append({'proxy': proxy_file, 'source': source_file, 'metadata': metadata, 'tags': []})
+        report(f'[{done}/{stats["found"]}] {source_file}')
+
+        if len(entries) >= batch_size:
+            data.add_proxy_entries(entries[:], group, category)
+            entries.clear()
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_ignore_interrupts) as pool:
+            pending = {pool.submit(_convert, source, settings) for source in sources}
+            try:
+                for future in as_completed(list(pending)):
+                    pending.discard(future)
+                    collect(future)
+            except KeyboardInterrupt:
+                report('Interrupted, waiting for the running conversions...')
+                for future in as_completed([future for future in pending if not future.cancel()]):
+                    collect(future)
+    finally:
+        if entries:
+            data.add_proxy_entries(entries, group, category)
+        data.data_obj.close()
+
+    return stats
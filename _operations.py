@@ -12,6 +12,10 @@ Key Features:
     - **Tag Management**: Allows creating, adding, and removing tags from files.
     - **Thumbnail Scaling**: Dynamically adjusts thumbnail sizes and font scaling based on user preferences.
     - **Proxy Conversion**: Converts source files to proxy MOV files for efficient thumbnail generation.
+    - **Filter Scheduling**: Coalesces bursts of filter changes, cancels outdated grid population and reports
+      the latency of each filter query.
+    - **Conversion Scheduling**: Queues proxy conversions once per proxy, starts the ones on screen first and
+      cancels them on request.
 
 Classes:
     - **OpSignals**: A QObject-based class that defines signals for communication between the UI and backend.
@@ -28,19 +32,24 @@ Dependencies:
 
 # -------------------------------- built-in Modules ----------------------------------
 import os
+import time
+from collections import deque
 from functools import partial
 from typing import List, Tuple, Set
 
 # ------------------------------- ThirdParty Modules ---------------------------------
 try:
-    from PySide2.QtCore import QObject, Signal, QRunnable
+    from PySide2.QtCore import QObject, Signal, QRunnable, QTimer
 except ModuleNotFoundError:
-    from PySide6.QtCore import QObject, Signal, QRunnable
+    from PySide6.QtCore import QObject, Signal, QRunnable, QTimer
 
 # -------------------------------- Custom Modules ------------------------------------
+from data import config
 from data import tool_data
 import _utilities
 from conversion import convert_mov
+from conversion import _metadata_cache
+from conversion import _scheduler
 
 
 class OpSignals(QObject):
@@ -83,6 +92,23 @@ class OpSignals(QObject):
         - **on_start_conversion**: Emitted to start the file conversion process.
             - Args:
                 - `worker (object)`: The worker object responsible for conversion.
+        - **on_conversion_cancelled**: Emitted when the conversion of a dropped file is cancelled or fails, to remove
+          its cell.
+            - Args:
+                - `source_file (str)`: The path of the source file.
+                - `cell_position (tuple)`: The position of the cell in the UI.
+        - **on_conversion_progress**: Emitted while a dropped file is converted.
+            - Args:
+                - `source_file (str)`: The path of the source file.
+                - `cell_position (tuple)`: The position of the cell in the UI.
+                - `frame (int)`: Number of frames converted.
+                - `total_frames (int)`: Number of frames of the source.
+        - **on_conversion_queue**: Emitted when the conversion queue changes.
+            - Args:
+                - `queued (int)`: Number of conversions waiting for a thread.
+                - `running (int)`: Number of conversions running.
+                - `throughput (float)`: Conversions finished per minute.
+                - `eta (float)`: Estimated seconds until every conversion is done, -1 if unknown.
         - **on_files_dropped**: Emitted when files are dropped onto the UI.
             - Args:
                 - `data (tuple)`: A tuple of file data (source, proxy, is_image_seq).
@@ -94,14 +120,19 @@ class OpSignals(QObject):
                 - `data (dict)`: Metadata for the rendered file.
                 - `thumbnail_path (str)`: Path to the rendered thumbnail.
                 - `cell_position (tuple)`: The position of the cell in the UI.
+        - **on_reset_filters**: Emitted right before `on_change_filters`, to clear the grid and cancel the
+          population of a previous filter query.
         - **on_change_filters**: Emitted when filters (tags or search text) are changed.
             - Args:
                 - `data (list)`: A list of filtered thumbnail data.
                 - `_utilities.get_thumbnail_from_proxy (object)`: function to get the thumbnail file from proxy file
         - **on_delete_proxy**: Emitted to delete proxy files.
-        - **on_apply_preferences**: Emitted when filters (tags or search text) are changed.
+        - **on_apply_preferences**: Emitted when the thread count is applied, at startup and with the preferences.
+            - Args:
+                - `thread_count (int)`: max thread count of the conversion thread pool.
+        - **on_preview_mode**: Emitted to set the hover preview interaction.
             - Args:
-                - `thread_count (int)`: max thread count.
+                - `preview_mode (str)`: One of `config.PREVIEW_MODES`.
     """
     execute_startup = Signal()
     thumbnail_scale = Signal(int, int, float)
@@ -115,10 +146,15 @@ class OpSignals(QObject):
     on_files_dropped = Signal(tuple)
     on_recache_proxy = Signal(tuple)
     on_start_conversion = Signal(object)
+    on_conversion_cancelled = Signal(str, tuple)
+    on_conversion_progress = Signal(str, tuple, int, int)
+    on_conversion_queue = Signal(int, int, float, float)
     on_render_completed = Signal(dict, str, tuple)
+    on_reset_filters = Signal()
     on_change_filters = Signal(list, object)
     on_delete_proxy = Signal()
     on_apply_preferences = Signal(int)
+    on_preview_mode = Signal(str)
 
 
 class Operations:
@@ -129,6 +165,9 @@ class Operations:
 
     :ivar data: An instance of `tool_data.Data` for managing tool-specific data and preferences.
     :ivar op_signals: An instance of `OpSignals` for emitting signals to communicate with the UI.
+    :ivar scheduler: An instance of `_scheduler.ConversionScheduler` queueing the proxy conversions.
+    :ivar filter_latencies: Latest filter queries as (tag, search text, latency in milliseconds), measured from the
+                            filter change to the end of the grid population.
 
     Notes:
         - This class relies on the `tool_data.Data` class for data persistence and retrieval.
@@ -139,6 +178,18 @@ class Operations:
         """Initialize the Operations class."""
         self.data = tool_data.Data()
         self.op_signals = OpSignals()
+        self.filter_latencies = deque(maxlen=100)
+        self.scheduler = _scheduler.ConversionScheduler()
+        self.scheduler.on_start.connect(self.op_signals.on_start_conversion)
+        self.scheduler.on_queue_changed.connect(self.op_signals.on_conversion_queue)
+
+        self.__pending_filters = None
+        self.__filter_requested_at = None
+        self.__filter_in_flight = None
+        self.__filter_timer = QTimer()
+        self.__filter_timer.setSingleShot(True)
+        self.__filter_timer.setInterval(config.FILTER_DEBOUNCE_MS)
+        self.__filter_timer.timeout.connect(self._apply_pending_filters)
 
     def update_thumbnail_scale(self) -> None:
         """
@@ -153,6 +204,25 @@ class Operations:
             self._thumbnail_scale_percentage(default_width / 1.89),
             self._scale_font_size(font_size))
 
+    def update_preview_mode(self) -> None:
+        """
+        Update the hover preview interaction based on user preferences.
+        Emits the `on_preview_mode` signal with the preview mode.
+        """
+        self.op_signals.on_preview_mode.emit(self.data.preferences.preview_mode)
+
+    def update_thread_count(self) -> None:
+        """
+        Apply the thread count preference to the conversion scheduler, tuned to the machine in auto mode.
+        Emits the `on_apply_preferences` signal with the thread count the conversion thread pool needs.
+        """
+        if self.data.preferences.auto_thread_count:
+            self.scheduler.set_auto_thread_count()
+        else:
+            self.scheduler.set_max_thread_count(self.data.preferences.thread_count)
+
+        self.op_signals.on_apply_preferences.emit(self.scheduler.max_thread_count)
+
     def _thumbnail_scale_percentage(self, initial_value: int) -> int:
         """
         Calculate the scaled thumbnail dimension based on user preferences.
@@ -253,7 +323,8 @@ class Operations:
 
     def on_change_category(self, group: str, category: str, tag: str = None, search_string: str = None):
         """
-        Change the selected category and update the UI with the corresponding thumbnail data.
+        Change the selected category and update the UI with the corresponding thumbnail data, dropping any pending
+        filter change.
 
         :param group: The group name.
         :type group: str
@@ -264,6 +335,10 @@ class Operations:
         :param search_string: The search string to filter by (optional).
         :type search_string: str
         """
+        # a filter change still waiting for the debounce timer would reload its own category over this one
+        self.__filter_timer.stop()
+        self.__pending_filters = None
+
         if category == 'root':
             return
         self.op_signals.on_change_category.emit(
@@ -276,7 +351,10 @@ class Operations:
 
     def on_change_filters(self, group: str, category: str, tag: str = '', search_text: str = '') -> None:
         """
-        Apply filters (tag and search text) to the thumbnail data and update the UI.
+        Schedule applying filters (tag and search text) to the thumbnail data.
+
+        Filter changes arriving within `config.FILTER_DEBOUNCE_MS` of each other are coalesced,
+        only the latest one is applied.
 
         :param group: The group name.
         :type group: str
@@ -287,12 +365,50 @@ class Operations:
         :param search_text: The search text to filter by (optional).
         :type search_text: str
         """
+        self.__pending_filters = (group, category, tag, search_text)
+        self.__filter_requested_at = time.perf_counter()
+        self.__filter_timer.start()
+
+    def _apply_pending_filters(self) -> None:
+        """
+        Apply the latest scheduled filters and update the UI.
+
+        Emits `on_reset_filters` first, which cancels the grid population of a previous query still in progress.
+        """
+        if self.__pending_filters is None:
+            return
+
+        group, category, tag, search_text = self.__pending_filters
+        self.__pending_filters = None
+
         if category == 'root':
             return
+
+        self.__filter_in_flight = (tag, search_text, self.__filter_requested_at)
+        self.op_signals.on_reset_filters.emit()
         self.op_signals.on_change_filters.emit(
             self.data.thumbnail_data(
                 group, category, tag=tag, search_string=search_text), _utilities.get_thumbnail_from_proxy)
 
+    def on_thumbnails_loaded(self, total_items: int, is_cancelled: bool) -> None:
+        """
+        Record the latency of the filter query whose thumbnails finished loading.
+
+        :param total_items: The number of loaded thumbnails.
+        :type total_items: int
+        :param is_cancelled: Whether the loading was cancelled by a newer query.
+        :type is_cancelled: bool
+        """
+        if is_cancelled or self.__filter_in_flight is None:
+            return
+
+        tag, search_text, requested_at = self.__filter_in_flight
+        self.__filter_in_flight = None
+
+        latency = (time.perf_counter() - requested_at) * 1000
+        self.filter_latencies.append((tag, search_text, latency))
+        self.op_signals.update_status.emit(f'Filtered {total_items} item(s) in {latency:.0f} ms')
+
     def on_create_tag(self, tag: str) -> None:
         """
         Create a new tag.
@@ -354,7 +470,6 @@ class Operations:
         self.data.preferences.update(data)
         self.data.refresh()
         self.op_signals.execute_startup.emit()
-        self.op_signals.on_apply_preferences.emit(int(self.data.preferences.thread_count))
         self.op_signals.update_status.emit(f'Settings Panel: Saved Preferences.')
 
     def on_file_drop(self, file_url: str, group: str, category: str) -> None:
@@ -377,6 +492,16 @@ class Operations:
         if not data:
             self.op_signals.update_status.emit(f'Proxy already exist for the source file: {file_url}')
 
+        # files dropped again while their proxy is queued or converting do not get a second cell
+        scheduled = [proxy_file for _, proxy_file, _ in data if self.scheduler.is_scheduled(proxy_file)]
+        if scheduled:
+            data = tuple(files for files in data if files[1] not in scheduled)
+            self.op_signals.update_status.emit(f'Proxy file already queued: {", ".join(scheduled)}')
+
+        if len(data) > 1:
+            # probe the dropped files in one batch, their conversions pick up the results
+            _metadata_cache.cache.probe_many_async(
+                source_file for source_file, _, is_image_seq in data if not is_image_seq)
         self.op_signals.on_files_dropped.emit(data)
 
     def on_recache_proxy(self, file_url: str, cell_position: Tuple[int, int], group: str, category: str) -> None:
@@ -433,6 +558,10 @@ class Operations:
         self.data.remove_data(group, category, source_files=source_files)
         self.on_change_category(group, category, tag, search_string)
         _utilities.delete_files([_utilities.get_proxy_thumbnail(proxy_file) for proxy_file in proxy_files])
+        _utilities.delete_files(
+            [file for proxy_file in proxy_files for file in _utilities.get_filmstrip_from_proxy(proxy_file) if file])
+        _utilities.delete_files(
+            [file for file in map(_utilities.get_keyframes_from_proxy, proxy_files) if file])
         _utilities.delete_files(proxy_files)
 
     def convert_to_mov(self,
@@ -462,9 +591,15 @@ class Operations:
             self.op_signals.update_status.emit(f'Proxy file already exist: {proxy_file}')
             return
 
+        if self.scheduler.is_scheduled(proxy_file):
+            self.op_signals.update_status.emit(f'Proxy file already queued: {proxy_file}')
+            return
+
         worker = convert_mov.ConvertMov(
-            source_file, proxy_file, is_image_seq, self.data.preferences.res_width, self.data.preferences.res_height)
-        self.op_signals.on_start_conversion.emit(worker)
+            source_file, proxy_file, is_image_seq, self.data.preferences.res_width, self.data.preferences.res_height,
+            filmstrip=bool(self.data.preferences.filmstrip),
+            thumbnail_from_proxy=self.data.preferences.thumbnail_source == 'proxy',
+            encoding_profile=self.data.preferences.encoding_profile)
 
         worker.signals.on_render_completed.connect(
             partial(self.on_render_completed,
@@ -473,9 +608,30 @@ class Operations:
                     source_file=source_file,
                     cell_position=cell_position))
 
-        worker.signals.on_render_error.connect(self.on_render_error)
+        worker.signals.on_render_error.connect(
+            partial(self.on_render_error, source_file=source_file, cell_position=cell_position))
+        worker.signals.on_render_cancelled.connect(
+            partial(self.on_render_cancelled, source_file=source_file, cell_position=cell_position))
+        worker.signals.on_progress.connect(
+            partial(self.on_render_progress, source_file=source_file, cell_position=cell_position))
+
+        self.scheduler.submit(worker)
         self.op_signals.update_status.emit(f'Creating proxy File for {source_file}')
 
+    def prioritize_conversions(self, source_files: List[str]) -> None:
+        """
+        Convert the source files of the cells on screen before the other queued ones.
+
+        :param source_files: The source files of the visible cells being converted.
+        :type source_files: list
+        """
+        self.scheduler.prioritize(source_files)
+
+    def cancel_conversions(self) -> None:
+        """Cancel every queued and running proxy conversion."""
+        cancelled = self.scheduler.cancel_all()
+        self.op_signals.update_status.emit(f'Cancelled {cancelled} proxy conversion(s)')
+
     def on_render_completed(self,
                             proxy_file: str,
                             proxy_thumbnail: str,
@@ -517,13 +673,57 @@ class Operations:
         self.op_signals.on_render_completed.emit(data, proxy_thumbnail, cell_position)
         self.op_signals.update_status.emit(f'Created  Proxy File: {proxy_file}')
 
-    def on_render_error(self, data: str) -> None:
+    def on_render_progress(self,
+                           proxy_file: str,
+                           frame: int,
+                           total_frames: int,
+                           fps: float,
+                           speed: float,
+                           source_file: str,
+                           cell_position: Tuple[int, int]) -> None:
+        """
+        Handle the progress of a proxy file rendering.
+
+        :param proxy_file: The path of the proxy file.
+        :type proxy_file: str
+        :param frame: Number of frames converted.
+        :type frame: int
+        :param total_frames: Number of frames of the source.
+        :type total_frames: int
+        :param fps: Encoding fps.
+        :type fps: float
+        :param speed: Encoding speed relative to playback.
+        :type speed: float
+        :param source_file: The path of the source file.
+        :type source_file: str
+        :param cell_position: The position of the cell in the UI.
+        :type cell_position: tuple
+        """
+        self.op_signals.on_conversion_progress.emit(source_file, cell_position, frame, total_frames)
+
+    def on_render_cancelled(self, source_file: str, cell_position: Tuple[int, int]) -> None:
+        """
+        Handle the cancellation of a proxy file rendering.
+
+        :param source_file: The path of the source file.
+        :type source_file: str
+        :param cell_position: The position of the cell in the UI.
+        :type cell_position: tuple
+        """
+        self.op_signals.on_conversion_cancelled.emit(source_file, cell_position)
+
+    def on_render_error(self, data: str, source_file: str, cell_position: Tuple[int, int]) -> None:
         """
         Handle errors during proxy file rendering.
 
-        :param data: The error data.
+        :param data: The error data, prefixed with the failure class (see `_converter.FAILURE_BAD_SOURCE`).
         :type data: Any
+        :param source_file: The path of the source file.
+        :type source_file: str
+        :param cell_position: The position of the cell in the UI.
+        :type cell_position: tuple
         """
+        self.op_signals.on_conversion_cancelled.emit(source_file, cell_position)
         self.op_signals.update_status.emit(f'ERROR: {data}')
 
     @staticmethod
@@ -11,15 +11,11 @@ import re
 import shutil
 import subprocess
 import sys
+from typing import Tuple
 
 # ------------------------------- ThirdParty Modules ---------------------------------
 import clique
 
-try:
-    from PySide2 import QtWidgets
-except ModuleNotFoundError:
-    from PySide6 import QtWidgets
-
 # -------------------------------- Custom Modules ------------------------------------
 from data import config
 
@@ -127,10 +123,42 @@ def get_proxy_thumbnail(proxy_file: str):
         if proxy_file.endswith(config.PROXY_FORMAT) else proxy_file
 
 
+def get_filmstrip_from_proxy(proxy_file: str) -> Tuple[str, str]:
+    """
+    Generates the filmstrip image and filmstrip info file paths from a given proxy file path.
+
+    :param proxy_file: The file path of the proxy file.
+    :type proxy_file: str
+    :return: The filmstrip image and info file paths, empty strings if the file is not a proxy file.
+    :rtype: Tuple[str, str]
+    """
+    if not proxy_file or not proxy_file.endswith(config.PROXY_FORMAT):
+        return '', ''
+
+    stem = proxy_file[:-len(config.PROXY_FORMAT)]
+    return f'{stem}{config.FILMSTRIP_SUFFIX}', f'{stem}{config.FILMSTRIP_INFO_SUFFIX}'
+
+
+def get_keyframes_from_proxy(proxy_file: str) -> str:
+    """
+    Generates the keyframe table file path from a given proxy file path, next to its thumbnail.
+
+    :param proxy_file: The file path of the proxy file.
+    :type proxy_file: str
+    :return: The keyframe table file path, an empty string if the file is not a proxy file.
+    :rtype: str
+    """
+    if not proxy_file or not proxy_file.endswith(config.PROXY_FORMAT):
+        return ''
+
+    return f'{proxy_file[:-len(config.PROXY_FORMAT)]}{config.KEYFRAMES_SUFFIX}'
+
+
 def get_dropped_files_with_proxy_path(file_path: str,
                                       proxy_root_path: str,
                                       group: str,
-                                      category: str):
+                                      category: str,
+                                      include_existing: bool = False):
     """
    Generates tuples containing source file paths, their corresponding proxy file paths, and a flag indicating whether the source is an image sequence.
 
@@ -148,6 +176,8 @@ def get_dropped_files_with_proxy_path(file_path: str,
    :param category: The category of the source file, used to create subdirectories for proxy files.
                    The category string is split by '|' to create nested directories.
    :type category: str
+   :param include_existing: Whether to yield the files whose proxy file already exists too. Defaults to False.
+   :type include_existing: bool
 
    :yield: A tuple containing:
        - The source file path (str).
@@ -163,7 +193,7 @@ def get_dropped_files_with_proxy_path(file_path: str,
    """
     if os.path.isfile(file_path):
         proxy_file = get_proxy_files_from_source_file(
-            file_path, proxy_root_path, group, category, is_image_sequence=False)
+            file_path, proxy_root_path, group, category, is_image_sequence=False, include_existing=include_existing)
         if proxy_file:
             yield file_path, proxy_file, False
 
@@ -172,13 +202,15 @@ def get_dropped_files_with_proxy_path(file_path: str,
 
             if isinstance(source_data, tuple):
                 proxy_file = get_proxy_files_from_source_file(
-                    source_data[0], proxy_root_path, group, category, is_image_sequence=True)
+                    source_data[0], proxy_root_path, group, category, is_image_sequence=True,
+                    include_existing=include_existing)
                 if proxy_file:
                     yield f'{source_data[0]} {source_data[1]}', proxy_file, True
 
             if isinstance(source_data, str):
                 proxy_file = get_proxy_files_from_source_file(
-                    source_data, proxy_root_path, group, category, is_image_sequence=False)
+                    source_data, proxy_root_path, group, category, is_image_sequence=False,
+                    include_existing=include_existing)
                 if proxy_file:
                     yield source_data, proxy_file, False
 
@@ -225,7 +257,8 @@ def get_proxy_files_from_source_file(source_file: str,
                                      proxy_root_path: str,
                                      group: str,
                                      category: str,
-                                     is_image_sequence: bool = False) -> str:
+                                     is_image_sequence: bool = False,
+                                     include_existing: bool = False) -> str:
     """
     Generates the proxy file path based on the source file and provided parameters.
 
@@ -243,6 +276,8 @@ def get_proxy_files_from_source_file(source_file: str,
     :type category: str
     :param is_image_sequence: Whether the source file is part of an image sequence. Defaults to False.
     :type is_image_sequence: bool
+    :param include_existing: Whether to return the path even if the proxy file already exists. Defaults to False.
+    :type include_existing: bool
 
     :return: The generated proxy file path. If the proxy file does not exist, the path is returned with normalized slashes.
     :rtype: str
@@ -263,7 +298,7 @@ def get_proxy_files_from_source_file(source_file: str,
     elif source_file.endswith(config.SUPPORTED_IMAGE_FORMATS):
         proxy_file += config.THUMBNAIL_FORMAT
 
-    if not os.path.isfile(proxy_file):
+    if include_existing or not os.path.isfile(proxy_file):
         return proxy_file.replace('\\', '/')
 
 
@@ -0,0 +1,161 @@
+"""
+Summary:
+
+Benchmark of the proxy conversion of a video: the two-pass path (`_commands.convert_video`, then
+`_commands.extract_image_from_video` reading the source again) against the single-pass path
+(`_commands.convert_video_with_thumbnail`). Both paths start with the same ffprobe call.
+
+The source clip is generated with ffmpeg's `testsrc2` source, so only ffmpeg and ffprobe are required.
+
+Usage:
+    python benchmarks/bench_conversion.py [--duration 10] [--size 1920x1080] [--fps 24] [--runs 3]
+"""
+
+# -------------------------------- built-in Modules ----------------------------------
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# -------------------------------- Custom Modules ------------------------------------
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from conversion import _commands
+
+THUMBNAIL_WIDTH = 320
+THUMBNAIL_HEIGHT = 180
+
+
+def _run(command: list) -> None:
+    """
+    Run a command, raising if it fails.
+
+    :param command: Command to run.
+    :type command: list
+    """
+    subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+
+
+def _make_source(directory: str, duration: float, size: str, fps: float) -> str:
+    """
+    Generate the source clip.
+
+    :param directory: Directory to write the clip to.
+    :type directory: str
+    :param duration: Duration of the clip, in seconds.
+    :type duration: float
+    :param size: Frame size, e.g. `1920x1080`.
+    :type size: str
+    :param fps: Frame rate of the clip.
+    :type fps: float
+    :return: Path to the clip.
+    :rtype: str
+    """
+    source_file = os.path.join(directory, 'source.mp4')
+    _run(['ffmpeg', '-y', '-f', 'lavfi', '-i', f'testsrc2=size={size}:rate={fps}', '-t', f'{duration}',
+          '-vcodec', 'libx264', '-pix_fmt', 'yuv420p', source_file])
+    return source_file
+
+
+def _probe(source_file: str) -> tuple:
+    """
+    Probe the source like `convert_mov._get_file_metadata`.
+
+    :param source_file: Path to the source clip.
+    :type source_file: str
+    :return: Thumbnail frame time and FPS.
+    :rtype: tuple[float, float]
+    """
+    out = subprocess.run(_commands.extract_video_thumbnail_frame(source_file), capture_output=True).stdout
+    stream = json.loads(out)['streams'][0]
+    numerator, denominator = map(int, stream['r_frame_rate'].split('/'))
+    return float(stream.get('duration', 0)) // 2, numerator / denominator
+
+
+def two_pass(source_file: str, directory: str) -> None:
+    """
+    Convert the source with a separate thumbnail pass.
+
+    :param source_file: Path to the source clip.
+    :type source_file: str
+    :param directory: Directory to write the outputs to.
+    :type directory: str
+    """
+    thumbnail_time, fps = _probe(source_file)
+    _run(_commands.convert_video(
+        source_file, os.path.join(directory, 'two_pass.mov'), THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT, fps))
+    _run(_commands.extract_image_from_video(
+        source_file, os.path.join(directory, 'two_pass.png'), THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT, thumbnail_time))
+
+
+def single_pass(source_file: str, directory: str) -> None:
+    """
+    Convert the source and extract its thumbnail in one ffmpeg invocation.
+
+    :param source_file: Path to the source clip.
+    :type source_file: str
+    :param directory: Directory to write the outputs to.
+    :type directory: str
+    """
+    thumbnail_time, fps = _probe(source_file)
+    _run(_commands.convert_video_with_thumbnail(
+        source_file, os.path.join(directory, 'single_pass.mov'), os.path.join(directory, 'single_pass.png'),
+        THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT, fps, thumbnail_time))
+
+
+def _time(function, source_file: str, directory: str, runs: int) -> list:
+    """
+    Time runs of a conversion path, removing its outputs before each run.
+
+    :param function: The conversion path.
+    :type function: Callable
+    :param source_file: Path to the source clip.
+    :type source_file: str
+    :param directory: Directory to write the outputs to.
+    :type directory: str
+    :param runs: Number of runs.
+    :type runs: int
+    :return: Wall time of each run, in seconds.
+    :rtype: list[float]
+    """
+    timings = []
+    for _ in range(runs):
+        for file in os.listdir(directory):
+            if file.startswith(function.__name__):
+                os.remove(os.path.join(directory, file))
+
+        start = time.perf_counter()
+        function(source_file, directory)
+        timings.append(time.perf_counter() - start)
+
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--size', default='1920x1080')
+    parser.add_argument('--fps', type=float, default=24)
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        source_file = _make_source(directory, args.duration, args.size, args.fps)
+
+        results = {function.__name__: _time(function, source_file, directory, args.runs)
+                   for function in (two_pass, single_pass)}
+
+    print(f'source: {args.size} @ {args.fps} fps, {args.duration} s, {args.runs} run(s)')
+    for name, timings in results.items():
+        print(f'{name:<12} median {statistics.median(timings):7.3f} s   min {min(timings):7.3f} s')
+
+    speedup = statistics.median(results['two_pass']) / statistics.median(results['single_pass'])
+    print(f'single pass is {speedup:.2f}x the speed of two pass '
+          f'(the two-pass path additionally slept 0.5 s per clip before this change)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+"""
+Summary:
+
+Benchmark of the proxy encoding profiles (`config.PROXY_ENCODING_PROFILES`): for each profile, the encode time of
+`_commands.convert_video`, the size of the proxy and the latency of random seeks with OpenCV, the way the hover
+preview reads frames (`cv2.CAP_PROP_POS_FRAMES`, then one `read`).
+
+The source clip is generated with ffmpeg's `testsrc2` source, so only ffmpeg and OpenCV are required. Without OpenCV
+the seek latency is not measured.
+
+Usage:
+    python benchmarks/bench_encoding_profiles.py [--duration 10] [--size 1920x1080] [--fps 24] [--runs 3]
+                                                 [--seeks 50]
+"""
+
+# -------------------------------- built-in Modules ----------------------------------
+import argparse
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# ------------------------------- ThirdParty Modules ---------------------------------
+try:
+    import cv2
+except ModuleNotFoundError:
+    cv2 = None
+
+# -------------------------------- Custom Modules ------------------------------------
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from conversion import _commands
+from data import config
+
+PROXY_WIDTH = 520
+PROXY_HEIGHT = 300
+
+
+def _run(command: list) -> None:
+    """
+    Run a command, raising if it fails.
+
+    :param command: Command to run.
+    :type command: list
+    """
+    subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+
+
+def _make_source(directory: str, duration: float, size: str, fps: float) -> str:
+    """
+    Generate the source clip.
+
+    :param directory: Directory to write the clip to.
+    :type directory: str
+    :param duration: Duration of the clip, in seconds.
+    :type duration: float
+    :param size: Frame size, e.g. `1920x1080`.
+    :type size: str
+    :param fps: Frame rate of the clip.
+    :type fps: float
+    :return: Path to the clip.
+    :rtype: str
+    """
+    source_file = os.path.join(directory, 'source.mp4')
+    _run(['ffmpeg', '-y', '-f', 'lavfi', '-i', f'testsrc2=size={size}:rate={fps}', '-t', f'{duration}',
+          '-vcodec', 'libx264', '-pix_fmt', 'yuv420p', source_file])
+    return source_file
+
+
+def _encode(source_file: str, proxy_file: str, fps: float, profile: str, runs: int) -> list:
+    """
+    Time the encoding of the proxy with a profile.
+
+    :param source_file: Path to the source clip.
+    :type source_file: str
+    :param proxy_file: Path to the proxy, removed before each run.
+    :type proxy_file: str
+    :param fps: Frame rate of the proxy.
+    :type fps: float
+    :param profile: The encoding profile.
+    :type profile: str
+    :param runs: Number of runs.
+    :type runs: int
+    :return: Wall time of each run, in seconds.
+    :rtype: list[float]
+    """
+    timings = []
+    for _ in range(runs):
+        if os.path.isfile(proxy_file):
+            os.remove(proxy_file)
+
+        start = time.perf_counter()
+        _run(_commands.convert_video(source_file, proxy_file, PROXY_WIDTH, PROXY_HEIGHT, fps, profile))
+        timings.append(time.perf_counter() - start)
+
+    return timings
+
+
+def _seek(proxy_file: str, seeks: int) -> list:
+    """
+    Time random seeks in a proxy, each followed by the read of one frame.
+
+    The same frames are visited for every profile.
+
+    :param proxy_file: Path to the proxy.
+    :type proxy_file: str
+    :param seeks: Number of seeks.
+    :type seeks: int
+    :return: Latency of each seek, in seconds, or an empty list without OpenCV.
+    :rtype: list[float]
+    """
+    if cv2 is None:
+        return []
+
+    cap = cv2.VideoCapture(proxy_file)
+    try:
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        frames = random.Random(0).choices(range(max(1, total_frames)), k=seeks)
+
+        timings = []
+        for frame in frames:
+            start = time.perf_counter()
+            cap.set(cv2.CAP_PROP_POS_FRAMES, frame)
+            cap.read()
+            timings.append(time.perf_counter() - start)
+        return timings
+    finally:
+        cap.release()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--size', default='1920x1080')
+    parser.add_argument('--fps', type=float, default=24)
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--seeks', type=int, default=50)
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        source_file = _make_source(directory, args.duration, args.size, args.fps)
+
+        for profile in config.PROXY_ENCODING_PROFILES:
+            proxy_file = os.path.join(directory, f'{profile}{config.PROXY_FORMAT}')
+            encode_timings = _encode(source_file, proxy_file, args.fps, profile, args.runs)
+            results[profile] = (encode_timings, os.path.getsize(proxy_file), _seek(proxy_file, args.seeks))
+
+    print(f'source: {args.size} @ {args.fps} fps, {args.duration} s, proxy {PROXY_WIDTH}x{PROXY_HEIGHT}, '
+          f'{args.runs} run(s), {args.seeks} seek(s)')
+    print(f'{"profile":<16}{"encode (s)":>12}{"size (KB)":>12}{"seek median (ms)":>18}{"seek max (ms)":>15}')
+    for profile, (encode_timings, size, seek_timings) in results.items():
+        if seek_timings:
+            seek = f'{statistics.median(seek_timings) * 1000:18.2f}{max(seek_timings) * 1000:15.2f}'
+        else:
+            seek = f'{"n/a":>18}{"n/a":>15}'
+        print(f'{profile:<16}{statistics.median(encode_timings):12.3f}{size / 1024:12.1f}{seek}')
+
+    if cv2 is None:
+        print('OpenCV is not installed, seek latency was not measured')
+
+
+if __name__ == '__main__':
+    main()
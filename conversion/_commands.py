@@ -3,14 +3,61 @@ Summary:
 
 This module provides utility functions for generating ffmpeg and ffprobe commands to handle various media processing
 tasks, such as video conversion, image sequence conversion, image conversion, and frame extraction.
+
+Proxies are encoded with one of `config.PROXY_ENCODING_PROFILES` (see `encoding_options`), trading file size for how
+fast a frame can be decoded after a seek.
 """
 
+# -------------------------------- Custom Modules ------------------------------------
+from data import config
+
+
+def encoding_options(profile: str, pix_fmt: str = "yuv420p", threads: int = 0) -> list:
+    """
+    Generates the ffmpeg encoder arguments of a proxy encoding profile.
+
+    - `h264`: libx264 with its default GOP, the smallest files but a seek decodes from the previous keyframe.
+    - `h264_short_gop`: libx264 with a keyframe every `config.PROXY_SHORT_GOP_SIZE` frames and no B-frames.
+    - `h264_intra`: libx264 with every frame a keyframe, any frame decodes on its own.
+    - `mjpeg`: Motion JPEG, intra only and cheap to decode, the largest files.
+
+    The libx264 profiles other than `h264` are tuned for fast decoding and use 4:2:0 chroma, which needs even
+    dimensions: the proxy scale filters round them with `force_divisible_by=2`.
+
+    :param profile: One of `config.PROXY_ENCODING_PROFILES`, unknown profiles fall back to `h264`.
+    :type profile: str
+    :param pix_fmt: The pixel format of the `h264` profile. Defaults to "yuv420p".
+    :type pix_fmt: str
+    :param threads: The threads of the encoder, chosen by ffmpeg if 0. Defaults to 0.
+    :type threads: int
+
+    :return: A list of ffmpeg command arguments.
+    :rtype: list[str]
+    """
+    thread_options = ["-threads", f"{threads}"] if threads else []
+
+    if profile == "h264_short_gop":
+        gop_size = f"{config.PROXY_SHORT_GOP_SIZE}"
+        return ["-vcodec", "libx264", "-g", gop_size, "-keyint_min", gop_size, "-sc_threshold", "0", "-bf", "0",
+                "-tune", "fastdecode", "-pix_fmt", "yuv420p", *thread_options]
+
+    if profile == "h264_intra":
+        return ["-vcodec", "libx264", "-g", "1", "-bf", "0", "-tune", "fastdecode", "-pix_fmt", "yuv420p",
+                *thread_options]
+
+    if profile == "mjpeg":
+        return ["-vcodec", "mjpeg", "-q:v", f"{config.PROXY_MJPEG_QUALITY}", "-pix_fmt", "yuvj420p", *thread_options]
+
+    return ["-vcodec", "libx264", "-pix_fmt", pix_fmt, *thread_options]
+
 
 def convert_video(source_file: str,
                   output_file: str,
                   resolutionX: int,
                   resolutionY: int,
-                  fps: float = 24) -> list:
+                  fps: float = 24,
+                  profile: str = "h264",
+                  threads: int = 0) -> list:
     """
     Generates a ffmpeg command to convert a video file to `.mov` format.
 
@@ -24,6 +71,10 @@ def convert_video(source_file: str,
     :type resolutionY: int
     :param fps: The target frames per second (FPS) of the output video. Defaults to 24.
     :type fps: float
+    :param profile: The encoding profile of the output video, see `encoding_options`. Defaults to "h264".
+    :type profile: str
+    :param threads: The threads of the encoder, chosen by ffmpeg if 0. Defaults to 0.
+    :type threads: int
 
     :return: A list of ffmpeg command arguments.
     :rtype: list[str]
@@ -31,14 +82,11 @@ def convert_video(source_file: str,
     return ["ffmpeg",
             "-i",
             source_file,
-            "-vcodec",
-            "libx264",
+            *encoding_options(profile, "yuv422p", threads),
             "-movflags",
             "faststart",
-            "-pix_fmt",
-            "yuv422p",
             "-vf",
-            f"scale={resolutionX}:{resolutionY}:force_original_aspect_ratio=decrease",
+            f"scale={resolutionX}:{resolutionY}:force_original_aspect_ratio=decrease:force_divisible_by=2",
             "-r",
             f"{fps}",
             output_file,
@@ -50,7 +98,9 @@ def convert_image_sequence(source_file: str,
                            resolutionX: int,
                            resolutionY: int,
                            start_frame: str,
-                           fps: float = 24) -> list:
+                           fps: float = 24,
+                           profile: str = "h264",
+                           threads: int = 0) -> list:
     """
     Generates a ffmpeg command to convert an image sequence to `.mov` format.
 
@@ -66,6 +116,10 @@ def convert_image_sequence(source_file: str,
     :type start_frame: int
     :param fps: The target frames per second (FPS) of the output video. Defaults to 24.
     :type fps: float
+    :param profile: The encoding profile of the output video, see `encoding_options`. Defaults to "h264".
+    :type profile: str
+    :param threads: The threads of the encoder, chosen by ffmpeg if 0. Defaults to 0.
+    :type threads: int
 
     :return: A list of ffmpeg command arguments.
     :rtype: list[str]
@@ -77,15 +131,135 @@ def convert_image_sequence(source_file: str,
             start_frame,
             "-i",
             _input,
-            "-vcodec",
-            "libx264",
-            "-pix_fmt",
-            "yuv420p",
+            *encoding_options(profile, "yuv420p", threads),
             "-vf",
-            f"scale={resolutionX}:{resolutionY}:force_original_aspect_ratio=decrease",
+            f"scale={resolutionX}:{resolutionY}:force_original_aspect_ratio=decrease:force_divisible_by=2",
+            "-r",
+            f"{fps}",
+            output_file,
+            "-hide_banner"]
+
+
+def convert_video_with_thumbnail(source_file: str,
+                                 output_file: str,
+                                 thumbnail_file: str,
+                                 resolutionX: int,
+                                 resolutionY: int,
+                                 fps: float = 24,
+                                 thumbnail_time: float = 0,
+                                 profile: str = "h264",
+                                 threads: int = 0) -> list:
+    """
+    Generates a ffmpeg command to convert a video file to `.mov` format and extract its thumbnail in a single pass.
+
+    The source is decoded and scaled once, then split between the proxy encoder and a `select` filter keeping the
+    first frame at or after `thumbnail_time` for the thumbnail.
+
+    :param source_file: The path to the source video file.
+    :type source_file: str
+    :param output_file: The path to the output `.mov` file.
+    :type output_file: str
+    :param thumbnail_file: The path to the output thumbnail image.
+    :type thumbnail_file: str
+    :param resolutionX: The target width of the output video and thumbnail.
+    :type resolutionX: int
+    :param resolutionY: The target height of the output video and thumbnail.
+    :type resolutionY: int
+    :param fps: The target frames per second (FPS) of the output video. Defaults to 24.
+    :type fps: float
+    :param thumbnail_time: The timestamp (in seconds) of the thumbnail frame. Defaults to 0.
+    :type thumbnail_time: float
+    :param profile: The encoding profile of the output video, see `encoding_options`. Defaults to "h264".
+    :type profile: str
+    :param threads: The threads of the encoder, chosen by ffmpeg if 0. Defaults to 0.
+    :type threads: int
+
+    :return: A list of ffmpeg command arguments.
+    :rtype: list[str]
+    """
+    return ["ffmpeg",
+            "-i",
+            source_file,
+            "-filter_complex",
+            f"[0:v]scale={resolutionX}:{resolutionY}:force_original_aspect_ratio=decrease:force_divisible_by=2,"
+            f"split=2[proxy][poster];"
+            f"[poster]select=gte(t\\,{thumbnail_time})[thumbnail]",
+            "-map",
+            "[proxy]",
+            *encoding_options(profile, "yuv422p", threads),
+            "-movflags",
+            "faststart",
+            "-r",
+            f"{fps}",
+            output_file,
+            "-map",
+            "[thumbnail]",
+            "-frames:v",
+            "1",
+            thumbnail_file,
+            "-hide_banner"]
+
+
+def convert_image_sequence_with_thumbnail(source_file: str,
+                                          output_file: str,
+                                          thumbnail_file: str,
+                                          resolutionX: int,
+                                          resolutionY: int,
+                                          start_frame: str,
+                                          fps: float = 24,
+                                          thumbnail_time: float = 0,
+                                          profile: str = "h264",
+                                          threads: int = 0) -> list:
+    """
+    Generates a ffmpeg command to convert an image sequence to `.mov` format and extract its thumbnail in a single
+    pass, see `convert_video_with_thumbnail`.
+
+    :param source_file: The path to the source image sequence (e.g., `file_0001-0100`).
+    :type source_file: str
+    :param output_file: The path to the output `.mov` file.
+    :type output_file: str
+    :param thumbnail_file: The path to the output thumbnail image.
+    :type thumbnail_file: str
+    :param resolutionX: The target width of the output video and thumbnail.
+    :type resolutionX: int
+    :param resolutionY: The target height of the output video and thumbnail.
+    :type resolutionY: int
+    :param start_frame: The starting frame number of the image sequence.
+    :type start_frame: int
+    :param fps: The target frames per second (FPS) of the output video. Defaults to 24.
+    :type fps: float
+    :param thumbnail_time: The timestamp (in seconds) of the thumbnail frame. Defaults to 0.
+    :type thumbnail_time: float
+    :param profile: The encoding profile of the output video, see `encoding_options`. Defaults to "h264".
+    :type profile: str
+    :param threads: The threads of the encoder, chosen by ffmpeg if 0. Defaults to 0.
+    :type threads: int
+
+    :return: A list of ffmpeg command arguments.
+    :rtype: list[str]
+    """
+    _input = source_file.rsplit(' ', 1)[0]
+
+    return ["ffmpeg",
+            "-start_number",
+            start_frame,
+            "-i",
+            _input,
+            "-filter_complex",
+            f"[0:v]scale={resolutionX}:{resolutionY}:force_original_aspect_ratio=decrease:force_divisible_by=2,"
+            f"split=2[proxy][poster];"
+            f"[poster]select=gte(t\\,{thumbnail_time})[thumbnail]",
+            "-map",
+            "[proxy]",
+            *encoding_options(profile, "yuv420p", threads),
             "-r",
             f"{fps}",
             output_file,
+            "-map",
+            "[thumbnail]",
+            "-frames:v",
+            "1",
+            thumbnail_file,
             "-hide_banner"]
 
 
@@ -136,6 +310,70 @@ def extract_video_thumbnail_frame(source_file: str) -> list:
             "-hide_banner"]
 
 
+def extract_keyframes(proxy_file: str) -> list:
+    """
+    Generates a ffprobe command to list the timestamps of the keyframes of a proxy, one per line.
+
+    :param proxy_file: The path to the proxy `.mov` file.
+    :type proxy_file: str
+
+    :return: A list of ffprobe command arguments.
+    :rtype: list[str]
+    """
+    return ["ffprobe",
+            "-v",
+            "error",
+            "-select_streams",
+            "v:0",
+            "-skip_frame",
+            "nokey",
+            "-show_entries",
+            "frame=best_effort_timestamp_time",
+            "-of",
+            "csv=p=0",
+            proxy_file]
+
+
+def extract_filmstrip(proxy_file: str,
+                      output_file: str,
+                      total_frames: int,
+                      tile_width: int,
+                      frame_count: int) -> list:
+    """
+    Generates a ffmpeg command to tile evenly spaced frames of a proxy into a single horizontal filmstrip image.
+
+    :param proxy_file: The path to the proxy `.mov` file.
+    :type proxy_file: str
+    :param output_file: The path to the output filmstrip image.
+    :type output_file: str
+    :param total_frames: The number of frames of the proxy.
+    :type total_frames: int
+    :param tile_width: The width of each frame in the filmstrip, the height keeps the aspect ratio.
+    :type tile_width: int
+    :param frame_count: The number of frames in the filmstrip.
+    :type frame_count: int
+
+    :return: A list of ffmpeg command arguments.
+    :rtype: list[str]
+    """
+    step = max(1, total_frames // frame_count)
+
+    return ["ffmpeg",
+            "-y",
+            "-i",
+            proxy_file,
+            "-vf",
+            f"select=not(mod(n\\,{step})),scale={tile_width}:-2,tile={frame_count}x1",
+            "-frames:v",
+            "1",
+            "-vsync",
+            "vfr",
+            "-q:v",
+            "3",
+            output_file,
+            "-hide_banner"]
+
+
 def extract_image_from_video(source_file: str,
                              output_file: str,
                              resolutionX: int,
@@ -171,3 +409,47 @@ def extract_image_from_video(source_file: str,
             f"scale={resolutionX}:{resolutionY}:force_original_aspect_ratio=decrease",
             output_file,
             "-hide_banner"]
+
+
+def with_progress(command: list) -> list:
+    """
+    Makes a ffmpeg command write its progress to stdout as `key=value` lines, without the stats line on stderr.
+
+    :param command: A list of ffmpeg command arguments.
+    :type command: list[str]
+
+    :return: A list of ffmpeg command arguments.
+    :rtype: list[str]
+    """
+    return [command[0],
+            "-progress",
+            "pipe:1",
+            "-nostats",
+            *command[1:]]
+
+
+def with_threads(command: list, threads: int) -> list:
+    """
+    Limits the decoder of the first input and the filters (`-vf` and `-filter_complex` graphs) of a ffmpeg command
+    to a number of threads, ffmpeg otherwise runs about as many threads as there are cores for each. The encoder
+    threads are set by `encoding_options`.
+
+    :param command: A list of ffmpeg command arguments.
+    :type command: list[str]
+    :param threads: The number of threads, the command is returned unchanged if 0.
+    :type threads: int
+
+    :return: A list of ffmpeg command arguments.
+    :rtype: list[str]
+    """
+    if not threads:
+        return command
+
+    return [command[0],
+            "-filter_threads",
+            f"{threads}",
+            "-filter_complex_threads",
+            f"{threads}",
+            "-threads",
+            f"{threads}",
+            *command[1:]]
@@ -0,0 +1,213 @@
+"""
+Summary:
+
+This module sizes the number of proxy conversions running at once, and the ffmpeg threads of each, to the machine.
+
+An ffmpeg process runs about as many threads as there are cores, so as many conversions as threads oversubscribe
+the cores, while a single conversion leaves them idle through its single threaded parts (demuxing, scaling,
+muxing). `plan` gives the cores left idle by the other processes (from the load average, where available)
+`config.CONVERSION_CPUS_PER_JOB` at a time to the conversions, and splits the cores between their ffmpeg threads.
+
+ConcurrencyTuner:
+    Starts from `plan`, then adjusts the number of conversions from the throughput observed while every conversion
+    slot is busy (hill climbing): every `config.CONVERSION_TUNE_INTERVAL_S` seconds it compares the average frames
+    encoded per second with the previous interval. It keeps adding conversions while the throughput improves by more
+    than `config.CONVERSION_TUNE_TOLERANCE`, and keeps removing them while it drops by less, so fewer conversions
+    win a tie; otherwise it steps back and holds for `config.CONVERSION_TUNE_HOLD_INTERVALS` intervals before probing
+    the other direction. It steps down whenever the load average exceeds `config.CONVERSION_OVERLOAD_FACTOR` times
+    the cores.
+"""
+
+# -------------------------------- built-in Modules ----------------------------------
+import os
+import time
+from typing import List, Optional, Tuple
+
+# -------------------------------- Custom Modules ------------------------------------
+from data import config
+
+
+def cpu_count() -> int:
+    """
+    Get the number of cores this process may run on.
+
+    :return: Number of cores.
+    :rtype: int
+    """
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except AttributeError:
+        return max(1, os.cpu_count() or 1)
+
+
+def load_average() -> Optional[float]:
+    """
+    Get the load average of the last minute.
+
+    :return: Average number of runnable processes, None if the platform does not report it (Windows).
+    :rtype: Optional[float]
+    """
+    try:
+        return os.getloadavg()[0]
+    except (AttributeError, OSError):
+        return None
+
+
+def threads_per_job(jobs: int, cpus: int = 0) -> int:
+    """
+    Get the ffmpeg threads of each conversion, sharing the cores between the conversions running at once. Rounded
+    up, a few threads too many cost less than idle cores.
+
+    :param jobs: Number of conversions running at once.
+    :type jobs: int
+    :param cpus: Number of cores, `cpu_count()` if 0.
+    :type cpus: int
+    :return: Number of threads.
+    :rtype: int
+    """
+    return max(1, -(-(cpus or cpu_count()) // max(1, jobs)))
+
+
+def plan(max_jobs: int = 0) -> Tuple[int, int]:
+    """
+    Size the conversions running at once to the idle cores of the machine.
+
+    :param max_jobs: Upper bound of the conversions running at once, the number of cores if 0.
+    :type max_jobs: int
+    :return: Number of conversions running at once and ffmpeg threads of each.
+    :rtype: Tuple[int, int]
+    """
+    cpus = cpu_count()
+    idle_cpus = max(1, int(cpus - (load_average() or 0.0)))
+    jobs = min(max(1, idle_cpus // config.CONVERSION_CPUS_PER_JOB), max_jobs or cpus)
+
+    return jobs, threads_per_job(jobs, cpus)
+
+
+class ConcurrencyTuner:
+    """
+    Tunes the number of conversions running at once from their observed throughput, see the module summary.
+    """
+
+    def __init__(self, max_jobs: int = 0) -> None:
+        """
+        Initialize the tuner with `plan`.
+
+        :param max_jobs: Upper bound of the conversions running at once, the number of cores if 0.
+        :type max_jobs: int
+        """
+        self.__cpus = cpu_count()
+        self.__max_jobs = max_jobs or self.__cpus
+        self.__jobs = plan(self.__max_jobs)[0]
+        self.__direction = 1
+        self.__previous = None
+        self.__hold = 0
+        self.__samples: List[float] = []
+        self.__interval_start = None
+
+    @property
+    def jobs(self) -> int:
+        """The number of conversions to run at once."""
+        return self.__jobs
+
+    @property
+    def max_jobs(self) -> int:
+        """The upper bound of the conversions running at once."""
+        return self.__max_jobs
+
+    @property
+    def threads(self) -> int:
+        """The ffmpeg threads of each conversion."""
+        return threads_per_job(self.__jobs, self.__cpus)
+
+    def sample(self, throughput: float, saturated: bool, now: Optional[float] = None) -> bool:
+        """
+        Record the throughput of the running conversions, adjusting the number of conversions once per interval.
+
+        :param throughput: Frames encoded per second by all running conversions.
+        :type throughput: float
+        :param saturated: Whether every conversion slot is busy and more conversions are waiting. The throughput
+                          of an idle slot says nothing about the number of conversions, so the interval restarts.
+        :type saturated: bool
+        :param now: Monotonic time of the sample, `time.monotonic()` if None.
+        :type now: float, optional
+        :return: True if the number of conversions changed.
+        :rtype: bool
+        """
+        now = time.monotonic() if now is None else now
+
+        if not saturated:
+            self.__samples.clear()
+            self.__interval_start = None
+            return False
+
+        if self.__interval_start is None:
+            self.__interval_start = now
+        self.__samples.append(throughput)
+
+        if now - self.__interval_start < config.CONVERSION_TUNE_INTERVAL_S:
+            return False
+
+        throughput = sum(self.__samples) / len(self.__samples)
+        self.__samples.clear()
+        self.__interval_start = now
+
+        return self._adjust(throughput)
+
+    def _adjust(self, throughput: float) -> bool:
+        """
+        Take a hill climbing step from the average throughput of the last interval.
+
+        :param throughput: Average frames encoded per second during the interval, at the current number of
+                           conversions.
+        :type throughput: float
+        :return: True if the number of conversions changed.
+        :rtype: bool
+        """
+        load = load_average()
+        if load is not None and load > self.__cpus * config.CONVERSION_OVERLOAD_FACTOR and self.__jobs > 1:
+            self.__direction = -1
+            self.__hold = config.CONVERSION_TUNE_HOLD_INTERVALS
+            return self._set_jobs(self.__jobs - 1)
+
+        if self.__hold:
+            self.__hold -= 1
+            self.__previous = throughput
+            return False if self.__hold else self._probe()
+
+        # a step up must improve the throughput, a step down must not lose it: fewer conversions are kept on a tie
+        if self.__previous is not None and \
+                throughput < self.__previous * (1 + self.__direction * config.CONVERSION_TUNE_TOLERANCE):
+            # the last step did not pay off, step back and probe the other direction later
+            self.__hold = config.CONVERSION_TUNE_HOLD_INTERVALS
+            self.__direction = -self.__direction
+            return self._set_jobs(self.__jobs + self.__direction)
+
+        self.__previous = throughput
+        return self._probe()
+
+    def _probe(self) -> bool:
+        """
+        Step the number of conversions in the current direction, turning back at 1 and `max_jobs`.
+
+        :return: True if the number of conversions changed.
+        :rtype: bool
+        """
+        if not 1 <= self.__jobs + self.__direction <= self.__max_jobs:
+            self.__direction = -self.__direction
+
+        return self._set_jobs(self.__jobs + self.__direction)
+
+    def _set_jobs(self, jobs: int) -> bool:
+        """
+        Set the number of conversions, within 1 and `max_jobs`.
+
+        :param jobs: Number of conversions running at once.
+        :type jobs: int
+        :return: True if the number of conversions changed.
+        :rtype: bool
+        """
+        jobs = min(max(1, jobs), self.__max_jobs)
+        changed = jobs != self.__jobs
+        self.__jobs = jobs
+        return changed
@@ -0,0 +1,735 @@
+"""
+Summary:
+
+This module converts media files (videos, images, and image sequences) to .mov proxies with ffmpeg, without any
+dependency on Qt, so the same conversion runs on the panel's thread pool (`convert_mov.ConvertMov`) and in headless
+batch ingests (`_ingest`). It also generates thumbnails, and optionally a filmstrip image used by the hover preview,
+for the converted media.
+
+With `config.SINGLE_PASS_CONVERSION`, videos and image sequences are converted and their thumbnail extracted by a
+single ffmpeg invocation decoding the source once; the separate thumbnail pass is kept as a fallback. The separate
+pass extracts the thumbnail from the written proxy when `thumbnail_from_proxy` is set, and only reads the source
+again if that fails.
+
+Renders stream ffmpeg's progress (see `_progress`) and report it to the `on_progress` callback of `Converter`.
+
+The proxy is rendered to a partial file next to it (`config.PARTIAL_PROXY_SUFFIX`) and only renamed into place once
+the conversion completed, so an existing proxy is always a complete one, even after the process was killed.
+
+A conversion can be cancelled from another thread with `Converter.cancel`, which kills its running ffmpeg process and
+removes the partial outputs.
+
+Every ffmpeg process runs under a `_Watchdog`, killing it once it stops making progress for
+`config.FFMPEG_STALL_TIMEOUT_S`, or sooner once it exceeds a timeout derived from the number of frames rendered (the
+frame count of sources without one is derived from their duration). Failures are classified from the ffmpeg log:
+transient ones (hangs, I/O errors of network storage) are retried up to `config.FFMPEG_RETRIES` times with an
+exponential backoff, with a doubled timeout after a timeout, a bad source is not. The class of the last failure of a conversion that did not complete is
+available as `Converter.failure`.
+
+Videos and image sequences are encoded with the proxy encoding profile given to `Converter` (see
+`_commands.encoding_options`), recorded as `Encoding` in their metadata. The ffmpeg processes run `threads` threads
+each when given (see `_concurrency`), so conversions running side by side do not oversubscribe the cores.
+
+Images and image sequences are measured by `_image_header`, reading the first bytes of the (first) image, and only
+fall back to ffprobe for headers it cannot read.
+"""
+
+# -------------------------------- built-in Modules ----------------------------------
+import os
+import re
+import subprocess
+import json
+import datetime
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+# -------------------------------- Custom Modules ------------------------------------
+from data import config
+from . import _commands
+from . import _image_header
+from . import _metadata_cache
+from . import _progress
+import _utilities
+
+
+FAILURE_BAD_SOURCE = 'bad source'
+FAILURE_TRANSIENT = 'transient I/O'
+FAILURE_UNKNOWN = 'error'
+
+_BAD_SOURCE_ERRORS = ('Invalid data found when processing input', 'moov atom not found', 'No such file or directory',
+                      'Error while decoding', 'Could not find codec parameters', 'could not find codec parameters',
+                      'Invalid NAL unit', 'Invalid frame dimensions', 'does not contain any stream',
+                      'Output file #0 does not contain any stream')
+_TRANSIENT_ERRORS = ('Input/output error', 'Resource temporarily unavailable', 'Stale file handle',
+                     'Connection timed out', 'Connection reset', 'Interrupted system call', 'Device or resource busy',
+                     'No space left on device')
+
+
+def _classify_failure(log: list) -> str:
+    """
+    Classify the failure of a ffmpeg process from its log.
+
+    :param log: The last lines of output of the process.
+    :type log: list[str]
+    :return: One of `FAILURE_TRANSIENT`, `FAILURE_BAD_SOURCE` or `FAILURE_UNKNOWN`.
+    :rtype: str
+    """
+    text = '\n'.join(log)
+
+    if any(error in text for error in _TRANSIENT_ERRORS):
+        return FAILURE_TRANSIENT
+    if any(error in text for error in _BAD_SOURCE_ERRORS):
+        return FAILURE_BAD_SOURCE
+    return FAILURE_UNKNOWN
+
+
+class _Watchdog:
+    """
+    Kills a process not reporting new frames for `config.FFMPEG_STALL_TIMEOUT_S`, or running longer than its timeout
+    and not reporting new frames for `config.FFMPEG_OVERTIME_STALL_S`. A process still making progress is never
+    killed, the timeout only shortens the patience once it is exceeded.
+
+    Attributes:
+        reason (str): Why the process was killed, empty if it was not.
+        timed_out (bool): Whether the process was killed after exceeding its timeout.
+    """
+
+    def __init__(self, process: subprocess.Popen, timeout: float) -> None:
+        """
+        Start watching a process.
+
+        :param process: The process.
+        :type process: subprocess.Popen
+        :param timeout: Seconds the process may run.
+        :type timeout: float
+        """
+        self.reason = ''
+        self.timed_out = False
+        self.__process = process
+        self.__timeout = timeout
+        self.__started_at = self.__progressed_at = time.monotonic()
+        self.__frame = -1
+        self.__stopped = threading.Event()
+        self.__thread = threading.Thread(target=self._watch, daemon=True)
+        self.__thread.start()
+
+    def feed(self, frame: int) -> None:
+        """
+        Record the progress of the process.
+
+        :param frame: Number of frames written so far.
+        :type frame: int
+        """
+        if frame > self.__frame:
+            self.__frame = frame
+            self.__progressed_at = time.monotonic()
+
+    def stop(self) -> None:
+        """Stop watching, once the process exited."""
+        self.__stopped.set()
+        self.__thread.join()
+
+    def _watch(self) -> None:
+        """
+        Check the process every `config.FFMPEG_WATCHDOG_INTERVAL_S` until it exits or is killed.
+        """
+        while not self.__stopped.wait(config.FFMPEG_WATCHDOG_INTERVAL_S):
+            now = time.monotonic()
+
+            if now - self.__started_at > self.__timeout and \
+                    now - self.__progressed_at > config.FFMPEG_OVERTIME_STALL_S:
+                self.reason = f'timed out after {self.__timeout:.0f} s'
+                self.timed_out = True
+            elif now - self.__progressed_at > config.FFMPEG_STALL_TIMEOUT_S:
+                self.reason = f'no progress for {config.FFMPEG_STALL_TIMEOUT_S} s'
+            else:
+                continue
+
+            if self.__process.poll() is None:
+                self.__process.kill()
+            return
+
+
+def _get_file_metadata(source_file: str) -> tuple:
+    """
+    Get metadata for a given image or video file.
+
+    The ffprobe output is taken from `_metadata_cache` when the file has not changed since it was last probed.
+
+    :param source_file: Path to the source file.
+    :type source_file: str
+    :return: Tuple containing thumbnail frame time, FPS, total frames, width, and height.
+    :rtype: tuple[float, float, int, int, int]
+    """
+    out = _metadata_cache.cache.probe(source_file)
+    if not out:
+        return 0, 24, 1, None, None
+
+    stream = out['streams'][0]
+    fps = _get_fps(stream['r_frame_rate'])
+    width = stream.get('width')
+    height = stream.get('height')
+    duration = _get_duration(stream.get('duration')) or _get_duration(out.get('format', {}).get('duration'))
+    # containers without a frame count in the stream header (e.g. mkv, webm) are counted from their duration
+    frames = stream.get('nb_frames') or (max(1, round(duration * fps)) if duration else 1)
+    thumbnail_frame_time = duration // 2 if duration else 0
+
+    return thumbnail_frame_time, fps, frames, width, height
+
+
+def _get_duration(duration) -> float:
+    """
+    Parse a duration reported by ffprobe.
+
+    :param duration: Duration in seconds, e.g. "12.480000".
+    :type duration: str
+    :return: Duration in seconds, 0 if unknown.
+    :rtype: float
+    """
+    try:
+        return max(0.0, float(duration))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _get_fps(frame_rate) -> float:
+    """
+    Calculate FPS from a frame rate string.
+
+    :param frame_rate: Frame rate in the format "numerator/denominator".
+    :type frame_rate: str
+    :return: Calculated FPS.
+    :rtype: float
+    """
+    raw_fps = tuple(map(int, frame_rate.split('/')))
+    return raw_fps[0] / raw_fps[1]
+
+
+def _frame_count(metadata: dict) -> int:
+    """
+    Get the number of frames of a source from its metadata.
+
+    :param metadata: Media metadata.
+    :type metadata: dict
+    :return: Number of frames, 0 if unknown.
+    :rtype: int
+    """
+    try:
+        return max(0, int(metadata['Frame(s)']))
+    except (KeyError, TypeError, ValueError):
+        return 0
+
+
+class Converter:
+    """
+    Converts a media file to a proxy, writing its thumbnail and, optionally, its filmstrip.
+
+    The conversion runs on the calling thread (`convert`) and can be cancelled from any other thread (`cancel`).
+    """
+
+    def __init__(self, source_file: str, output_file: str, is_image_seq: bool, thumb_resolutionX: int,
+                 thumb_resolutionY: int, filmstrip: bool = False, thumbnail_from_proxy: bool = False,
+                 encoding_profile: str = config.PROXY_ENCODING_PROFILES[0], threads: int = 0,
+                 on_progress: Optional[Callable[[str, int, int, float, float], None]] = None):
+        """
+        Initialize the conversion.
+
+        :param source_file: Path to the source file.
+        :type source_file: str
+        :param output_file: Path to the output file.
+        :type output_file: str
+        :param is_image_seq: Whether the source is an image sequence.
+        :type is_image_seq: bool
+        :param thumb_resolutionX: Thumbnail width.
+        :type thumb_resolutionX: int
+        :param thumb_resolutionY: Thumbnail height.
+        :type thumb_resolutionY: int
+        :param filmstrip: Whether to generate a filmstrip image next to the proxy.
+        :type filmstrip: bool
+        :param thumbnail_from_proxy: Whether to extract the thumbnail from the proxy rather than the source.
+        :type thumbnail_from_proxy: bool
+        :param encoding_profile: Encoding profile of the proxy, one of `config.PROXY_ENCODING_PROFILES`.
+        :type encoding_profile: str
+        :param threads: ffmpeg threads of the conversion, chosen by ffmpeg if 0.
+        :type threads: int
+        :param on_progress: Called from the converting thread with the proxy path, frames written, total frames,
+                            encoding fps and speed while the proxy is rendered.
+        :type on_progress: Callable[[str, int, int, float, float], None], optional
+        """
+
+        self.__source_file = source_file
+        self.__output_file = output_file
+        self.__partial_file = config.PARTIAL_PROXY_SUFFIX.join(os.path.splitext(output_file))
+        self.__is_image_seq = is_image_seq
+        self.__thumb_resolutionX = thumb_resolutionX
+        self.__thumb_resolutionY = thumb_resolutionY
+        self.__filmstrip = filmstrip
+        self.__thumbnail_from_proxy = thumbnail_from_proxy
+        self.__encoding_profile = encoding_profile
+        self.__threads = threads
+        self.__on_progress = on_progress
+        self.__lock = threading.Lock()
+        self.__process = None
+        self.__is_cancelled = False
+        self.__is_completed = False
+        self.__cancel_event = threading.Event()
+        self.__failure = ''
+        self.__result = None
+
+    @property
+    def source_file(self) -> str:
+        """The path of the source file."""
+        return self.__source_file
+
+    @property
+    def output_file(self) -> str:
+        """The path of the proxy file."""
+        return self.__output_file
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Whether the conversion was cancelled."""
+        return self.__is_cancelled
+
+    @property
+    def failure(self) -> str:
+        """Why the conversion did not complete, prefixed with the failure class, empty if it completed."""
+        if self.__is_completed:
+            return ''
+        return self.__failure or f'{FAILURE_UNKNOWN}: could not convert {self.__source_file}'
+
+    def set_threads(self, threads: int) -> None:
+        """
+        Set the ffmpeg threads of the conversion, applied to the commands started afterwards.
+
+        :param threads: Number of threads, chosen by ffmpeg if 0.
+        :type threads: int
+        """
+        self.__threads = max(0, int(threads))
+
+    def cancel(self) -> None:
+        """
+        Cancel the conversion, killing its running ffmpeg process. Does nothing once the conversion completed.
+        """
+        with self.__lock:
+            if self.__is_completed:
+                return
+
+            self.__is_cancelled = True
+            self.__cancel_event.set()
+            if self.__process is not None and self.__process.poll() is None:
+                self.__process.kill()
+
+    def convert(self) -> Optional[Tuple[str, dict]]:
+        """
+        Execute the conversion process.
+
+        :return: The thumbnail image and the media metadata, or None if the conversion failed (see `failure`) or
+                 was cancelled, in which case its partial outputs are removed.
+        :rtype: Optional[Tuple[str, dict]]
+        """
+        try:
+            if self.__is_cancelled:
+                return None
+
+            _utilities.make_directory(self.__output_file)
+            if not os.path.isfile(self.__output_file):
+                # leftovers of an interrupted conversion
+                self._remove_outputs()
+
+            if self.__is_image_seq:
+                self._process_image_sequence()
+
+            elif self.__source_file.endswith(config.SUPPORTED_IMAGE_FORMATS):
+                self._process_image()
+
+            elif self.__source_file.endswith(config.SUPPORTED_VIDEO_FORMATS):
+                self._process_video()
+        finally:
+            if self.__is_cancelled:
+                self._remove_outputs()
+            elif not self.__is_completed:
+                _utilities.delete_files([self.__partial_file] if os.path.isfile(self.__partial_file) else [])
+
+        return self.__result if self.__is_completed else None
+
+    def _remove_outputs(self) -> None:
+        """
+        Remove the proxy, its partial file and the files written next to it by a cancelled conversion.
+        """
+        thumbnail_image = f'{os.path.splitext(self.__output_file)[0]}{config.THUMBNAIL_FORMAT}'
+        files = [self.__output_file, self.__partial_file, thumbnail_image,
+                 *_utilities.get_filmstrip_from_proxy(self.__output_file)]
+        _utilities.delete_files([file for file in files if file and os.path.isfile(file)])
+
+    def _rendered_proxy(self) -> str:
+        """
+        Get the proxy to read back: the proxy file if it existed before the conversion, its partial file otherwise.
+
+        :return: Path to the rendered proxy.
+        :rtype: str
+        """
+        return self.__output_file if os.path.isfile(self.__output_file) else self.__partial_file
+
+    def _start_process(self, command: list) -> Optional[subprocess.Popen]:
+        """
+        Start a command, unless the conversion was cancelled.
+
+        :param command: Command to execute.
+        :type command: list
+        :return: The process, or None if the conversion was cancelled.
+        :rtype: Optional[subprocess.Popen]
+        """
+        with self.__lock:
+            if self.__is_cancelled:
+                return None
+
+            self.__process = subprocess.Popen(
+                command, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+            return self.__process
+
+    def _complete(self, thumbnail_image: str, metadata: dict) -> None:
+        """
+        Record the completion of the conversion and move the rendered proxy into place, unless it was cancelled.
+
+        :param thumbnail_image: Path to the thumbnail image.
+        :type thumbnail_image: str
+        :param metadata: Media metadata.
+        :type metadata: dict
+        """
+        with self.__lock:
+            if self.__is_cancelled:
+                return
+            if os.path.isfile(self.__partial_file):
+                os.replace(self.__partial_file, self.__output_file)
+            self.__is_completed = True
+            self.__result = (thumbnail_image, metadata)
+
+    def _process_video(self):
+        """
+        Process a video file for conversion.
+        """
+        thumbnail_frame_time, fps, total_frames, width, height = _get_file_metadata(self.__source_file)
+        metadata = {'FPS': float("{:.2f}".format(float(fps))),
+                    'Frame(s)': total_frames,
+                    'width': width,
+                    'height': height,
+                    'Format': Path(self.__source_file).suffix,
+                    'Encoding': self.__encoding_profile}
+
+        self._convert_video(thumbnail_frame_time, fps, metadata)
+
+    def _process_image(self):
+        """
+        Process an image file for conversion.
+        """
+        header = _image_header.read_header(self.__source_file)
+        if header:
+            fps, total_frames, width, height = config.IMAGE_SEQUENCE_FPS, 1, header['width'], header['height']
+        else:
+            _, fps, total_frames, width, height = _get_file_metadata(self.__source_file)
+
+        metadata = {'FPS': float("{:.2f}".format(float(fps))),
+                    'Frame(s)': total_frames,
+                    'width': width,
+                    'height': height,
+                    'Format': Path(self.__source_file).suffix}
+        self._convert_image(self.__source_file, metadata)
+
+    def _process_image_sequence(self):
+        """
+        Process an image sequence for conversion.
+        """
+        source_file, frame_range = self.__source_file.rsplit(' ', 1)
+        start_frame, end_frame = frame_range.split('-')
+        total_frames = int(end_frame) - int(start_frame) + 1
+
+        first_frame = re.sub(r'%0?(\d*)d', lambda match: start_frame.zfill(int(match.group(1) or 0)), source_file)
+        header = _image_header.read_header(first_frame)
+        if header:
+            # the image2 demuxer reads sequences at its default rate, as reported by ffprobe
+            fps, width, height = config.IMAGE_SEQUENCE_FPS, header['width'], header['height']
+            thumbnail_frame_time = (total_frames / fps) // 2
+        else:
+            thumbnail_frame_time, fps, _, width, height = _get_file_metadata(source_file)
+
+        metadata = {'FPS': float("{:.2f}".format(float(fps))),
+                    'Frame(s)': str(total_frames),
+                    'width': width,
+                    'height': height,
+                    'Format': Path(self.__source_file.rsplit(' ', 1)[0]).suffix,
+                    'Encoding': self.__encoding_profile}
+
+        self._convert_image_sequence(source_file, thumbnail_frame_time, fps, start_frame, metadata)
+
+    def _convert_video(self, thumbnail_frame_time, fps, metadata) -> None:
+        """
+        Convert a video file to .mov format.
+
+        :param thumbnail_frame_time: Time to extract the thumbnail frame.
+        :type thumbnail_frame_time: float
+        :param fps: Frames per second of the video.
+        :type fps: float
+        :param metadata: Video metadata.
+        :type metadata: dict
+        """
+        thumbnail_image = f'{os.path.splitext(self.__output_file)[0]}{config.THUMBNAIL_FORMAT}'
+
+        if config.SINGLE_PASS_CONVERSION and not os.path.isfile(self.__output_file):
+            command = _commands.convert_video_with_thumbnail(
+                self.__source_file, self.__partial_file, thumbnail_image, self.__thumb_resolutionX,
+                self.__thumb_resolutionY, fps, thumbnail_frame_time, self.__encoding_profile, self.__threads)
+
+            if self._execute_single_pass_command(command, thumbnail_image, _frame_count(metadata)):
+                self._generate_filmstrip(metadata['Frame(s)'], fps)
+                self._complete(thumbnail_image, metadata)
+                return
+
+        if not os.path.isfile(self.__output_file):
+            command = _commands.convert_video(
+                self.__source_file, self.__partial_file, self.__thumb_resolutionX, self.__thumb_resolutionY, fps,
+                self.__encoding_profile, self.__threads)
+
+            if not self._execute_render_command(command, _frame_count(metadata), (self.__partial_file,)):
+                return
+
+        # the thumbnail of an existing proxy is kept, leftovers of interrupted conversions are removed by `convert`
+        if os.path.isfile(thumbnail_image) or \
+                self._generate_poster(thumbnail_frame_time, thumbnail_image, self.__source_file):
+            self._generate_filmstrip(metadata['Frame(s)'], fps)
+            self._complete(thumbnail_image, metadata)
+
+    def _convert_image_sequence(self,
+                                source_file: str,
+                                thumbnail_frame_time: float,
+                                fps: float,
+                                start_frame: str,
+                                metadata: dict) -> None:
+        """
+        Convert an image sequence to .mov format.
+
+        :param source_file: Path to the source image sequence.
+        :type source_file: str
+        :param thumbnail_frame_time: Time to extract the thumbnail frame.
+        :type thumbnail_frame_time: float
+        :param fps: Frames per second of the sequence.
+        :type fps: float
+        :param start_frame: Starting frame of the sequence.
+        :type start_frame: str
+        :param metadata: Sequence metadata.
+        :type metadata: dict
+        """
+
+        thumbnail_image = f'{os.path.splitext(self.__output_file)[0]}{config.THUMBNAIL_FORMAT}'
+        thumbnail_image_temp = f'_$$$${datetime.datetime.now().strftime("%M_%S_%f")}_'.join(
+            re.split(r"%\d{2}d", thumbnail_image))
+
+        if config.SINGLE_PASS_CONVERSION and not os.path.isfile(self.__output_file):
+            command = _commands.convert_image_sequence_with_thumbnail(
+                source_file, self.__partial_file, thumbnail_image_temp, self.__thumb_resolutionX,
+                self.__thumb_resolutionY, start_frame, fps, thumbnail_frame_time, self.__encoding_profile,
+                self.__threads)
+
+            if self._execute_single_pass_command(command, thumbnail_image_temp, _frame_count(metadata)):
+                os.rename(thumbnail_image_temp, thumbnail_image)
+                self._generate_filmstrip(metadata['Frame(s)'], fps)
+                self._complete(thumbnail_image, metadata)
+                return
+
+        if not os.path.isfile(self.__output_file):
+            command = _commands.convert_image_sequence(
+                source_file, self.__partial_file, self.__thumb_resolutionX, self.__thumb_resolutionY, start_frame,
+                fps, self.__encoding_profile, self.__threads)
+
+            if not self._execute_render_command(command, _frame_count(metadata), (self.__partial_file,)):
+                return
+
+        if not os.path.isfile(thumbnail_image):
+            if not self._generate_poster(thumbnail_frame_time, thumbnail_image_temp, source_file):
+                return
+            os.rename(thumbnail_image_temp, thumbnail_image)
+
+        self._generate_filmstrip(metadata['Frame(s)'], fps)
+        self._complete(thumbnail_image, metadata)
+
+    def _convert_image(self, source_file: str, metadata: dict) -> None:
+        """
+        Convert an image file to config.THUMBNAIL_FORMAT(default is "png") format.
+
+        :param source_file: Path to the source image.
+        :type source_file: str
+        :param metadata: Image metadata.
+        :type metadata: dict
+        """
+        thumbnail_image = f'{os.path.splitext(self.__output_file)[0]}{config.THUMBNAIL_FORMAT}'
+        if not os.path.isfile(self.__output_file):
+            command = _commands.convert_image(
+                source_file, self.__partial_file, self.__thumb_resolutionX, self.__thumb_resolutionY)
+
+            if not self._execute_render_command(command, 1, (self.__partial_file,)):
+                return
+
+        self._complete(thumbnail_image, metadata)
+
+    def _execute_render_command(self, command: list, total_frames: int = 0, outputs: tuple = ()) -> bool:
+        """
+        Execute a ffmpeg render command using subprocess, streaming its progress under a `_Watchdog`.
+
+        The command may run for `config.FFMPEG_TIMEOUT_S` plus `config.FFMPEG_TIMEOUT_PER_FRAME_S` per frame while
+        it is not making progress, see `_Watchdog`. A transient failure is retried after removing the partial
+        outputs, waiting `config.FFMPEG_RETRY_BACKOFF_S` seconds, doubled on each retry; the timeout is doubled too
+        after a timeout.
+
+        :param command: Command to execute.
+        :type command: list
+        :param total_frames: Number of frames rendered, progress is reported only if known.
+        :type total_frames: int
+        :param outputs: Files written by the command, removed if it fails.
+        :type outputs: tuple
+        :return: True if successful, False otherwise or if the conversion was cancelled.
+        :rtype: bool
+        """
+        timeout = config.FFMPEG_TIMEOUT_S + total_frames * config.FFMPEG_TIMEOUT_PER_FRAME_S
+
+        for attempt in range(config.FFMPEG_RETRIES + 1):
+            if attempt and self.__cancel_event.wait(config.FFMPEG_RETRY_BACKOFF_S * 2 ** (attempt - 1)):
+                return False
+
+            process = self._start_process(
+                _commands.with_progress(_commands.with_threads(command, self.__threads)))
+            if process is None:
+                return False
+
+            watchdog = _Watchdog(process, timeout)
+            log = _progress.stream_progress(
+                process, lambda progress: (watchdog.feed(progress.frame), self._report_progress(progress, total_frames)))
+            watchdog.stop()
+            if watchdog.timed_out:
+                timeout *= 2
+
+            if self.__is_cancelled:
+                return False
+            if process.returncode == 0 and not watchdog.reason:
+                return True
+
+            _utilities.delete_files([file for file in outputs if os.path.isfile(file)])
+            failure = FAILURE_TRANSIENT if watchdog.reason else _classify_failure(log)
+            details = watchdog.reason or (log[-1] if log else f'exit code {process.returncode}')
+            self.__failure = f'{failure}: {self.__source_file}: {details}'
+
+            if failure != FAILURE_TRANSIENT:
+                break
+
+        return False
+
+    def _report_progress(self, progress: _progress.Progress, total_frames: int) -> None:
+        """
+        Report the progress of a render.
+
+        :param progress: The progress report of ffmpeg.
+        :type progress: _progress.Progress
+        :param total_frames: Number of frames rendered, nothing is reported if unknown.
+        :type total_frames: int
+        """
+        if self.__on_progress is not None and total_frames and not self.__is_cancelled:
+            self.__on_progress(
+                self.__output_file, min(progress.frame, total_frames), total_frames, progress.fps, progress.speed)
+
+    def _execute_single_pass_command(self, command: list, thumbnail_image: str, total_frames: int = 0) -> bool:
+        """
+        Execute a command writing the proxy and its thumbnail together.
+
+        If either output is missing afterwards, the partial outputs are removed so the two-pass conversion can start
+        from scratch.
+
+        :param command: Command to execute.
+        :type command: list
+        :param thumbnail_image: Path to the thumbnail written by the command.
+        :type thumbnail_image: str
+        :param total_frames: Number of frames of the proxy, progress is reported only if known.
+        :type total_frames: int
+        :return: True if both outputs were written, False otherwise.
+        :rtype: bool
+        """
+        if self._execute_render_command(command, total_frames, (self.__partial_file, thumbnail_image)) \
+                and os.path.isfile(self.__partial_file) and os.path.isfile(thumbnail_image):
+            return True
+
+        _utilities.delete_files([file for file in (self.__partial_file, thumbnail_image) if os.path.isfile(file)])
+        return False
+
+    def _generate_poster(self, thumbnail_frame_time: float, thumbnail_image: str, source_file: str) -> bool:
+        """
+        Generate the thumbnail from the proxy if enabled, falling back to the source.
+
+        :param thumbnail_frame_time: Time to extract the thumbnail frame.
+        :type thumbnail_frame_time: float
+        :param thumbnail_image: Path to save the thumbnail.
+        :type thumbnail_image: str
+        :param source_file: Path to the source file.
+        :type source_file: str
+        :return: True if successful, False otherwise.
+        :rtype: bool
+        """
+        if self.__thumbnail_from_proxy and os.path.isfile(self._rendered_proxy()):
+            if self._generate_thumbnail(thumbnail_frame_time, thumbnail_image, self._rendered_proxy()) \
+                    and os.path.isfile(thumbnail_image):
+                return True
+
+        return self._generate_thumbnail(thumbnail_frame_time, thumbnail_image, source_file)
+
+    def _generate_thumbnail(self, thumbnail_frame_time: float, thumbnail_image: str, input_file: str) -> bool:
+        """
+        Generate a thumbnail from a video or image sequence.
+
+        :param thumbnail_frame_time: Time to extract the thumbnail frame.
+        :type thumbnail_frame_time: float
+        :param thumbnail_image: Path to save the thumbnail.
+        :type thumbnail_image: str
+        :param input_file: Path to the input file.
+        :type input_file: str
+        :return: True if successful, False otherwise.
+        :rtype: bool
+        """
+        command = _commands.extract_image_from_video(input_file,
+                                                     thumbnail_image,
+                                                     self.__thumb_resolutionX,
+                                                     self.__thumb_resolutionY,
+                                                     thumbnail_frame_time)
+        return self._execute_render_command(command, 1, (thumbnail_image,))
+
+    def _generate_filmstrip(self, total_frames, fps: float) -> None:
+        """
+        Generate the filmstrip image of the proxy and its info file, if enabled.
+
+        The filmstrip holds `config.FILMSTRIP_FRAMES` evenly spaced frames side by side; the info file records the
+        number of frames, the frame step and the FPS needed to play it back.
+
+        :param total_frames: Number of frames of the proxy.
+        :type total_frames: int or str
+        :param fps: Frames per second of the proxy.
+        :type fps: float
+        """
+        filmstrip_image, filmstrip_info = _utilities.get_filmstrip_from_proxy(self.__output_file)
+        if not self.__filmstrip or not filmstrip_image:
+            return
+
+        if os.path.isfile(filmstrip_image) and os.path.isfile(filmstrip_info):
+            return
+
+        try:
+            total_frames = max(1, int(total_frames))
+        except (TypeError, ValueError):
+            total_frames = 1
+
+        frame_count = min(config.FILMSTRIP_FRAMES, total_frames)
+        command = _commands.extract_filmstrip(
+            self._rendered_proxy(), filmstrip_image, total_frames, config.FILMSTRIP_TILE_WIDTH, frame_count)
+
+        if not self._execute_render_command(command, outputs=(filmstrip_image,)) or not os.path.isfile(filmstrip_image):
+            return
+
+        with open(filmstrip_info, 'w') as file:
+            json.dump({'frames': frame_count, 'step': max(1, total_frames // frame_count), 'fps': float(fps)}, file)
@@ -0,0 +1,277 @@
+"""
+Summary:
+
+This module reads the resolution, channel count and bit depth of an image from the first bytes of its file, without
+launching ffprobe. It supports the formats of `config.SUPPORTED_IMAGE_FORMATS`: EXR, DPX, TIFF, PNG, TGA and JPEG.
+
+`read_header` returns None for files it cannot parse (unknown layout, truncated or oversized header), in which case
+the caller falls back to ffprobe.
+"""
+
+# -------------------------------- built-in Modules ----------------------------------
+import os
+import struct
+from typing import Dict, Optional
+
+HEADER_SIZE = 64 * 1024
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+_PNG_CHANNELS = {0: 1, 2: 3, 3: 3, 4: 2, 6: 4}
+_EXR_MAGIC = b'\x76\x2f\x31\x01'
+_EXR_BIT_DEPTHS = {0: 32, 1: 16, 2: 32}
+_DPX_CHANNELS = {1: 1, 2: 1, 3: 1, 4: 1, 6: 1, 50: 3, 51: 4, 52: 4, 100: 2, 101: 3, 102: 3, 103: 4}
+_TIFF_WIDTH, _TIFF_HEIGHT, _TIFF_BITS_PER_SAMPLE, _TIFF_SAMPLES_PER_PIXEL = 256, 257, 258, 277
+_TIFF_TYPE_SIZES = {1: 1, 3: 2, 4: 4}
+_TIFF_TYPE_FORMATS = {1: 'B', 3: 'H', 4: 'I'}
+
+
+def read_header(image_file: str) -> Optional[Dict[str, int]]:
+    """
+    Read the header of an image.
+
+    :param image_file: Path to the image.
+    :type image_file: str
+    :return: `width`, `height`, `channels` and `bit_depth` (per channel), or None if the header cannot be read.
+    :rtype: Optional[Dict[str, int]]
+    """
+    readers = {'.png': _read_png,
+               '.jpg': _read_jpeg,
+               '.jpeg': _read_jpeg,
+               '.tga': _read_tga,
+               '.tif': _read_tiff,
+               '.tiff': _read_tiff,
+               '.dpx': _read_dpx,
+               '.exr': _read_exr}
+
+    reader = readers.get(os.path.splitext(image_file)[1].lower())
+    if reader is None:
+        return None
+
+    try:
+        with open(image_file, 'rb') as file:
+            header = reader(file)
+    except (OSError, struct.error, IndexError, ValueError):
+        return None
+
+    if not header or header['width'] <= 0 or header['height'] <= 0:
+        return None
+    return header
+
+
+def _header(width: int, height: int, channels: int, bit_depth: int) -> Dict[str, int]:
+    """
+    Build the header returned by `read_header`.
+
+    :param width: Width in pixels.
+    :type width: int
+    :param height: Height in pixels.
+    :type height: int
+    :param channels: Number of channels.
+    :type channels: int
+    :param bit_depth: Bits per channel.
+    :type bit_depth: int
+    :return: The header.
+    :rtype: Dict[str, int]
+    """
+    return {'width': width, 'height': height, 'channels': channels, 'bit_depth': bit_depth}
+
+
+def _read_png(file) -> Optional[Dict[str, int]]:
+    """
+    Read the IHDR chunk of a PNG image.
+
+    :param file: The image, opened in binary mode.
+    :type file: BinaryIO
+    :return: The header, or None if the file is not a PNG image.
+    :rtype: Optional[Dict[str, int]]
+    """
+    data = file.read(29)
+    if not data.startswith(_PNG_SIGNATURE) or data[12:16] != b'IHDR':
+        return None
+
+    width, height, bit_depth, color_type = struct.unpack('>IIBB', data[16:26])
+    return _header(width, height, _PNG_CHANNELS.get(color_type, 3), bit_depth)
+
+
+def _read_jpeg(file) -> Optional[Dict[str, int]]:
+    """
+    Read the start of frame segment of a JPEG image.
+
+    :param file: The image, opened in binary mode.
+    :type file: BinaryIO
+    :return: The header, or None if the file is not a JPEG image or its frame header is beyond `HEADER_SIZE`.
+    :rtype: Optional[Dict[str, int]]
+    """
+    data = file.read(HEADER_SIZE)
+    if not data.startswith(b'\xff\xd8'):
+        return None
+
+    offset = 2
+    while offset + 4 <= len(data):
+        if data[offset] != 0xFF:
+            return None
+
+        marker = data[offset + 1]
+        if marker == 0xFF:
+            # fill byte
+            offset += 1
+            continue
+
+        length = struct.unpack('>H', data[offset + 2:offset + 4])[0]
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            precision, height, width, channels = struct.unpack('>BHHB', data[offset + 4:offset + 10])
+            return _header(width, height, channels, precision)
+
+        offset += 2 + length
+
+    return None
+
+
+def _read_tga(file) -> Optional[Dict[str, int]]:
+    """
+    Read the header of a TGA image.
+
+    :param file: The image, opened in binary mode.
+    :type file: BinaryIO
+    :return: The header, or None if the image type is not supported.
+    :rtype: Optional[Dict[str, int]]
+    """
+    data = file.read(18)
+    image_type = data[2]
+    width, height, pixel_depth = struct.unpack('<HHB', data[12:17])
+
+    if image_type in (3, 11):
+        # grayscale
+        return _header(width, height, 1, pixel_depth)
+    if image_type in (1, 2, 9, 10):
+        # color mapped or true color
+        return _header(width, height, 4 if pixel_depth == 32 else 3, 8)
+    return None
+
+
+def _read_tiff(file) -> Optional[Dict[str, int]]:
+    """
+    Read the first image file directory of a TIFF image.
+
+    :param file: The image, opened in binary mode.
+    :type file: BinaryIO
+    :return: The header, or None if the file is not a TIFF image.
+    :rtype: Optional[Dict[str, int]]
+    """
+    data = file.read(8)
+    byte_order = {b'II': '<', b'MM': '>'}.get(data[:2])
+    if byte_order is None or struct.unpack(f'{byte_order}H', data[2:4])[0] != 42:
+        return None
+
+    file.seek(struct.unpack(f'{byte_order}I', data[4:8])[0])
+    entry_count = struct.unpack(f'{byte_order}H', file.read(2))[0]
+    entries = file.read(entry_count * 12)
+
+    tags = {}
+    for index in range(entry_count):
+        tag, field_type, count, value = struct.unpack(
+            f'{byte_order}HHI4s', entries[index * 12:index * 12 + 12])
+        if field_type not in _TIFF_TYPE_SIZES:
+            continue
+
+        value_format = f'{byte_order}{_TIFF_TYPE_FORMATS[field_type]}'
+        if _TIFF_TYPE_SIZES[field_type] * count > 4:
+            # the values are stored elsewhere, the first one is enough
+            position = file.tell()
+            file.seek(struct.unpack(f'{byte_order}I', value)[0])
+            value = file.read(_TIFF_TYPE_SIZES[field_type])
+            file.seek(position)
+        tags[tag] = struct.unpack(value_format, value[:_TIFF_TYPE_SIZES[field_type]])[0]
+
+    return _header(tags.get(_TIFF_WIDTH, 0),
+                   tags.get(_TIFF_HEIGHT, 0),
+                   tags.get(_TIFF_SAMPLES_PER_PIXEL, 1),
+                   tags.get(_TIFF_BITS_PER_SAMPLE, 1))
+
+
+def _read_dpx(file) -> Optional[Dict[str, int]]:
+    """
+    Read the file and image information headers of a DPX image.
+
+    :param file: The image, opened in binary mode.
+    :type file: BinaryIO
+    :return: The header, or None if the file is not a DPX image.
+    :rtype: Optional[Dict[str, int]]
+    """
+    data = file.read(804)
+    byte_order = {b'SDPX': '>', b'XPDS': '<'}.get(data[:4])
+    if byte_order is None:
+        return None
+
+    width, height = struct.unpack(f'{byte_order}II', data[772:780])
+    descriptor, bit_depth = data[800], data[803]
+    return _header(width, height, _DPX_CHANNELS.get(descriptor, 3), bit_depth)
+
+
+def _read_exr(file) -> Optional[Dict[str, int]]:
+    """
+    Read the `displayWindow` and `channels` attributes of an OpenEXR image (of its first part, if multipart).
+
+    The resolution is the one of the display window, like ffprobe reports it; the data window (the pixels actually
+    stored, cropped or with overscan) is only used if the display window is missing.
+
+    :param file: The image, opened in binary mode.
+    :type file: BinaryIO
+    :return: The header, or None if the file is not an OpenEXR image or its header is beyond `HEADER_SIZE`.
+    :rtype: Optional[Dict[str, int]]
+    """
+    data = file.read(HEADER_SIZE)
+    if not data.startswith(_EXR_MAGIC):
+        return None
+
+    windows = {}
+    channels = []
+    offset = 8
+
+    while True:
+        name_end = data.index(b'\0', offset)
+        if name_end == offset:
+            # end of the header
+            break
+
+        name = data[offset:name_end]
+        type_end = data.index(b'\0', name_end + 1)
+        size = struct.unpack('<i', data[type_end + 1:type_end + 5])[0]
+        value = data[type_end + 5:type_end + 5 + size]
+        if len(value) < size:
+            return None
+
+        if name in (b'displayWindow', b'dataWindow'):
+            x_min, y_min, x_max, y_max = struct.unpack('<iiii', value[:16])
+            windows[name] = (x_max - x_min + 1, y_max - y_min + 1)
+        elif name == b'channels':
+            channels = _exr_channel_types(value)
+
+        offset = type_end + 5 + size
+
+    if not channels:
+        return None
+
+    width, height = windows.get(b'displayWindow') or windows.get(b'dataWindow') or (0, 0)
+    return _header(width, height, len(channels), max(_EXR_BIT_DEPTHS.get(pixel_type, 32) for pixel_type in channels))
+
+
+def _exr_channel_types(value: bytes) -> list:
+    """
+    Get the pixel types of an OpenEXR channel list.
+
+    :param value: The value of the `channels` attribute.
+    :type value: bytes
+    :return: The pixel type of each channel (0: uint, 1: half, 2: float).
+    :rtype: list[int]
+    """
+    pixel_types = []
+    offset = 0
+
+    while offset < len(value) and value[offset] != 0:
+        name_end = value.index(b'\0', offset)
+        pixel_types.append(struct.unpack('<i', value[name_end + 1:name_end + 5])[0])
+        # pixel type, pLinear, reserved, xSampling, ySampling
+        offset = name_end + 1 + 16
+
+    return pixel_types
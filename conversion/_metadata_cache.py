@@ -0,0 +1,342 @@
+"""
+Summary:
+
+This module provides a persistent cache of ffprobe results, so converting or recaching a file whose content has not
+changed does not launch ffprobe again.
+
+MetadataCache:
+    Stores the ffprobe JSON output of files in a SQLite database, keyed by path and validated against the file size
+    and modification time. Concurrent requests for the same file share a single ffprobe process, and `probe_many`
+    probes a batch of files (e.g. a dropped folder) on a few parallel processes ahead of their conversions, storing
+    them `config.METADATA_STORE_BATCH_SIZE` per transaction as they complete. A file is only claimed once its probe
+    starts, so a conversion waits at most for the probes in progress and probes the other files itself.
+
+The shared instance is `cache`, stored in the user's ulaavi directory. It is safe to use from worker threads.
+"""
+
+# -------------------------------- built-in Modules ----------------------------------
+import json
+import os
+import sqlite3
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# -------------------------------- Custom Modules ------------------------------------
+from data import config
+from . import _commands
+
+
+def _identity(source_file: str) -> Optional[Tuple[int, int]]:
+    """
+    Get the identity of a file's content.
+
+    :param source_file: Path to the file.
+    :type source_file: str
+    :return: Size in bytes and modification time in nanoseconds, or None if the file does not exist
+             (e.g. an image sequence pattern).
+    :rtype: Optional[Tuple[int, int]]
+    """
+    try:
+        stat = os.stat(source_file)
+    except OSError:
+        return None
+
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _run_ffprobe(source_file: str) -> Optional[dict]:
+    """
+    Probe a file with ffprobe.
+
+    A probe running longer than `config.FFPROBE_TIMEOUT_S` (e.g. a stalled network read) is killed and retried up to
+    `config.FFMPEG_RETRIES` times, waiting `config.FFMPEG_RETRY_BACKOFF_S` seconds, doubled on each retry.
+
+    :param source_file: Path to the file.
+    :type source_file: str
+    :return: The parsed ffprobe output, or None if ffprobe returned nothing or kept timing out.
+    :rtype: Optional[dict]
+    """
+    for attempt in range(config.FFMPEG_RETRIES + 1):
+        if attempt:
+            time.sleep(config.FFMPEG_RETRY_BACKOFF_S * 2 ** (attempt - 1))
+
+        try:
+            process = subprocess.Popen(_commands.extract_video_thumbnail_frame(source_file),
+                                       stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        except OSError as error:
+            print(error)
+            return None
+
+        try:
+            out, _ = process.communicate(timeout=config.FFPROBE_TIMEOUT_S)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            print(f'ffprobe timed out after {config.FFPROBE_TIMEOUT_S} s: {source_file}')
+            continue
+
+        try:
+            return json.loads(out) or None
+        except ValueError:
+            return None
+
+    return None
+
+
+class MetadataCache:
+    """
+    Persistent cache of ffprobe results.
+
+    Attributes:
+        cache_file (str): Path to the SQLite database.
+        hits (int): Probes answered from the cache.
+        misses (int): Probes that launched ffprobe.
+        __lock (threading.Lock): Guards the in-flight probes and the counters.
+        __in_flight (Dict[str, threading.Event]): Events set when the probe of a file in progress is stored.
+    """
+
+    def __init__(self, cache_file: str) -> None:
+        """
+        Initialize the cache, the database is created on first use.
+
+        :param cache_file: Path to the SQLite database.
+        :type cache_file: str
+        """
+        self.cache_file = cache_file
+        self.hits = 0
+        self.misses = 0
+        self.__lock = threading.Lock()
+        self.__in_flight = {}
+        self.__is_initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a connection to the database, creating it if needed. Connections are not shared between threads.
+
+        :return: The connection.
+        :rtype: sqlite3.Connection
+        """
+        if not self.__is_initialized:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+
+        connection = sqlite3.connect(self.cache_file, timeout=10)
+
+        if not self.__is_initialized:
+            connection.execute('CREATE TABLE IF NOT EXISTS metadata ('
+                               'path TEXT PRIMARY KEY, size INTEGER, mtime INTEGER, probe TEXT)')
+            connection.commit()
+            self.__is_initialized = True
+
+        return connection
+
+    def _lookup(self, source_file: str, identity: Tuple[int, int]) -> Optional[dict]:
+        """
+        Get the cached probe of a file, if its content has not changed since.
+
+        :param source_file: Path to the file.
+        :type source_file: str
+        :param identity: Current size and modification time of the file.
+        :type identity: Tuple[int, int]
+        :return: The parsed ffprobe output, or None if not cached.
+        :rtype: Optional[dict]
+        """
+        try:
+            connection = self._connect()
+            try:
+                row = connection.execute(
+                    'SELECT probe FROM metadata WHERE path = ? AND size = ? AND mtime = ?',
+                    (source_file, *identity)).fetchone()
+            finally:
+                connection.close()
+        except sqlite3.Error:
+            return None
+
+        return json.loads(row[0]) if row else None
+
+    def _store(self, probes: List[Tuple[str, Tuple[int, int], dict]]) -> None:
+        """
+        Store probes in a single transaction.
+
+        :param probes: The (path, identity, parsed ffprobe output) of each file.
+        :type probes: List[Tuple[str, Tuple[int, int], dict]]
+        """
+        if not probes:
+            return
+
+        try:
+            connection = self._connect()
+            try:
+                with connection:
+                    connection.executemany(
+                        'INSERT OR REPLACE INTO metadata (path, size, mtime, probe) VALUES (?, ?, ?, ?)',
+                        [(path, *identity, json.dumps(probe)) for path, identity, probe in probes])
+            finally:
+                connection.close()
+        except sqlite3.Error as error:
+            print(error)
+
+    def _claim(self, source_files: Iterable[str]) -> List[str]:
+        """
+        Mark files as being probed by the caller, skipping the ones already being probed.
+
+        :param source_files: Paths to the files.
+        :type source_files: Iterable[str]
+        :return: The files claimed by the caller.
+        :rtype: List[str]
+        """
+        with self.__lock:
+            claimed = [file for file in dict.fromkeys(source_files) if file not in self.__in_flight]
+            for file in claimed:
+                self.__in_flight[file] = threading.Event()
+            return claimed
+
+    def _release(self, source_files: Iterable[str]) -> None:
+        """
+        Wake the requests waiting on the probe of files.
+
+        :param source_files: Paths to the files claimed with `_claim`.
+        :type source_files: Iterable[str]
+        """
+        with self.__lock:
+            for file in source_files:
+                self.__in_flight.pop(file).set()
+
+    def probe(self, source_file: str) -> Optional[dict]:
+        """
+        Get the ffprobe output of a file, from the cache if its content has not changed.
+
+        :param source_file: Path to the file.
+        :type source_file: str
+        :return: The parsed ffprobe output, or None if ffprobe returned nothing.
+        :rtype: Optional[dict]
+        """
+        identity = _identity(source_file)
+        if identity is None:
+            return _run_ffprobe(source_file)
+
+        while True:
+            probe = self._lookup(source_file, identity)
+            if probe is not None:
+                with self.__lock:
+                    self.hits += 1
+                return probe
+
+            if self._claim([source_file]):
+                break
+
+            # another thread is probing the file, use its result
+            with self.__lock:
+                event = self.__in_flight.get(source_file)
+            if event is not None:
+                event.wait()
+                identity = _identity(source_file) or identity
+
+        try:
+            with self.__lock:
+                self.misses += 1
+            probe = _run_ffprobe(source_file)
+            if probe is not None:
+                self._store([(source_file, identity, probe)])
+            return probe
+        finally:
+            self._release([source_file])
+
+    def probe_many(self, source_files: Iterable[str]) -> None:
+        """
+        Probe the files missing from the cache on `config.METADATA_PROBE_WORKERS` parallel processes, storing and
+        releasing them `config.METADATA_STORE_BATCH_SIZE` at a time as their probes complete.
+
+        :param source_files: Paths to the files.
+        :type source_files: Iterable[str]
+        """
+        identities = {file: _identity(file) for file in source_files}
+        missing = [file for file, identity in identities.items()
+                   if identity is not None and self._lookup(file, identity) is None]
+        if not missing:
+            return
+
+        completed = []
+        try:
+            with ThreadPoolExecutor(max_workers=config.METADATA_PROBE_WORKERS) as executor:
+                futures = [executor.submit(self._probe_claimed, file, identities[file]) for file in missing]
+
+                for future in as_completed(futures):
+                    file, probe = future.result()
+                    if file is None:
+                        continue
+
+                    completed.append((file, probe))
+                    if len(completed) >= config.METADATA_STORE_BATCH_SIZE:
+                        self._store_and_release(completed, identities)
+                        completed = []
+        finally:
+            self._store_and_release(completed, identities)
+
+    def _probe_claimed(self, source_file: str, identity: Tuple[int, int]) -> Tuple[Optional[str], Optional[dict]]:
+        """
+        Claim and probe a file of `probe_many`, unless another thread is probing it or already stored it.
+
+        :param source_file: Path to the file.
+        :type source_file: str
+        :param identity: Size and modification time of the file.
+        :type identity: Tuple[int, int]
+        :return: The claimed file (None if not claimed) and its parsed ffprobe output (None if not probed).
+        :rtype: Tuple[Optional[str], Optional[dict]]
+        """
+        if not self._claim([source_file]):
+            return None, None
+
+        try:
+            if self._lookup(source_file, identity) is not None:
+                return source_file, None
+
+            with self.__lock:
+                self.misses += 1
+            return source_file, _run_ffprobe(source_file)
+        except Exception as error:
+            print(error)
+            return source_file, None
+
+    def _store_and_release(self,
+                           completed: List[Tuple[str, Optional[dict]]],
+                           identities: Dict[str, Tuple[int, int]]) -> None:
+        """
+        Store the completed probes of `probe_many` in one transaction, then wake the requests waiting on them.
+
+        :param completed: The claimed files and their parsed ffprobe output (None if not probed).
+        :type completed: List[Tuple[str, Optional[dict]]]
+        :param identities: Size and modification time of the files.
+        :type identities: Dict[str, Tuple[int, int]]
+        """
+        try:
+            self._store([(file, identities[file], probe) for file, probe in completed if probe is not None])
+        finally:
+            self._release([file for file, _ in completed])
+
+    def probe_many_async(self, source_files: Iterable[str]) -> None:
+        """
+        Run `probe_many` on a background thread. Conversions of the files started meanwhile wait for its results
+        instead of probing them again.
+
+        :param source_files: Paths to the files.
+        :type source_files: Iterable[str]
+        """
+        source_files = list(source_files)
+        if source_files:
+            threading.Thread(target=self.probe_many, args=(source_files,), daemon=True).start()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the cache counters.
+
+        :return: Number of hits and misses.
+        :rtype: Dict[str, int]
+        """
+        with self.__lock:
+            return {'hits': self.hits, 'misses': self.misses}
+
+
+cache = MetadataCache(os.path.join(os.path.expanduser('~'), 'Documents', 'ulaavi', config.METADATA_CACHE_FILE_NAME))
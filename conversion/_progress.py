@@ -0,0 +1,118 @@
+"""
+Summary:
+
+This module streams the progress of an ffmpeg process started with `_commands.with_progress`, so conversions
+report frames done, encoding fps and speed while they run instead of only on exit.
+
+ffmpeg writes a block of `key=value` lines to stdout every half second, ended by a `progress=continue` line (or
+`progress=end` on the last one). `stream_progress` reads the output line by line as it arrives, hands each
+completed block to a callback and keeps only the last `config.FFMPEG_LOG_LINES` log lines, so neither the
+progress nor the log of a long render is held in memory.
+"""
+
+# -------------------------------- built-in Modules ----------------------------------
+import subprocess
+from collections import deque
+from typing import Callable, Deque, Optional
+
+# -------------------------------- Custom Modules ------------------------------------
+from data import config
+
+_PROGRESS_KEYS = frozenset(('frame', 'fps', 'stream_0_0_q', 'bitrate', 'total_size', 'out_time_us', 'out_time_ms',
+                            'out_time', 'dup_frames', 'drop_frames', 'speed', 'progress'))
+
+
+class Progress:
+    """
+    A progress report of ffmpeg.
+
+    Attributes:
+        frame (int): Number of frames written.
+        fps (float): Frames written per second.
+        speed (float): Encoding speed relative to playback, e.g. 2.0 for twice real time.
+        is_finished (bool): Whether this is the last report.
+    """
+    __slots__ = ('frame', 'fps', 'speed', 'is_finished')
+
+    def __init__(self, frame: int = 0, fps: float = 0.0, speed: float = 0.0, is_finished: bool = False) -> None:
+        """
+        Initialize the report.
+
+        :param frame: Number of frames written.
+        :type frame: int
+        :param fps: Frames written per second.
+        :type fps: float
+        :param speed: Encoding speed relative to playback.
+        :type speed: float
+        :param is_finished: Whether this is the last report.
+        :type is_finished: bool
+        """
+        self.frame = frame
+        self.fps = fps
+        self.speed = speed
+        self.is_finished = is_finished
+
+    @classmethod
+    def from_record(cls, record: dict) -> 'Progress':
+        """
+        Build a report from a block of ffmpeg progress values. Values ffmpeg reports as `N/A` are read as 0.
+
+        :param record: The `key=value` pairs of the block.
+        :type record: dict
+        :return: The report.
+        :rtype: Progress
+        """
+        return cls(frame=int(_to_float(record.get('frame'))),
+                   fps=_to_float(record.get('fps')),
+                   speed=_to_float(record.get('speed', '').rstrip('x')),
+                   is_finished=record.get('progress') == 'end')
+
+
+def _to_float(value: Optional[str]) -> float:
+    """
+    Parse a progress value.
+
+    :param value: The value, as written by ffmpeg.
+    :type value: str
+    :return: The value, 0 if missing or not a number.
+    :rtype: float
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def stream_progress(process: subprocess.Popen,
+                    on_progress: Callable[[Progress], None]) -> Deque[str]:
+    """
+    Read the output of an ffmpeg process until it exits, reporting its progress.
+
+    Lines are read with at most `config.FFMPEG_LINE_LIMIT` bytes at a time, longer lines are split.
+
+    :param process: The process, started with stdout piped (and stderr merged into it).
+    :type process: subprocess.Popen
+    :param on_progress: Called with each progress report.
+    :type on_progress: Callable[[Progress], None]
+    :return: The last `config.FFMPEG_LOG_LINES` lines of output that are not progress values.
+    :rtype: Deque[str]
+    """
+    log = deque(maxlen=config.FFMPEG_LOG_LINES)
+    record = {}
+
+    for line in iter(lambda: process.stdout.readline(config.FFMPEG_LINE_LIMIT), b''):
+        line = line.decode(errors='replace').strip()
+        key, separator, value = line.partition('=')
+
+        if not separator or key not in _PROGRESS_KEYS:
+            if line:
+                log.append(line)
+            continue
+
+        record[key] = value.strip()
+        if key == 'progress':
+            on_progress(Progress.from_record(record))
+            record = {}
+
+    process.wait()
+    return log
@@ -0,0 +1,289 @@
+"""
+Summary:
+
+This module queues the `convert_mov.ConvertMov` jobs before they reach the conversion thread pool.
+
+ConversionScheduler:
+    Holds the conversions waiting for a thread and hands them over (`on_start`) only while fewer than the thread
+    count are running, so the order of the queue is kept in its own hands:
+        - A proxy path is only scheduled once, dropping the same files again does not render them twice.
+        - Conversions of the cells currently on screen (`prioritize`) are started before the others.
+        - Queued conversions are dropped on `cancel`, running ones are stopped by killing their ffmpeg process.
+    The queue depth, the throughput over the last `config.CONVERSION_THROUGHPUT_WINDOW_S` seconds and the time
+    left are emitted on every change (`on_queue_changed`). The time left divides the frames left to convert by the
+    summed encoding fps of the running conversions; the frame count of a conversion not reporting progress yet is
+    taken as the average of the previous ones.
+    In auto mode (`set_auto_thread_count`) the number of conversions running at once follows a
+    `_concurrency.ConcurrencyTuner` fed with the summed encoding fps, and each conversion is given the ffmpeg threads
+    of the tuned value when it starts.
+"""
+
+# -------------------------------- built-in Modules ----------------------------------
+import time
+from collections import deque
+from typing import Dict, Iterable
+
+# ------------------------------- ThirdParty Modules ---------------------------------
+try:
+    from PySide2.QtCore import QObject, QThread, Signal
+except ModuleNotFoundError:
+    from PySide6.QtCore import QObject, QThread, Signal
+
+# -------------------------------- Custom Modules ------------------------------------
+from data import config
+from . import _concurrency
+from . import convert_mov
+
+
+class ConversionScheduler(QObject):
+    """
+    Priority queue of the proxy conversions, used from the GUI thread.
+
+    :Signals:
+        - **on_start**: Emitted when a conversion gets a thread.
+            - Args:
+                - `worker (ConvertMov)`: The conversion to start on the thread pool.
+        - **on_queue_changed**: Emitted when a conversion is queued, started, finished or cancelled.
+            - Args:
+                - `queued (int)`: Number of conversions waiting for a thread.
+                - `running (int)`: Number of conversions running.
+                - `throughput (float)`: Conversions finished per minute, over the last
+                  `config.CONVERSION_THROUGHPUT_WINDOW_S` seconds.
+                - `eta (float)`: Estimated seconds until the queue is empty, -1 if unknown.
+    """
+    on_start = Signal(object)
+    on_queue_changed = Signal(int, int, float, float)
+
+    def __init__(self, parent=None) -> None:
+        """
+        Initialize an empty queue, running as many conversions at once as the thread pool default.
+
+        :param parent: The parent object.
+        :type parent: QObject, optional
+        """
+        super().__init__(parent)
+        self.__max_running = max(1, QThread.idealThreadCount())
+        self.__tuner = None
+        self.__queue = []
+        self.__running = {}
+        self.__scheduled = set()
+        self.__prioritized = set()
+        self.__finished_at = deque()
+        self.__progress = {}
+        self.__frame_counts = deque(maxlen=50)
+
+    def set_max_thread_count(self, thread_count: int) -> None:
+        """
+        Set the number of conversions running at once, it should match the thread count of the pool.
+        Leaves the auto mode, ffmpeg chooses the threads of each conversion.
+
+        :param thread_count: thread count
+        :type thread_count: int
+        """
+        self.__tuner = None
+        self.__max_running = max(1, int(thread_count))
+        self._dispatch()
+
+    def set_auto_thread_count(self, max_thread_count: int = 0) -> None:
+        """
+        Size the number of conversions running at once, and the ffmpeg threads of each, to the machine and tune them
+        from the observed throughput, see `_concurrency`.
+
+        :param max_thread_count: Upper bound of the conversions running at once, the number of cores if 0.
+        :type max_thread_count: int
+        """
+        self.__tuner = _concurrency.ConcurrencyTuner(max_thread_count)
+        self.__max_running = self.__tuner.jobs
+        self._dispatch()
+
+    @property
+    def max_thread_count(self) -> int:
+        """The most conversions that may run at once, the thread count the pool needs."""
+        return self.__tuner.max_jobs if self.__tuner is not None else self.__max_running
+
+    def is_scheduled(self, proxy_file: str) -> bool:
+        """
+        Check whether a proxy is queued or being converted.
+
+        :param proxy_file: The path of the proxy file.
+        :type proxy_file: str
+        :return: True if the proxy is queued or being converted.
+        :rtype: bool
+        """
+        return proxy_file in self.__scheduled
+
+    def submit(self, worker: convert_mov.ConvertMov) -> bool:
+        """
+        Queue a conversion, unless its proxy is already queued or being converted.
+
+        :param worker: The conversion.
+        :type worker: ConvertMov
+        :return: True if the conversion was queued.
+        :rtype: bool
+        """
+        if self.is_scheduled(worker.output_file):
+            return False
+
+        worker.signals.on_progress.connect(self._on_progress)
+        worker.signals.on_finished.connect(self._on_finished)
+        self.__queue.append(worker)
+        self.__scheduled.add(worker.output_file)
+        self._dispatch()
+        return True
+
+    def prioritize(self, source_files: Iterable[str]) -> None:
+        """
+        Start the queued conversions of these source files first, replacing the previous ones.
+
+        :param source_files: The source files of the cells on screen.
+        :type source_files: Iterable[str]
+        """
+        self.__prioritized = set(source_files)
+
+    def cancel(self, proxy_files: Iterable[str]) -> int:
+        """
+        Cancel the conversions of proxies, queued or running.
+
+        :param proxy_files: The paths of the proxy files.
+        :type proxy_files: Iterable[str]
+        :return: Number of conversions cancelled.
+        :rtype: int
+        """
+        proxy_files = set(proxy_files)
+        cancelled = [worker for worker in self.__queue if worker.output_file in proxy_files]
+        self.__queue = [worker for worker in self.__queue if worker.output_file not in proxy_files]
+
+        for worker in cancelled:
+            self.__scheduled.discard(worker.output_file)
+            worker.signals.on_render_cancelled.emit()
+
+        # running conversions leave the queue once their thread returns, see `_on_finished`
+        running = [worker for proxy_file, worker in self.__running.items() if proxy_file in proxy_files]
+        for worker in running:
+            worker.cancel()
+
+        self._emit_queue_changed()
+        return len(cancelled) + len(running)
+
+    def cancel_all(self) -> int:
+        """
+        Cancel every queued and running conversion.
+
+        :return: Number of conversions cancelled.
+        :rtype: int
+        """
+        return self.cancel([worker.output_file for worker in self.__queue] + list(self.__running))
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get the state of the queue.
+
+        :return: Number of queued and running conversions, conversions finished per minute and estimated seconds
+                 until the queue is empty (-1 if unknown).
+        :rtype: Dict[str, float]
+        """
+        window = config.CONVERSION_THROUGHPUT_WINDOW_S
+        now = time.monotonic()
+
+        while self.__finished_at and now - self.__finished_at[0] > window:
+            self.__finished_at.popleft()
+
+        return {'queued': len(self.__queue),
+                'running': len(self.__running),
+                'throughput': len(self.__finished_at) * 60 / window,
+                'eta': self._eta()}
+
+    def _eta(self) -> float:
+        """
+        Estimate the time until the queue is empty.
+
+        :return: Seconds left, or -1 if no running conversion reports its encoding fps yet.
+        :rtype: float
+        """
+        fps = sum(progress[2] for progress in self.__progress.values())
+        if fps <= 0:
+            return -1
+
+        average_frames = sum(self.__frame_counts) / len(self.__frame_counts) if self.__frame_counts else 0
+        frames_left = sum(total_frames - frame for frame, total_frames, _ in self.__progress.values())
+        frames_left += average_frames * (len(self.__queue) + len(self.__running) - len(self.__progress))
+
+        return frames_left / fps
+
+    def _dispatch(self) -> None:
+        """
+        Start queued conversions while threads are free, the prioritized ones first and otherwise in queue order.
+        """
+        while self.__queue and len(self.__running) < self.__max_running:
+            index = next((index for index, worker in enumerate(self.__queue)
+                          if worker.source_file in self.__prioritized), 0)
+            worker = self.__queue.pop(index)
+            worker.set_threads(self.__tuner.threads if self.__tuner is not None else 0)
+            self.__running[worker.output_file] = worker
+            self.on_start.emit(worker)
+
+        self._emit_queue_changed()
+
+    def _on_progress(self, proxy_file: str, frame: int, total_frames: int, fps: float, speed: float) -> None:
+        """
+        Record the progress of a running conversion.
+
+        :param proxy_file: The path of the proxy file.
+        :type proxy_file: str
+        :param frame: Number of frames converted.
+        :type frame: int
+        :param total_frames: Number of frames of the source.
+        :type total_frames: int
+        :param fps: Encoding fps.
+        :type fps: float
+        :param speed: Encoding speed relative to playback.
+        :type speed: float
+        """
+        if proxy_file not in self.__running:
+            return
+
+        if proxy_file not in self.__progress:
+            self.__frame_counts.append(total_frames)
+        self.__progress[proxy_file] = (frame, total_frames, fps)
+
+        if self._tune():
+            self._dispatch()
+        else:
+            self._emit_queue_changed()
+
+    def _tune(self) -> bool:
+        """
+        Feed the summed encoding fps of the running conversions to the tuner of the auto mode.
+
+        :return: True if the number of conversions running at once changed.
+        :rtype: bool
+        """
+        if self.__tuner is None:
+            return False
+
+        saturated = bool(self.__queue) and len(self.__running) >= self.__max_running
+        if not self.__tuner.sample(sum(progress[2] for progress in self.__progress.values()), saturated):
+            return False
+
+        self.__max_running = self.__tuner.jobs
+        return True
+
+    def _on_finished(self, proxy_file: str) -> None:
+        """
+        Free the thread of a finished conversion and start the next one.
+
+        :param proxy_file: The path of the proxy file.
+        :type proxy_file: str
+        """
+        worker = self.__running.pop(proxy_file, None)
+        self.__progress.pop(proxy_file, None)
+        if worker is not None:
+            self.__scheduled.discard(proxy_file)
+        if worker is not None and not worker.is_cancelled:
+            self.__finished_at.append(time.monotonic())
+        self._dispatch()
+
+    def _emit_queue_changed(self) -> None:
+        """Emit the state of the queue."""
+        stats = self.stats()
+        self.on_queue_changed.emit(stats['queued'], stats['running'], stats['throughput'], stats['eta'])
@@ -1,16 +1,20 @@
 """
 Summary:
 
-This module provides utilities for managing JSON data and application preferences. It includes two main classes:
+This module provides utilities for managing JSON data and application preferences. It includes the following classes:
+DataHandler:
+    An abstract base class describing the storage backend interface used by `tool_data.Data`.
+
 JsonHandler:
     An abstract base class for handling JSON files.
     Provides methods for serializing and deserializing JSON data.
     Subclasses must implement the __init__ method.
 
 DataJson:
-    Extends JsonHandler to manage JSON data organized into groups, categories, and tags.
+    Extends JsonHandler and DataHandler to manage JSON data organized into groups, categories, and tags.
     Provides methods to update, remove, and query data.
     Supports operations like adding/removing groups, categories, and tags.
+    Optionally journals mutations as delta records and compacts them into the JSON file in the background.
 
 Preferences:
     Manages application settings stored in a .ini file.
@@ -23,6 +27,9 @@ import configparser
 import json
 import os
 import re
+import shutil
+import tempfile
+import threading
 from abc import abstractmethod, ABC
 from typing import Dict, Optional, List, Union
 
@@ -33,6 +40,105 @@ import _utilities
 from data import config
 
 
+class DataHandler(ABC):
+    """
+    Abstract base class for the storage backends of the library data.
+
+    A backend stores groups, categories, proxy entries and tags. `tool_data.Data` only talks to this interface,
+    so the storage engine can be switched from the preferences (see `config.STORAGE_BACKENDS`).
+    Entries are dictionaries with the keys "proxy", "source", "metadata" and "tags".
+    """
+
+    @abstractmethod
+    def update_data(self,
+                    group: str = '',
+                    category: str = '',
+                    data: Optional[Dict] = None,
+                    data_type: str = 'data',
+                    tag: str = '',
+                    source_files: Optional[List[str]] = None) -> None:
+        """Add a group, category, entry or tag, or tag entries (see `DataJson.update_data`)."""
+
+    @abstractmethod
+    def add_entries(self, group: str, category: str, entries: List[Dict]) -> None:
+        """Add entries to an existing category in a single write (see `DataJson.add_entries`)."""
+
+    @abstractmethod
+    def remove_data(self, group: str, category: str, source_files: list, tag: str = None) -> None:
+        """Remove entries, or a tag from entries (see `DataJson.remove_data`)."""
+
+    @abstractmethod
+    def remove_key(self, group: str = '', category: str = '', data_type: str = 'data', tag: str = '') -> None:
+        """Remove a group, a category with its sub-categories, or a tag (see `DataJson.remove_key`)."""
+
+    @abstractmethod
+    def update_key(self, group: str, category_to_replace: str, category_to_update: str) -> None:
+        """Rename a category (see `DataJson.update_key`)."""
+
+    @abstractmethod
+    def refresh_data(self, data_file: str = '') -> None:
+        """Reload the data from the storage, optionally switching to another file."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Flush pending writes and release the storage."""
+
+    @abstractmethod
+    def groups(self) -> List[str]:
+        """
+        Get the group names.
+
+        :return: Group names.
+        :rtype: List[str]
+        """
+
+    @abstractmethod
+    def categories(self, group: str) -> List[str]:
+        """
+        Get the category names of a group.
+
+        :param group: Group name.
+        :type group: str
+        :return: Category names.
+        :rtype: List[str]
+        """
+
+    @abstractmethod
+    def entries(self, group: str, category: str, tag: str = None, search_string: str = None) -> List[Dict]:
+        """
+        Get the entries of a category, optionally filtered by tag and by a search string in the source file name.
+
+        :param group: Group name.
+        :type group: str
+        :param category: Category name.
+        :type category: str
+        :param tag: Tag to filter by.
+        :type tag: Optional[str]
+        :param search_string: Case-insensitive string to search in source file names.
+        :type search_string: Optional[str]
+        :return: Matching entries.
+        :rtype: List[Dict]
+        """
+
+    @property
+    @abstractmethod
+    def data(self) -> dict or None:
+        """Get the whole data as {group: {category: [entries]}}."""
+
+    @property
+    @abstractmethod
+    def tags(self) -> list:
+        """Get the list of tags."""
+
+    @abstractmethod
+    def data_by_key(self, group: str, category: str = '') -> Union[Dict, List]:
+        """Get the entries of a category, or the categories of a group (see `DataJson.data_by_key`)."""
+
+    @abstractmethod
+    def is_category_item_exists(self, group: str, category: str) -> bool:
+        """Check if a category holds any entry (see `DataJson.is_category_item_exists`)."""
+
+
 class JsonHandler(ABC):
     """
     Abstract base class for handling JSON files.
@@ -81,28 +187,69 @@ class JsonHandler(ABC):
             return json.load(file_)
 
 
-class DataJson(JsonHandler):
+class DataJson(JsonHandler, DataHandler):
     """
     Handler for managing JSON data with a specific structure.
 
     This class extends `JsonHandler` to manage JSON data organized into groups,
     categories, and tags. It provides methods to update, remove, and query data.
 
+    When `journaled` is enabled, mutations are appended as small delta records to a journal file next to the
+    JSON file instead of re-dumping the whole library. Once the journal grows past
+    `config.JOURNAL_COMPACT_THRESHOLD` records, a background thread folds it into a new snapshot. Any journal left
+    behind (e.g. after a crash) is replayed and compacted at load time.
+
+    Tag edits resolve their entries through a map of source file -> entries, built the first time a category is
+    tagged, so they only touch the targeted entries instead of scanning the whole category.
+
     Attributes:
         __data (Dict): Internal data structure for storing JSON data.
+        __sources (Dict[Tuple[str, str], Dict[str, List[Dict]]]): Entries by source file per (group, category).
+        journaled (bool): Whether mutations are written to the journal instead of the JSON file.
     """
 
-    def __init__(self, json_file: str) -> None:
+    def __init__(self, json_file: str, journaled: bool = False) -> None:
         """
         Initialize the DataJson handler.
 
         :param json_file: Path to the JSON file.
         :type json_file: str
+        :param journaled: Append mutations to a journal instead of rewriting the JSON file.
+        :type journaled: bool
         """
         super().__init__(json_file)
 
+        self.journaled = journaled
+        self.__lock = threading.RLock()
+        self.__compaction_lock = threading.Lock()
+        self.__compaction_thread = None
+        self.__journal = None
+        self.__journal_seq = 0
+        self.__journal_records = 0
+        self.__sources = {}
+
         self.create_default_json()
-        self.__data = self.deserialize()
+        self.__data = self._load()
+
+    @property
+    def journal_file(self) -> str:
+        """
+        Get the path of the journal file.
+
+        :return: Path to the journal file.
+        :rtype: str
+        """
+        return f'{self.json_file}{config.JOURNAL_FILE_SUFFIX}'
+
+    @property
+    def _compacting_file(self) -> str:
+        """
+        Get the path of the journal being folded into a snapshot.
+
+        :return: Path to the compacting journal file.
+        :rtype: str
+        """
+        return f'{self.journal_file}.compacting'
 
     def create_default_json(self) -> None:
         """
@@ -142,30 +289,79 @@ class DataJson(JsonHandler):
         if not self.json_file:
             raise Exception('No valid JSON file found!, Cannot serialize data!')
 
-        if data_type == 'data':
-            if not group:
-                raise KeyError('"group" is must for data type "data"!')
+        if data_type == 'data' and not group:
+            raise KeyError('"group" is must for data type "data"!')
+
+        with self.__lock:
+            self._update_data(group, category, data, data_type, tag, source_files)
+            self._persist('update_data',
+                          group=group,
+                          category=category,
+                          data=data,
+                          data_type=data_type,
+                          tag=tag,
+                          source_files=source_files)
+
+    def _update_data(self,
+                     group: str = '',
+                     category: str = '',
+                     data: Optional[Dict] = None,
+                     data_type: str = 'data',
+                     tag: str = '',
+                     source_files: Optional[List[str]] = None) -> None:
+        """
+        Apply an `update_data` mutation to the in-memory data.
 
+        See `update_data` for the parameters.
+        """
+        if data_type == 'data':
             if not category:
                 self.__data[data_type][group] = {}
+                self._invalidate_sources(group)
 
             elif category and data and not tag:
                 self.__data[data_type][group][category].append(data)
+                self._index_sources(group, category, [data])
 
             elif category and not data and not tag:
                 self.__data[data_type][group][category] = []
+                self.__sources.pop((group, category), None)
 
             elif category and source_files and tag:
-                for item in self.__data[data_type][group][category]:
-
-                    if item['source'] in source_files and tag not in item['tags']:
+                for item in self._source_entries(group, category, source_files):
+                    if tag not in item['tags']:
                         item['tags'].append(tag)
 
         elif data_type == 'tags' and tag:
             if tag not in self.__data['tags']:
                 self.__data['tags'].append(tag)
 
-        self.serialize(self.__data)
+    def add_entries(self, group: str, category: str, entries: List[Dict]) -> None:
+        """
+        Add entries to a category with a single write: one serialization of the JSON file, or one journal record.
+
+        :param group: Group name.
+        :type group: str
+        :param category: Category name, it must exist.
+        :type category: str
+        :param entries: Entries to add.
+        :type entries: List[Dict]
+        """
+        if not entries:
+            return
+
+        with self.__lock:
+            self._add_entries(group, category, entries)
+            self._persist('add_entries', group=group, category=category, entries=entries)
+
+    def _add_entries(self, group: str, category: str, entries: List[Dict]) -> None:
+        """
+        Apply an `add_entries` mutation to the in-memory data.
+
+        See `add_entries` for the parameters.
+        """
+        self.__data['data'][group][category].extend(entries)
+        self._index_sources(group, category, entries)
 
     def remove_data(self, group: str, category: str, source_files: list, tag: str = None) -> None:
         """
@@ -180,22 +376,77 @@ class DataJson(JsonHandler):
         :param tag: Tag to remove.
         :type tag: Optional[str]
         """
-        items = []
+        with self.__lock:
+            self._remove_data(group, category, source_files, tag)
+            self._persist('remove_data', group=group, category=category, source_files=source_files, tag=tag)
 
-        for data in self.__data['data'][group][category]:
-            if data.get('source') in source_files and tag is None:
-                continue
+    def _remove_data(self, group: str, category: str, source_files: list, tag: str = None) -> None:
+        """
+        Apply a `remove_data` mutation to the in-memory data.
 
-            if tag and tag in data['tags']:
-                if data.get('source') in source_files:
+        See `remove_data` for the parameters.
+        """
+        if tag is not None:
+            for data in self._source_entries(group, category, source_files):
+                if tag in data['tags']:
                     data['tags'].remove(tag)
-                items.append(data)
-                continue
+            return
+
+        source_files = set(source_files)
+        self.__data['data'][group][category] = [
+            data for data in self.__data['data'][group][category] if data.get('source') not in source_files]
+
+        sources = self.__sources.get((group, category))
+        for source in source_files if sources is not None else ():
+            sources.pop(source, None)
 
-            items.append(data)
+    def _source_entries(self, group: str, category: str, source_files: List[str]) -> List[Dict]:
+        """
+        Get the entries of the given source files, indexing the category by source file on first use.
+
+        :param group: Group name.
+        :type group: str
+        :param category: Category name.
+        :type category: str
+        :param source_files: Source files.
+        :type source_files: List[str]
+        :return: Entries of the source files.
+        :rtype: List[Dict]
+        """
+        if (group, category) not in self.__sources:
+            self.__sources[(group, category)] = {}
+            self._index_sources(group, category, self.__data['data'][group][category])
+
+        sources = self.__sources[(group, category)]
+        return [data for source in set(source_files) for data in sources.get(source, ())]
 
-        self.__data['data'][group][category] = items
-        self.serialize(self.__data)
+    def _index_sources(self, group: str, category: str, entries: List[Dict]) -> None:
+        """
+        Add entries to the source file map of a category, if the category is indexed.
+
+        :param group: Group name.
+        :type group: str
+        :param category: Category name.
+        :type category: str
+        :param entries: Entries added to the category.
+        :type entries: List[Dict]
+        """
+        sources = self.__sources.get((group, category))
+        if sources is None:
+            return
+
+        for data in entries:
+            sources.setdefault(data['source'], []).append(data)
+
+    def _invalidate_sources(self, group: str) -> None:
+        """
+        Drop the source file maps of every category of a group.
+
+        :param group: Group name.
+        :type group: str
+        """
+        for key in [key for key in self.__sources if key[0] == group]:
+            self.__sources.pop(key)
 
     def remove_key(self,
                    group: str = '',
@@ -214,7 +465,20 @@ class DataJson(JsonHandler):
         :param tag: Tag to remove.
         :type tag: str
         """
+        with self.__lock:
+            self._remove_key(group, category, data_type, tag)
+            self._persist('remove_key', group=group, category=category, data_type=data_type, tag=tag)
 
+    def _remove_key(self,
+                    group: str = '',
+                    category: str = '',
+                    data_type: str = 'data',
+                    tag: str = '') -> None:
+        """
+        Apply a `remove_key` mutation to the in-memory data.
+
+        See `remove_key` for the parameters.
+        """
         if data_type == 'data':
             if not category:
                 self.__data[data_type].pop(group)
@@ -223,11 +487,11 @@ class DataJson(JsonHandler):
                     if re.match(rf"^%s(\|.*)?$" % category.replace('|', '\|'), item_key):
                         self.__data[data_type][group].pop(item_key)
 
+            self._invalidate_sources(group)
+
         elif data_type == 'tags' and tag in self.__data['tags']:
             self.__data['tags'].remove(tag)
 
-        self.serialize(self.__data)
-
     def update_key(self, group: str, category_to_replace: str, category_to_update: str) -> None:
         """
         Update a key in the JSON data.
@@ -239,6 +503,19 @@ class DataJson(JsonHandler):
         :param category_to_update: New category key.
         :type category_to_update: str
         """
+        with self.__lock:
+            self._update_key(group, category_to_replace, category_to_update)
+            self._persist('update_key',
+                          group=group,
+                          category_to_replace=category_to_replace,
+                          category_to_update=category_to_update)
+
+    def _update_key(self, group: str, category_to_replace: str, category_to_update: str) -> None:
+        """
+        Apply an `update_key` mutation to the in-memory data.
+
+        See `update_key` for the parameters.
+        """
         duplicate_data = {}
 
         for category, value in self.__data["data"][group].items():
@@ -248,21 +525,190 @@ class DataJson(JsonHandler):
             duplicate_data[renamed_category] = value
 
         self.__data["data"][group] = duplicate_data
-        self.serialize(self.__data)
-        self.refresh_data()
+        self._invalidate_sources(group)
 
-    def refresh_data(self, json_file: str = '') -> None:
+    def _persist(self, operation: str, **kwargs) -> None:
         """
-        Refresh the data from the JSON file.
+        Persist a mutation that has already been applied to the in-memory data.
 
-        :param json_file: Path to the JSON file.
-        :type json_file: str
+        In journaled mode the mutation is appended to the journal as a delta record, otherwise the whole data is
+        serialized into the JSON file.
+
+        :param operation: Name of the public method that performed the mutation.
+        :type operation: str
+        :param kwargs: Arguments of the mutation, replayed as-is at load time.
         """
-        if json_file:
-            self.json_file = json_file
+        if not self.journaled:
+            self.serialize(self.__data)
+            return
 
-        self.create_default_json()
+        if self.__journal is None:
+            _utilities.make_directory(self.journal_file)
+            self.__journal = open(self.journal_file, 'a')
+
+        self.__journal_seq += 1
+        self.__journal.write(json.dumps({'seq': self.__journal_seq, 'op': operation, 'args': kwargs}) + '\n')
+        self.__journal.flush()
+        os.fsync(self.__journal.fileno())
+
+        self.__journal_records += 1
+        if self.__journal_records >= config.JOURNAL_COMPACT_THRESHOLD:
+            self._start_compaction()
+
+    def _start_compaction(self) -> None:
+        """
+        Fold the journal into a new snapshot on a background thread, unless a compaction is already running.
+        """
+        if self.__compaction_thread and self.__compaction_thread.is_alive():
+            return
+
+        self.__compaction_thread = threading.Thread(target=self.compact, daemon=True)
+        self.__compaction_thread.start()
+
+    def compact(self) -> None:
+        """
+        Fold the journal into a new snapshot of the JSON file.
+
+        The snapshot is taken and the journal is rotated under the data lock, so mutations keep appending to a fresh
+        journal while the snapshot is written. The snapshot records the sequence number of the last folded record,
+        which makes the replay skip records that are already part of it if the process dies halfway through.
+        """
+        with self.__compaction_lock:
+            with self.__lock:
+                if self.__journal is None and not os.path.isfile(self.journal_file):
+                    return
+
+                snapshot = json.dumps(dict(self.__data, journal_seq=self.__journal_seq))
+                self._close_journal()
+                self._rotate_journal()
+                self.__journal_records = 0
+
+            self._write_snapshot(snapshot)
+            _utilities.delete_files(self._compacting_file)
+
+    def _rotate_journal(self) -> None:
+        """
+        Move the current journal aside so it can be folded into a snapshot.
+
+        Leftovers of a previously failed compaction are kept by appending the current journal to them.
+        """
+        if not os.path.isfile(self.journal_file):
+            return
+
+        if not os.path.isfile(self._compacting_file):
+            os.replace(self.journal_file, self._compacting_file)
+            return
+
+        with open(self._compacting_file, 'a') as compacting_, open(self.journal_file, 'r') as journal_:
+            shutil.copyfileobj(journal_, compacting_)
+        os.remove(self.journal_file)
+
+    def _write_snapshot(self, snapshot: str) -> None:
+        """
+        Atomically replace the JSON file with the given snapshot.
+
+        :param snapshot: Serialized data.
+        :type snapshot: str
+        """
+        _utilities.make_directory(self.json_file)
+        file_descriptor, temp_file = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(self.json_file) or None)
+
+        with os.fdopen(file_descriptor, 'w') as file_:
+            file_.write(snapshot)
+            file_.flush()
+            os.fsync(file_.fileno())
+
+        os.replace(temp_file, self.json_file)
+
+    def _close_journal(self) -> None:
+        """
+        Close the journal file handle, if open.
+        """
+        if self.__journal is not None:
+            self.__journal.close()
+            self.__journal = None
+
+    def _load(self) -> Dict:
+        """
+        Load the JSON file and replay any journal records that are newer than it.
+
+        If records were replayed, they are folded into the JSON file right away so the next load starts clean.
+
+        :return: Loaded data.
+        :rtype: Dict
+        """
         self.__data = self.deserialize()
+        self.__sources.clear()
+        self.__journal_seq = self.__data.pop('journal_seq', 0)
+        self.__journal_records = 0
+
+        replayed = False
+        for journal_file in (self._compacting_file, self.journal_file):
+            replayed = self._replay(journal_file) or replayed
+
+        if replayed:
+            self._write_snapshot(json.dumps(dict(self.__data, journal_seq=self.__journal_seq)))
+            _utilities.delete_files([self._compacting_file, self.journal_file])
+
+        return self.__data
+
+    def _replay(self, journal_file: str) -> bool:
+        """
+        Apply the records of a journal file to the in-memory data.
+
+        Records already contained in the snapshot are skipped. Reading stops at the first incomplete record,
+        which is what a crash during an append leaves behind.
+
+        :param journal_file: Path to the journal file.
+        :type journal_file: str
+        :return: True if the journal file existed, False otherwise.
+        :rtype: bool
+        """
+        if not os.path.isfile(journal_file):
+            return False
+
+        with open(journal_file, 'r') as file_:
+            for line in file_:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+
+                if record['seq'] <= self.__journal_seq:
+                    continue
+
+                getattr(self, f"_{record['op']}")(**record['args'])
+                self.__journal_seq = record['seq']
+
+        return True
+
+    def close(self) -> None:
+        """
+        Fold any pending journal records into the JSON file and release the journal.
+        """
+        if self.__compaction_thread:
+            self.__compaction_thread.join()
+
+        if self.journaled:
+            self.compact()
+
+        self._close_journal()
+
+    def refresh_data(self, data_file: str = '') -> None:
+        """
+        Refresh the data from the JSON file.
+
+        :param data_file: Path to the JSON file.
+        :type data_file: str
+        """
+        with self.__compaction_lock, self.__lock:
+            self._close_journal()
+
+            if data_file:
+                self.json_file = data_file
+
+            self.create_default_json()
+            self.__data = self._load()
 
     @property
     def data(self) -> dict or None:
@@ -282,7 +728,56 @@ class DataJson(JsonHandler):
         :return: List of tags.
         :rtype: List[str]
         """
-        return self.deserialize().get('tags')
+        return list(self.__data.get('tags'))
+
+    def groups(self) -> List[str]:
+        """
+        Get the group names.
+
+        :return: Group names.
+        :rtype: List[str]
+        """
+        return list(self.__data['data'])
+
+    def categories(self, group: str) -> List[str]:
+        """
+        Get the category names of a group.
+
+        :param group: Group name.
+        :type group: str
+        :return: Category names.
+        :rtype: List[str]
+        """
+        return list(self.__data['data'].get(group) or {})
+
+    def entries(self, group: str, category: str, tag: str = None, search_string: str = None) -> List[Dict]:
+        """
+        Get the entries of a category, optionally filtered by tag and by a search string in the source file name.
+
+        :param group: Group name.
+        :type group: str
+        :param category: Category name.
+        :type category: str
+        :param tag: Tag to filter by.
+        :type tag: Optional[str]
+        :param search_string: Case-insensitive string to search in source file names.
+        :type search_string: Optional[str]
+        :return: Matching entries.
+        :rtype: List[Dict]
+        """
+        category_data = self.__data['data'][group].get(category, [])
+
+        if not tag and not search_string:
+            return category_data
+
+        elif tag and not search_string:
+            return [data for data in category_data if tag in data['tags']]
+
+        elif not tag and search_string:
+            return [data for data in category_data if search_string.lower() in os.path.basename(data['source']).lower()]
+        else:
+            return [data for data in category_data
+                    if search_string.lower() in os.path.basename(data['source']).lower() and tag in data['tags']]
 
     def data_by_key(self, group: str, category: str = '') -> Union[Dict, List]:
         """
@@ -330,6 +825,14 @@ class Preferences:
         res_width (int): Default resolution width.
         res_height (int): Default resolution height.
         thumbnail (int): Thumbnail setting (0 or 1).
+        storage (str): Storage backend of the data file (one of `config.STORAGE_BACKENDS`).
+        grid (str): Thumbnail grid mode (one of `config.GRID_MODES`).
+        filmstrip (int): Whether conversions generate a filmstrip for the hover preview (0 or 1).
+        preview_mode (str): Hover preview interaction (one of `config.PREVIEW_MODES`).
+        thumbnail_source (str): File the thumbnails are extracted from (one of `config.THUMBNAIL_SOURCES`).
+        encoding_profile (str): Encoding profile of new proxies (one of `config.PROXY_ENCODING_PROFILES`).
+        auto_thread_count (int): Whether the conversions running at once and their ffmpeg threads are tuned to the
+                                 machine instead of using `thread_count` (0 or 1).
     """
     __slots__ = ('config',
                  '__rootPath',
@@ -338,7 +841,14 @@ class Preferences:
                  'thread_count',
                  'res_width',
                  'res_height',
-                 'thumbnail')
+                 'thumbnail',
+                 'storage',
+                 'grid',
+                 'filmstrip',
+                 'preview_mode',
+                 'thumbnail_source',
+                 'encoding_profile',
+                 'auto_thread_count')
 
     def __init__(self):
         """
@@ -357,6 +867,13 @@ class Preferences:
         self.res_width = None
         self.res_height = None
         self.thumbnail = None
+        self.storage = None
+        self.grid = None
+        self.filmstrip = None
+        self.preview_mode = None
+        self.thumbnail_source = None
+        self.encoding_profile = None
+        self.auto_thread_count = None
 
         self._update_attributes()
 
@@ -365,12 +882,14 @@ class Preferences:
         Update attributes from the preferences file.
 
         Reads the preferences file and updates the instance attributes.
-        If the file does not exist, default values are written.
+        If the file does not exist, default values are written. Preferences missing from an existing file get their
+        `upgrade_values`.
         """
         if not os.path.isfile(self.__preferences_file):
             self.write_default_values()
 
         preferences = self._read_settings()
+        upgrade_values = self.upgrade_values()
 
         self.proxy = preferences.get('proxy')
         self.data_file = preferences.get('data')
@@ -378,6 +897,13 @@ class Preferences:
         self.res_width = int(preferences.get('res_width'))
         self.res_height = int(preferences.get('res_height'))
         self.thumbnail = int(preferences.get('thumbnail'))
+        self.storage = preferences.get('storage', upgrade_values['storage'])
+        self.grid = preferences.get('grid', upgrade_values['grid'])
+        self.filmstrip = int(preferences.get('filmstrip', upgrade_values['filmstrip']))
+        self.preview_mode = preferences.get('preview_mode', upgrade_values['preview_mode'])
+        self.thumbnail_source = preferences.get('thumbnail_source', upgrade_values['thumbnail_source'])
+        self.encoding_profile = preferences.get('encoding_profile', upgrade_values['encoding_profile'])
+        self.auto_thread_count = int(preferences.get('auto_thread_count', upgrade_values['auto_thread_count']))
 
     def preferences(self) -> Dict[str, str]:
         """
@@ -391,7 +917,14 @@ class Preferences:
                 'thread_count': str(self.thread_count),
                 'res_width': str(self.res_width),
                 'res_height': str(self.res_height),
-                'thumbnail': self.thumbnail}
+                'thumbnail': self.thumbnail,
+                'storage': self.storage,
+                'grid': self.grid,
+                'filmstrip': str(self.filmstrip),
+                'preview_mode': self.preview_mode,
+                'thumbnail_source': self.thumbnail_source,
+                'encoding_profile': self.encoding_profile,
+                'auto_thread_count': str(self.auto_thread_count)}
 
     def update(self, data: Dict[str, str]) -> None:
         """
@@ -444,7 +977,33 @@ class Preferences:
                 'thread_count': '4',
                 'res_width': '520',
                 'res_height': '300',
-                'thumbnail': '1'}
+                'thumbnail': '1',
+                'storage': 'journal',
+                'grid': 'virtual',
+                'filmstrip': '1',
+                'preview_mode': 'play',
+                'thumbnail_source': 'proxy',
+                'encoding_profile': 'h264',
+                'auto_thread_count': '1'}
+
+    @staticmethod
+    def upgrade_values() -> Dict[str, str]:
+        """
+        Get the values of the preferences added after the first release, for preferences files written before them.
+
+        They keep the behaviour the file was written with (JSON storage, widget grid, no filmstrip, thumbnails from
+        the source, fixed thread count), new preferences files get `default_values` instead.
+
+        :return: Dictionary containing the values of the preferences missing from older preferences files.
+        :rtype: Dict[str, str]
+        """
+        return {'storage': 'json',
+                'grid': 'widgets',
+                'filmstrip': '0',
+                'preview_mode': 'play',
+                'thumbnail_source': 'source',
+                'encoding_profile': 'h264',
+                'auto_thread_count': '0'}
 
     def _write_preferences(self) -> None:
         """
@@ -0,0 +1,148 @@
+"""
+Summary:
+
+This module provides a small LRU cache of filtered thumbnail data, used by `tool_data.Data` so typing in the search
+box narrows the previous result instead of querying the whole category again.
+
+QueryCache:
+    Caches results by (group, category, tag, search string). A query whose search string contains a cached search
+    string for the same tag is answered by filtering that cached result, which can only shrink.
+"""
+
+# -------------------------------- built-in Modules ----------------------------------
+import os
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+# ------------------------------- ThirdParty Modules ---------------------------------
+
+# -------------------------------- Custom Modules ------------------------------------
+
+
+class QueryCache:
+    """
+    LRU cache of filtered thumbnail data with incremental narrowing of search results.
+
+    Attributes:
+        max_size (int): Maximum number of cached results.
+        hits (int): Queries answered from an identical cached query.
+        narrowed (int): Queries answered by filtering the result of a shorter cached query.
+        misses (int): Queries that had to be computed.
+        __results (OrderedDict): Cached results by (group, category, tag, lowercased search string).
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """
+        Initialize an empty cache.
+
+        :param max_size: Maximum number of cached results.
+        :type max_size: int
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.narrowed = 0
+        self.misses = 0
+        self.__results = OrderedDict()
+
+    def get(self,
+            group: str,
+            category: str,
+            tag: Optional[str],
+            search_string: Optional[str],
+            query: Callable[[], List[Dict]]) -> List[Dict]:
+        """
+        Get the result of a query, from the cache if possible.
+
+        :param group: Name of the group.
+        :type group: str
+        :param category: Name of the category.
+        :type category: str
+        :param tag: Tag filter of the query.
+        :type tag: Optional[str]
+        :param search_string: Search string filter of the query.
+        :type search_string: Optional[str]
+        :param query: Callable computing the result on a cache miss.
+        :type query: Callable[[], List[Dict]]
+        :return: Result of the query.
+        :rtype: List[Dict]
+        """
+        search_string = (search_string or '').lower()
+        key = (group, category, tag or '', search_string)
+
+        if key in self.__results:
+            self.hits += 1
+            self.__results.move_to_end(key)
+            return self.__results[key]
+
+        base_key = self._narrowest_base(key)
+        if base_key is not None:
+            self.narrowed += 1
+            result = [data for data in self.__results[base_key]
+                      if search_string in os.path.basename(data['source']).lower()]
+        else:
+            self.misses += 1
+            result = query()
+
+        self._store(key, result)
+        return result
+
+    def _narrowest_base(self, key: tuple) -> Optional[tuple]:
+        """
+        Get the cached query with the longest search string contained in the search string of a key.
+
+        :param key: Key of the new query.
+        :type key: tuple
+        :return: Key of the cached query, or None if there is none.
+        :rtype: Optional[tuple]
+        """
+        group, category, tag, search_string = key
+        base_key = None
+
+        for cached_key in self.__results:
+            if cached_key[:3] != (group, category, tag) or cached_key[3] not in search_string:
+                continue
+
+            if base_key is None or len(cached_key[3]) > len(base_key[3]):
+                base_key = cached_key
+
+        return base_key
+
+    def _store(self, key: tuple, result: List[Dict]) -> None:
+        """
+        Cache a result, evicting the least recently used results beyond `max_size`.
+
+        :param key: Key of the query.
+        :type key: tuple
+        :param result: Result of the query.
+        :type result: List[Dict]
+        """
+        self.__results[key] = result
+
+        while len(self.__results) > self.max_size:
+            self.__results.popitem(last=False)
+
+    def invalidate(self, group: str, category: str = '') -> None:
+        """
+        Drop the cached results of a category, or of a whole group.
+
+        :param group: Name of the group.
+        :type group: str
+        :param category: Name of the category. If empty, the whole group is dropped.
+        :type category: str
+        """
+        for key in list(self.__results):
+            if key[0] == group and (not category or key[1] == category):
+                self.__results.pop(key)
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        self.__results.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the cache counters.
+
+        :return: Number of hits, narrowed queries and misses.
+        :rtype: Dict[str, int]
+        """
+        return {'hits': self.hits, 'narrowed': self.narrowed, 'misses': self.misses}
@@ -0,0 +1,242 @@
+"""
+Summary:
+
+This module provides an in-memory trigram index over the lowercased source file basenames of the entries of each
+group, used by `tool_data.Data` to answer the thumbnail search bar queries without rescanning the category.
+
+SearchIndex:
+    Maps trigram -> set of entry ids per group. A substring query intersects the postings of its trigrams and only
+    verifies the remaining candidates. Groups are indexed lazily on their first query and are kept in sync
+    incrementally by the `Data` mutators. Queries can be limited to a category or run across the whole group.
+"""
+
+# -------------------------------- built-in Modules ----------------------------------
+import os
+from typing import Callable, Dict, Iterable, List, Optional
+
+# ------------------------------- ThirdParty Modules ---------------------------------
+
+# -------------------------------- Custom Modules ------------------------------------
+
+_GRAM_SIZE = 3
+
+
+def _grams(text: str) -> set:
+    """
+    Get the trigrams of a string.
+
+    :param text: String to split.
+    :type text: str
+    :return: Set of trigrams, empty if the string is shorter than a trigram.
+    :rtype: set
+    """
+    return {text[i:i + _GRAM_SIZE] for i in range(len(text) - _GRAM_SIZE + 1)}
+
+
+class _GroupIndex:
+    """
+    Trigram index of the entries of a single group.
+
+    Entry ids increase with insertion, so sorting ids restores the category order.
+
+    Attributes:
+        entries (Dict[int, Dict]): Entries by id.
+        basenames (Dict[int, str]): Lowercased source file basenames by id.
+        categories (Dict[str, Dict[int, None]]): Ordered entry ids by category.
+        sources (Dict[tuple, set]): Entry ids by (category, source file).
+        trigrams (Dict[str, set]): Entry ids by trigram of their basename.
+    """
+    __slots__ = ('entries', 'basenames', 'categories', 'sources', 'trigrams', '__next_id')
+
+    def __init__(self, categories: Dict[str, List[Dict]]) -> None:
+        """
+        Index the given categories.
+
+        :param categories: Entries by category, in category order.
+        :type categories: Dict[str, List[Dict]]
+        """
+        self.entries = {}
+        self.basenames = {}
+        self.categories = {}
+        self.sources = {}
+        self.trigrams = {}
+        self.__next_id = 0
+
+        for category, entries in categories.items():
+            self.categories[category] = {}
+
+            for entry in entries:
+                self.add(category, entry)
+
+    def add(self, category: str, entry: Dict) -> None:
+        """
+        Add an entry at the end of a category.
+
+        :param category: Name of the category.
+        :type category: str
+        :param entry: Entry to add.
+        :type entry: Dict
+        """
+        entry_id = self.__next_id
+        self.__next_id += 1
+
+        basename = os.path.basename(entry['source']).lower()
+        self.entries[entry_id] = entry
+        self.basenames[entry_id] = basename
+        self.categories.setdefault(category, {})[entry_id] = None
+        self.sources.setdefault((category, entry['source']), set()).add(entry_id)
+
+        for gram in _grams(basename):
+            self.trigrams.setdefault(gram, set()).add(entry_id)
+
+    def remove(self, category: str, source_files: Iterable[str]) -> None:
+        """
+        Remove the entries of the given source files from a category.
+
+        :param category: Name of the category.
+        :type category: str
+        :param source_files: Source files to remove.
+        :type source_files: Iterable[str]
+        """
+        for source in source_files:
+            for entry_id in self.sources.pop((category, source), ()):
+                self.entries.pop(entry_id)
+                self.categories[category].pop(entry_id)
+
+                for gram in _grams(self.basenames.pop(entry_id)):
+                    self.trigrams[gram].discard(entry_id)
+
+    def search(self, search_string: str, category: Optional[str] = None) -> List[int]:
+        """
+        Get the ids of the entries whose basename contains a string.
+
+        :param search_string: Lowercased string to search.
+        :type search_string: str
+        :param category: Limit the search to a category. If None, the whole group is searched.
+        :type category: Optional[str]
+        :return: Matching entry ids, in insertion order.
+        :rtype: List[int]
+        """
+        scope = self.categories.get(category, {}).keys() if category is not None else self.entries.keys()
+        grams = _grams(search_string)
+
+        if grams:
+            postings = sorted((self.trigrams.get(gram, set()) for gram in grams), key=len)
+            candidates = postings[0].intersection(*postings[1:])
+            candidates = candidates & scope if category is not None else candidates
+        else:
+            # too short for a trigram, verify the whole scope against the precomputed basenames
+            candidates = scope
+
+        return sorted(entry_id for entry_id in candidates if search_string in self.basenames[entry_id])
+
+
+class SearchIndex:
+    """
+    In-memory trigram index of the source file basenames per group.
+
+    Attributes:
+        __groups (Dict[str, _GroupIndex]): Indexed groups.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self.__groups = {}
+
+    def _group(self, group: str, loader: Callable[[], Dict[str, List[Dict]]]) -> _GroupIndex:
+        """
+        Get the index of a group, building it on first use.
+
+        :param group: Name of the group.
+        :type group: str
+        :param loader: Callable returning the entries of every category of the group.
+        :type loader: Callable[[], Dict[str, List[Dict]]]
+        :return: Index of the group.
+        :rtype: _GroupIndex
+        """
+        index = self.__groups.get(group)
+
+        if index is None:
+            index = self.__groups[group] = _GroupIndex(loader())
+        return index
+
+    def entries(self, group: str, category: str, loader: Callable[[], Dict[str, List[Dict]]]) -> List[Dict]:
+        """
+        Get the indexed entries of a category, in category order.
+
+        :param group: Name of the group.
+        :type group: str
+        :param category: Name of the category.
+        :type category: str
+        :param loader: Callable returning the entries of every category of the group.
+        :type loader: Callable[[], Dict[str, List[Dict]]]
+        :return: Entries of the category.
+        :rtype: List[Dict]
+        """
+        index = self._group(group, loader)
+        return [index.entries[entry_id] for entry_id in index.categories.get(category, {})]
+
+    def search(self,
+               group: str,
+               search_string: str,
+               loader: Callable[[], Dict[str, List[Dict]]],
+               category: Optional[str] = None) -> List[Dict]:
+        """
+        Get the entries whose source file basename contains a string, case-insensitively.
+
+        :param group: Name of the group.
+        :type group: str
+        :param search_string: String to search.
+        :type search_string: str
+        :param loader: Callable returning the entries of every category of the group.
+        :type loader: Callable[[], Dict[str, List[Dict]]]
+        :param category: Limit the search to a category. If None, every category of the group is searched.
+        :type category: Optional[str]
+        :return: Matching entries, in category order.
+        :rtype: List[Dict]
+        """
+        index = self._group(group, loader)
+        return [index.entries[entry_id] for entry_id in index.search(search_string.lower(), category)]
+
+    def add_entry(self, group: str, category: str, entry: Dict) -> None:
+        """
+        Add an entry to an indexed group.
+
+        :param group: Name of the group.
+        :type group: str
+        :param category: Name of the category.
+        :type category: str
+        :param entry: Entry to add.
+        :type entry: Dict
+        """
+        index = self.__groups.get(group)
+        if index is not None:
+            index.add(category, entry)
+
+    def remove_entries(self, group: str, category: str, source_files: List[str]) -> None:
+        """
+        Remove the entries of the given source files from an indexed group.
+
+        :param group: Name of the group.
+        :type group: str
+        :param category: Name of the category.
+        :type category: str
+        :param source_files: Source files to remove.
+        :type source_files: List[str]
+        """
+        index = self.__groups.get(group)
+        if index is not None:
+            index.remove(category, source_files)
+
+    def invalidate(self, group: str) -> None:
+        """
+        Drop the index of a group.
+
+        :param group: Name of the group.
+        :type group: str
+        """
+        self.__groups.pop(group, None)
+
+    def clear(self) -> None:
+        """Drop every index."""
+        self.__groups.clear()
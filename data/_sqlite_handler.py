@@ -0,0 +1,532 @@
+"""
+Summary:
+
+This module provides an SQLite storage backend for the library data, selectable from the preferences with the
+"sqlite" storage option. It includes:
+
+DataSQLite:
+    Implements `_handler.DataHandler` on top of an SQLite database with tables for groups, categories, entries, tags
+    and entry-tag links. Filtering by tag or source file name and tagging entries are indexed queries, and every
+    mutation only touches the affected rows instead of rewriting the whole library.
+
+migrate_json:
+    One-shot migration of an existing JSON data file (including a pending journal) into a new SQLite database.
+"""
+
+# -------------------------------- built-in Modules ----------------------------------
+import json
+import os
+import re
+import sqlite3
+from typing import Dict, Optional, List, Union
+
+# ------------------------------- ThirdParty Modules ---------------------------------
+
+# -------------------------------- Custom Modules ------------------------------------
+import _utilities
+from . import _handler
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS groups (
+    name TEXT PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS categories (
+    id INTEGER PRIMARY KEY,
+    group_name TEXT NOT NULL REFERENCES groups(name) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    UNIQUE (group_name, name)
+);
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    category_id INTEGER NOT NULL REFERENCES categories(id) ON DELETE CASCADE,
+    source TEXT NOT NULL,
+    basename TEXT NOT NULL,
+    proxy TEXT,
+    metadata TEXT
+);
+CREATE TABLE IF NOT EXISTS tags (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    is_listed INTEGER NOT NULL DEFAULT 1
+);
+CREATE TABLE IF NOT EXISTS entry_tags (
+    entry_id INTEGER NOT NULL REFERENCES entries(id) ON DELETE CASCADE,
+    tag_id INTEGER NOT NULL REFERENCES tags(id) ON DELETE CASCADE,
+    PRIMARY KEY (entry_id, tag_id)
+);
+CREATE INDEX IF NOT EXISTS idx_entries_category_source ON entries(category_id, source);
+CREATE INDEX IF NOT EXISTS idx_entries_basename ON entries(basename);
+CREATE INDEX IF NOT EXISTS idx_entry_tags_tag ON entry_tags(tag_id);
+"""
+
+_ENTRY_COLUMNS = """
+    e.proxy,
+    e.source,
+    e.metadata,
+    (SELECT json_group_array(name) FROM (
+        SELECT t.name FROM entry_tags et JOIN tags t ON t.id = et.tag_id
+        WHERE et.entry_id = e.id ORDER BY et.rowid)) AS tags
+"""
+
+
+class DataSQLite(_handler.DataHandler):
+    """
+    SQLite storage backend for groups, categories, entries and tags.
+
+    Groups, categories and entries keep their insertion order. The source file basename is stored lowercased so
+    search queries do not need to recompute it. Tags removed from the tag list stay attached to the entries, like
+    in the JSON backend.
+
+    Attributes:
+        sqlite_file (str): Path to the SQLite database.
+        __connection (sqlite3.Connection): Open connection to the database.
+    """
+
+    def __init__(self, sqlite_file: str) -> None:
+        """
+        Initialize the DataSQLite handler and create the schema if needed.
+
+        :param sqlite_file: Path to the SQLite database.
+        :type sqlite_file: str
+        :raises IOError: If no valid database file is provided.
+        """
+        if not sqlite_file:
+            raise IOError('No valid sqlite file assigned!')
+
+        self.sqlite_file = sqlite_file
+        self.__connection = None
+        self._connect()
+
+    def _connect(self) -> None:
+        """
+        Open the database connection and create the schema.
+        """
+        _utilities.make_directory(self.sqlite_file)
+
+        self.__connection = sqlite3.connect(self.sqlite_file)
+        self.__connection.execute('PRAGMA foreign_keys = ON')
+        self.__connection.execute('PRAGMA journal_mode = WAL')
+        self.__connection.execute('PRAGMA synchronous = NORMAL')
+        self.__connection.executescript(_SCHEMA)
+
+    def update_data(self,
+                    group: str = '',
+                    category: str = '',
+                    data: Optional[Dict] = None,
+                    data_type: str = 'data',
+                    tag: str = '',
+                    source_files: Optional[List[str]] = None) -> None:
+        """
+        Update data in the database.
+
+        :param group: Group name.
+        :type group: str
+        :param category: Category name.
+        :type category: str
+        :param data: Data to add.
+        :type data: Optional[Dict]
+        :param data_type: Type of data ('data' or 'tags').
+        :type data_type: str
+        :param tag: Tag to add.
+        :type tag: str
+        :param source_files: List of source files.
+        :type source_files: Optional[List[str]]
+        :raises KeyError: If required arguments are missing or the category does not exist.
+        """
+        with self.__connection:
+            if data_type == 'data':
+                if not group:
+                    raise KeyError('"group" is must for data type "data"!')
+
+                if not category:
+                    self.__connection.execute('INSERT OR IGNORE INTO groups (name) VALUES (?)', (group,))
+                    self.__connection.execute('DELETE FROM categories WHERE group_name = ?', (group,))
+
+                elif category and data and not tag:
+                    self._insert_entry(self._category_id(group, category), data)
+
+                elif category and not data and not tag:
+                    self.__connection.execute(
+                        'INSERT OR IGNORE INTO categories (group_name, name) VALUES (?, ?)', (group, category))
+                    self.__connection.execute(
+                        'DELETE FROM entries WHERE category_id = ?', (self._category_id(group, category),))
+
+                elif category and source_files and tag:
+                    category_id = self._category_id(group, category)
+                    tag_id = self._tag_id(tag, is_listed=False)
+                    self.__connection.executemany(
+                        'INSERT OR IGNORE INTO entry_tags (entry_id, tag_id) '
+                        'SELECT id, ? FROM entries WHERE category_id = ? AND source = ?',
+                        ((tag_id, category_id, source) for source in source_files))
+
+            elif data_type == 'tags' and tag:
+                self._tag_id(tag, is_listed=True)
+
+    def add_entries(self, group: str, category: str, entries: List[Dict]) -> None:
+        """
+        Add entries to a category in a single transaction.
+
+        :param group: Group name.
+        :type group: str
+        :param category: Category name, it must exist.
+        :type category: str
+        :param entries: Entries to add.
+        :type entries: List[Dict]
+        :raises KeyError: If the category does not exist.
+        """
+        with self.__connection:
+            category_id = self._category_id(group, category)
+            for entry in entries:
+                self._insert_entry(category_id, entry)
+
+    def _insert_entry(self, category_id: int, data: Dict) -> None:
+        """
+        Insert an entry and its tags into a category.
+
+        :param category_id: Row id of the category.
+        :type category_id: int
+        :param data: Entry to insert.
+        :type data: Dict
+        """
+        cursor = self.__connection.execute(
+            'INSERT INTO entries (category_id, source, basename, proxy, metadata) VALUES (?, ?, ?, ?, ?)',
+            (category_id,
+             data['source'],
+             os.path.basename(data['source']).lower(),
+             data.get('proxy'),
+             json.dumps(data.get('metadata', {}))))
+
+        for tag in data.get('tags', []):
+            self.__connection.execute(
+                'INSERT OR IGNORE INTO entry_tags (entry_id, tag_id) VALUES (?, ?)',
+                (cursor.lastrowid, self._tag_id(tag, is_listed=False)))
+
+    def _category_id(self, group: str, category: str) -> int:
+        """
+        Get the row id of a category.
+
+        :param group: Group name.
+        :type group: str
+        :param category: Category name.
+        :type category: str
+        :return: Row id of the category.
+        :rtype: int
+        :raises KeyError: If the category does not exist.
+        """
+        row = self.__connection.execute(
+            'SELECT id FROM categories WHERE group_name = ? AND name = ?', (group, category)).fetchone()
+
+        if row is None:
+            raise KeyError(category)
+        return row[0]
+
+    def _tag_id(self, tag: str, is_listed: bool) -> int:
+        """
+        Get the row id of a tag, creating it if needed.
+
+        :param tag: Tag name.
+        :type tag: str
+        :param is_listed: Add the tag to the tag list. An already listed tag is never unlisted.
+        :type is_listed: bool
+        :return: Row id of the tag.
+        :rtype: int
+        """
+        self.__connection.execute(
+            'INSERT OR IGNORE INTO tags (name, is_listed) VALUES (?, ?)', (tag, int(is_listed)))
+        if is_listed:
+            self.__connection.execute('UPDATE tags SET is_listed = 1 WHERE name = ?', (tag,))
+
+        return self.__connection.execute('SELECT id FROM tags WHERE name = ?', (tag,)).fetchone()[0]
+
+    def remove_data(self, group: str, category: str, source_files: list, tag: str = None) -> None:
+        """
+        Remove entries, or a tag from entries.
+
+        :param group: Group name.
+        :type group: str
+        :param category: Category name.
+        :type category: str
+        :param source_files: List of source files.
+        :type source_files: List[str]
+        :param tag: Tag to remove. If None, the entries themselves are removed.
+        :type tag: Optional[str]
+        """
+        with self.__connection:
+            category_id = self._category_id(group, category)
+
+            if tag is None:
+                self.__connection.executemany(
+                    'DELETE FROM entries WHERE category_id = ? AND source = ?',
+                    ((category_id, source) for source in source_files))
+                return
+
+            self.__connection.executemany(
+                'DELETE FROM entry_tags '
+                'WHERE tag_id = (SELECT id FROM tags WHERE name = ?) '
+                'AND entry_id IN (SELECT id FROM entries WHERE category_id = ? AND source = ?)',
+                ((tag, category_id, source) for source in source_files))
+
+    def remove_key(self,
+                   group: str = '',
+                   category: str = '',
+                   data_type: str = 'data',
+                   tag: str = '') -> None:
+        """
+        Remove a group, a category with its sub-categories, or a tag from the tag list.
+
+        :param group: Group name.
+        :type group: str
+        :param category: Category key.
+        :type category: str
+        :param data_type: Type of data ('data' or 'tags').
+        :type data_type: str
+        :param tag: Tag to remove.
+        :type tag: str
+        """
+        with self.__connection:
+            if data_type == 'data':
+                if not category:
+                    self.__connection.execute('DELETE FROM groups WHERE name = ?', (group,))
+                else:
+                    self.__connection.execute(
+                        "DELETE FROM categories WHERE group_name = ? "
+                        "AND (name = ? OR substr(name, 1, length(?) + 1) = ? || '|')",
+                        (group, category, category, category))
+
+            elif data_type == 'tags' and tag:
+                self.__connection.execute('UPDATE tags SET is_listed = 0 WHERE name = ?', (tag,))
+
+    def update_key(self, group: str, category_to_replace: str, category_to_update: str) -> None:
+        """
+        Rename a category, following the same key matching as `DataJson.update_key`.
+
+        :param group: Group name.
+        :type group: str
+        :param category_to_replace: Category key to replace.
+        :type category_to_replace: str
+        :param category_to_update: New category key.
+        :type category_to_update: str
+        """
+        pattern = r"^%s(\|.*)?$" % category_to_replace.replace('|', '\|')
+        renamed = {}
+
+        for category_id, category in self.__connection.execute(
+                'SELECT id, name FROM categories WHERE group_name = ? ORDER BY id', (group,)):
+            renamed[re.sub(pattern, category_to_update, category)] = (category_id, category)
+
+        if not renamed:
+            return
+
+        with self.__connection:
+            kept_ids = [category_id for category_id, _ in renamed.values()]
+            self.__connection.execute(
+                f"DELETE FROM categories WHERE group_name = ? AND id NOT IN ({','.join('?' * len(kept_ids))})",
+                (group, *kept_ids))
+
+            # move renamed categories out of the way first, so the unique constraint holds in between
+            changed = [(new_name, category_id)
+                       for new_name, (category_id, category) in renamed.items() if new_name != category]
+            self.__connection.executemany(
+                'UPDATE categories SET name = ? WHERE id = ?',
+                ((f'\0{category_id}', category_id) for _, category_id in changed))
+            self.__connection.executemany('UPDATE categories SET name = ? WHERE id = ?', changed)
+
+    def import_data(self, data: Dict, tags: List[str]) -> None:
+        """
+        Bulk insert groups, categories, entries and tags in a single transaction.
+
+        :param data: Data as {group: {category: [entries]}}.
+        :type data: Dict
+        :param tags: Tags to add to the tag list.
+        :type tags: List[str]
+        """
+        with self.__connection:
+            for tag in tags:
+                self._tag_id(tag, is_listed=True)
+
+            for group, categories in data.items():
+                self.__connection.execute('INSERT OR IGNORE INTO groups (name) VALUES (?)', (group,))
+
+                for category, entries in categories.items():
+                    self.__connection.execute(
+                        'INSERT OR IGNORE INTO categories (group_name, name) VALUES (?, ?)', (group, category))
+                    category_id = self._category_id(group, category)
+
+                    for entry in entries:
+                        self._insert_entry(category_id, entry)
+
+    def refresh_data(self, data_file: str = '') -> None:
+        """
+        Reopen the database, optionally switching to another file.
+
+        :param data_file: Path to the SQLite database.
+        :type data_file: str
+        """
+        self.close()
+
+        if data_file:
+            self.sqlite_file = data_file
+        self._connect()
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        if self.__connection is not None:
+            self.__connection.close()
+            self.__connection = None
+
+    def groups(self) -> List[str]:
+        """
+        Get the group names.
+
+        :return: Group names.
+        :rtype: List[str]
+        """
+        return [row[0] for row in self.__connection.execute('SELECT name FROM groups ORDER BY rowid')]
+
+    def categories(self, group: str) -> List[str]:
+        """
+        Get the category names of a group.
+
+        :param group: Group name.
+        :type group: str
+        :return: Category names.
+        :rtype: List[str]
+        """
+        return [row[0] for row in self.__connection.execute(
+            'SELECT name FROM categories WHERE group_name = ? ORDER BY id', (group,))]
+
+    def entries(self, group: str, category: str, tag: str = None, search_string: str = None) -> List[Dict]:
+        """
+        Get the entries of a category, optionally filtered by tag and by a search string in the source file name.
+
+        :param group: Group name.
+        :type group: str
+        :param category: Category name.
+        :type category: str
+        :param tag: Tag to filter by.
+        :type tag: Optional[str]
+        :param search_string: Case-insensitive string to search in source file names.
+        :type search_string: Optional[str]
+        :return: Matching entries.
+        :rtype: List[Dict]
+        """
+        query = (f'SELECT {_ENTRY_COLUMNS} FROM entries e JOIN categories c ON c.id = e.category_id '
+                 f'WHERE c.group_name = ? AND c.name = ?')
+        parameters = [group, category]
+
+        if tag:
+            query += (' AND e.id IN (SELECT et.entry_id FROM entry_tags et JOIN tags t ON t.id = et.tag_id '
+                      'WHERE t.name = ?)')
+            parameters.append(tag)
+
+        if search_string:
+            query += ' AND instr(e.basename, ?) > 0'
+            parameters.append(search_string.lower())
+
+        return [self._entry(row) for row in self.__connection.execute(query + ' ORDER BY e.id', parameters)]
+
+    @staticmethod
+    def _entry(row: tuple) -> Dict:
+        """
+        Build an entry dictionary from a result row.
+
+        :param row: Row with proxy, source, metadata and tags columns.
+        :type row: tuple
+        :return: Entry dictionary.
+        :rtype: Dict
+        """
+        proxy, source, metadata, tags = row
+        return {'proxy': proxy, 'source': source, 'metadata': json.loads(metadata or '{}'), 'tags': json.loads(tags)}
+
+    @property
+    def data(self) -> dict or None:
+        """
+        Get the whole data. This materializes every entry and is only meant for exports.
+
+        :return: Data as {group: {category: [entries]}}.
+        :rtype: Dict
+        """
+        return {group: self.data_by_key(group) for group in self.groups()}
+
+    @property
+    def tags(self) -> list:
+        """
+        Get the tag list.
+
+        :return: List of tags.
+        :rtype: List[str]
+        """
+        return [row[0] for row in self.__connection.execute('SELECT name FROM tags WHERE is_listed = 1 ORDER BY id')]
+
+    def data_by_key(self, group: str, category: str = '') -> Union[Dict, List]:
+        """
+        Get data by category group and item key.
+
+        :param group: Category group key.
+        :type group: str
+        :param category: Category item key.
+        :type category: str
+        :return: Entries of the category, or the categories of the group with their entries.
+        :rtype: Union[Dict, List]
+        """
+        if category:
+            return self.entries(group, category)
+
+        return {category_: self.entries(group, category_) for category_ in self.categories(group)}
+
+    def is_category_item_exists(self, group: str, category: str) -> bool:
+        """
+        Check if a category holds any entry.
+
+        :param group: Category group key.
+        :type group: str
+        :param category: Category item key.
+        :type category: str
+        :return: True if the category holds entries, False otherwise.
+        :rtype: bool
+        """
+        return self.__connection.execute(
+            'SELECT EXISTS (SELECT 1 FROM entries e JOIN categories c ON c.id = e.category_id '
+            'WHERE c.group_name = ? AND c.name = ?)', (group, category)).fetchone()[0] == 1
+
+
+def migrate_json(json_file: str, sqlite_file: str) -> None:
+    """
+    Migrate a JSON data file into a new SQLite database in a single transaction.
+
+    The JSON file is loaded through `_handler.DataJson`, so a pending journal is replayed before migrating.
+    The JSON file itself is left untouched. The database is built in a temporary file that is only renamed into place
+    once the migration succeeded, so a failed migration leaves no partial database behind and is retried on the next
+    start.
+
+    :param json_file: Path to the JSON data file.
+    :type json_file: str
+    :param sqlite_file: Path to the SQLite database to create.
+    :type sqlite_file: str
+    :raises IOError: If the SQLite database already exists.
+    """
+    if os.path.isfile(sqlite_file):
+        raise IOError(f'SQLite database already exists: {sqlite_file}')
+
+    temp_file = f'{sqlite_file}.migrating'
+    temp_files = [temp_file, f'{temp_file}-wal', f'{temp_file}-shm', f'{temp_file}-journal']
+    _utilities.delete_files([file for file in temp_files if os.path.exists(file)])
+
+    try:
+        json_data = _handler.DataJson(json_file)
+        sqlite_data = DataSQLite(temp_file)
+
+        try:
+            sqlite_data.import_data({group: json_data.data_by_key(group) for group in json_data.groups()},
+                                    json_data.tags)
+        finally:
+            json_data.close()
+            sqlite_data.close()
+
+        os.replace(temp_file, sqlite_file)
+
+    except BaseException:
+        _utilities.delete_files([file for file in temp_files if os.path.exists(file)])
+        raise
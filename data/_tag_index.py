@@ -0,0 +1,227 @@
+"""
+Summary:
+
+This module provides an in-memory inverted tag index for the entries of each category, used by `tool_data.Data`
+to filter thumbnails by tag and to apply bulk tag edits without scanning the whole category.
+
+TagIndex:
+    Maps tag -> set of entry ids per (group, category). Categories are indexed lazily the first time they are
+    queried and are kept in sync by the `Data` mutators afterwards.
+"""
+
+# -------------------------------- built-in Modules ----------------------------------
+from typing import Callable, Dict, Iterable, List, Set
+
+# ------------------------------- ThirdParty Modules ---------------------------------
+
+# -------------------------------- Custom Modules ------------------------------------
+
+
+class _CategoryIndex:
+    """
+    Inverted tag index of a single category.
+
+    Entry ids increase with insertion, so sorting ids restores the category order.
+
+    Attributes:
+        entries (Dict[int, Dict]): Entries by id.
+        sources (Dict[str, Set[int]]): Entry ids by source file.
+        tags (Dict[str, Set[int]]): Entry ids by tag.
+    """
+    __slots__ = ('entries', 'sources', 'tags', '__next_id')
+
+    def __init__(self, entries: Iterable[Dict]) -> None:
+        """
+        Index the given entries.
+
+        :param entries: Entries of the category, in category order.
+        :type entries: Iterable[Dict]
+        """
+        self.entries = {}
+        self.sources = {}
+        self.tags = {}
+        self.__next_id = 0
+
+        for entry in entries:
+            self.add(entry)
+
+    def add(self, entry: Dict) -> None:
+        """
+        Add an entry at the end of the category.
+
+        :param entry: Entry to add.
+        :type entry: Dict
+        """
+        entry_id = self.__next_id
+        self.__next_id += 1
+
+        self.entries[entry_id] = entry
+        self.sources.setdefault(entry['source'], set()).add(entry_id)
+        for tag in entry['tags']:
+            self.tags.setdefault(tag, set()).add(entry_id)
+
+    def ids(self, source_files: Iterable[str]) -> Set[int]:
+        """
+        Get the ids of the entries of the given source files.
+
+        :param source_files: Source files.
+        :type source_files: Iterable[str]
+        :return: Entry ids.
+        :rtype: Set[int]
+        """
+        return set().union(*(self.sources.get(source, ()) for source in source_files))
+
+
+class TagIndex:
+    """
+    In-memory inverted index of tag -> entry ids per (group, category).
+
+    Every operation only touches the given source files or the entries holding the given tag, so its cost is
+    proportional to the result rather than to the category size.
+
+    Attributes:
+        __categories (Dict[Tuple[str, str], _CategoryIndex]): Indexed categories.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self.__categories = {}
+
+    def entries(self, group: str, category: str, tag: str, loader: Callable[[], List[Dict]]) -> List[Dict]:
+        """
+        Get the entries of a category holding a tag, in category order.
+
+        :param group: Name of the group.
+        :type group: str
+        :param category: Name of the category.
+        :type category: str
+        :param tag: Tag to filter by.
+        :type tag: str
+        :param loader: Callable returning all entries of the category, used if the category is not indexed yet.
+        :type loader: Callable[[], List[Dict]]
+        :return: Entries holding the tag.
+        :rtype: List[Dict]
+        """
+        index = self.__categories.get((group, category))
+
+        if index is None:
+            index = self.__categories[(group, category)] = _CategoryIndex(loader())
+
+        return [index.entries[entry_id] for entry_id in sorted(index.tags.get(tag, ()))]
+
+    def create_tag(self, tag: str) -> None:
+        """
+        Register a new tag in every indexed category.
+
+        :param tag: Name of the tag.
+        :type tag: str
+        """
+        for index in self.__categories.values():
+            index.tags.setdefault(tag, set())
+
+    def add_entry(self, group: str, category: str, entry: Dict) -> None:
+        """
+        Add an entry to an indexed category.
+
+        :param group: Name of the group.
+        :type group: str
+        :param category: Name of the category.
+        :type category: str
+        :param entry: Entry to add.
+        :type entry: Dict
+        """
+        index = self.__categories.get((group, category))
+        if index is not None:
+            index.add(entry)
+
+    def remove_entries(self, group: str, category: str, source_files: List[str]) -> None:
+        """
+        Remove the entries of the given source files from an indexed category.
+
+        :param group: Name of the group.
+        :type group: str
+        :param category: Name of the category.
+        :type category: str
+        :param source_files: Source files to remove.
+        :type source_files: List[str]
+        """
+        index = self.__categories.get((group, category))
+        if index is None:
+            return
+
+        for entry_id in index.ids(source_files):
+            entry = index.entries.pop(entry_id)
+            index.sources[entry['source']].discard(entry_id)
+
+            for tag in entry['tags']:
+                index.tags[tag].discard(entry_id)
+
+    def add_tag(self, group: str, category: str, source_files: List[str], tag: str) -> None:
+        """
+        Add a tag to the entries of the given source files.
+
+        :param group: Name of the group.
+        :type group: str
+        :param category: Name of the category.
+        :type category: str
+        :param source_files: Source files to tag.
+        :type source_files: List[str]
+        :param tag: Tag to add.
+        :type tag: str
+        """
+        index = self.__categories.get((group, category))
+        if index is None:
+            return
+
+        tagged = index.tags.setdefault(tag, set())
+        for entry_id in index.ids(source_files) - tagged:
+            tagged.add(entry_id)
+
+            entry_tags = index.entries[entry_id]['tags']
+            if tag not in entry_tags:
+                entry_tags.append(tag)
+
+    def remove_tag(self, group: str, category: str, source_files: List[str], tag: str) -> None:
+        """
+        Remove a tag from the entries of the given source files.
+
+        :param group: Name of the group.
+        :type group: str
+        :param category: Name of the category.
+        :type category: str
+        :param source_files: Source files to untag.
+        :type source_files: List[str]
+        :param tag: Tag to remove.
+        :type tag: str
+        """
+        index = self.__categories.get((group, category))
+        if index is None:
+            return
+
+        tagged = index.tags.get(tag, set())
+        for entry_id in index.ids(source_files) & tagged:
+            tagged.discard(entry_id)
+
+            entry_tags = index.entries[entry_id]['tags']
+            if tag in entry_tags:
+                entry_tags.remove(tag)
+
+    def invalidate(self, group: str, category: str = '') -> None:
+        """
+        Drop the index of a category and its sub-categories, or of a whole group.
+
+        :param group: Name of the group.
+        :type group: str
+        :param category: Name of the category. If empty, the whole group is dropped.
+        :type category: str
+        """
+        for group_, category_ in list(self.__categories):
+            if group_ != group:
+                continue
+
+            if not category or category_ == category or category_.startswith(f'{category}|'):
+                self.__categories.pop((group_, category_))
+
+    def clear(self) -> None:
+        """Drop every index."""
+        self.__categories.clear()
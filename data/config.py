@@ -11,3 +11,64 @@ SUPPORTED_VIDEO_FORMATS = (".mov", ".avi", ".mp4")
 DATA_FILE_NAME = 'data.json'
 THUMBNAIL_FORMAT = '.png'
 PROXY_FORMAT = '.mov'
+PARTIAL_PROXY_SUFFIX = '.partial'
+
+STORAGE_BACKENDS = ('journal', 'json', 'sqlite')
+SQLITE_FILE_SUFFIX = '.db'
+JOURNAL_FILE_SUFFIX = '.journal'
+JOURNAL_COMPACT_THRESHOLD = 500
+
+QUERY_CACHE_SIZE = 32
+
+GRID_MODES = ('virtual', 'widgets')
+
+PIXMAP_CACHE_BUDGET_MB = 256
+PIXMAP_CACHE_STAT_TTL = 5
+IMAGE_LOADER_THREADS = 2
+THUMBNAIL_LOAD_FRAME_BUDGET_MS = 12
+
+PREVIEW_FRAME_CACHE_CLIPS = 32
+PREVIEW_FRAME_CACHE_MB = 256
+PREVIEW_FRAME_QUEUE_SIZE = 4
+PREVIEW_PREFETCH_SECONDS = 1
+PREVIEW_PREFETCH_MAX_CLIPS = 24
+PREVIEW_PREFETCH_THREADS = 1
+PREVIEW_PREFETCH_IDLE_MS = 400
+
+FILMSTRIP_FRAMES = 36
+FILMSTRIP_TILE_WIDTH = 320
+FILMSTRIP_SUFFIX = '_filmstrip.jpg'
+FILMSTRIP_INFO_SUFFIX = '_filmstrip.json'
+KEYFRAMES_SUFFIX = '_keyframes.json'
+
+PREVIEW_MODES = ('play', 'scrub')
+THUMBNAIL_SOURCES = ('proxy', 'source')
+PROXY_ENCODING_PROFILES = ('h264', 'h264_short_gop', 'h264_intra', 'mjpeg')
+PROXY_SHORT_GOP_SIZE = 12
+PROXY_MJPEG_QUALITY = 3
+
+SINGLE_PASS_CONVERSION = True
+METADATA_CACHE_FILE_NAME = 'metadata_cache.db'
+METADATA_PROBE_WORKERS = 4
+METADATA_STORE_BATCH_SIZE = 8
+IMAGE_SEQUENCE_FPS = 25
+CONVERSION_PRIORITY_DEBOUNCE_MS = 200
+CONVERSION_THROUGHPUT_WINDOW_S = 60
+CONVERSION_CPUS_PER_JOB = 2
+CONVERSION_TUNE_INTERVAL_S = 10
+CONVERSION_TUNE_TOLERANCE = 0.05
+CONVERSION_TUNE_HOLD_INTERVALS = 6
+CONVERSION_OVERLOAD_FACTOR = 1.5
+FFMPEG_LOG_LINES = 50
+FFMPEG_LINE_LIMIT = 4096
+FFMPEG_TIMEOUT_S = 120
+FFMPEG_TIMEOUT_PER_FRAME_S = 0.5
+FFMPEG_STALL_TIMEOUT_S = 60
+FFMPEG_OVERTIME_STALL_S = 10
+FFMPEG_WATCHDOG_INTERVAL_S = 1
+FFMPEG_RETRIES = 2
+FFMPEG_RETRY_BACKOFF_S = 2
+FFPROBE_TIMEOUT_S = 30
+INGEST_BATCH_SIZE = 10
+
+FILTER_DEBOUNCE_MS = 150
@@ -2,8 +2,8 @@
 Summary:
 
 The Data class is a utility for managing structured data, including groups, categories, tags, and thumbnail metadata.
-It interacts with a JSON-based data storage system (via DataJson) and application preferences (via Preferences) to
-provide a clean and efficient interface for data manipulation.
+It interacts with a pluggable data storage backend (DataJson or DataSQLite, selected by the "storage" preference)
+and application preferences (via Preferences) to provide a clean and efficient interface for data manipulation.
 
 Key Features:
 
@@ -18,37 +18,50 @@ Key Features:
     Thumbnail Data Management:
         Add thumbnail metadata (e.g., source file, proxy file, resolution) to categories.
         Retrieve and filter thumbnail data by tags or search strings.
+        Search source file names through an in-memory trigram index (JSON storage) or the indexed queries of the
+        SQLite storage, per category or across a group.
+        Cache filtered results and narrow them while a search string is being typed.
 
     Tag Management:
         Create, add, and remove tags.
         Associate tags with specific thumbnail data entries.
+        Filter and edit tags through an in-memory inverted tag index (JSON storage) or the indexed queries of the
+        SQLite storage.
 
     Data Refresh:
-        Reload data from the JSON file to reflect changes made externally.
+        Reload data from the storage backend to reflect changes made externally or a changed storage preference.
 """
 
 # -------------------------------- built-in Modules ----------------------------------
 import os
-from typing import Generator, Dict, List
+from typing import Callable, Generator, Dict, List
 
 # ------------------------------- ThirdParty Modules ---------------------------------
 
 # -------------------------------- Custom Modules ------------------------------------
 from . import _handler
+from . import _query_cache
+from . import _search_index
+from . import _sqlite_handler
+from . import _tag_index
+from . import config
 
 
 class Data:
     """
     A class for managing data operations, including groups, categories, tags, and thumbnails.
 
-    This class provides methods to interact with the JSON data structure managed by `DataJson`
+    This class provides methods to interact with the data managed by a `_handler.DataHandler` storage backend
     and application preferences managed by `Preferences`.
 
     Attributes:
         preferences (_handler.Preferences): Instance of the Preferences class.
-        data_obj (_handler.DataJson): Instance of the DataJson class.
-        __data (Dict): Internal data structure for storing JSON data.
-        __tags (List[str]): List of tags from the JSON data.
+        data_obj (_handler.DataHandler): Storage backend selected by the "storage" preference.
+        __tags (List[str]): List of tags from the storage backend.
+        __tag_index (_tag_index.TagIndex): Inverted tag index of the queried categories, JSON storage only.
+        __search_index (_search_index.SearchIndex): Trigram index of the source file names of the queried groups,
+                                                    JSON storage only.
+        __query_cache (_query_cache.QueryCache): Cache of filtered thumbnail data.
     """
 
     def __init__(self):
@@ -57,9 +70,33 @@ class Data:
         Loads preferences and initializes the data object.
         """
         self.preferences = _handler.Preferences()
-        self.data_obj = _handler.DataJson(self.preferences.data_file)
-        self.__data = self.data_obj.data
+        self.data_obj = self._create_data_obj()
         self.__tags = self.data_obj.tags
+        self.__tag_index = _tag_index.TagIndex()
+        self.__search_index = _search_index.SearchIndex()
+        self.__query_cache = _query_cache.QueryCache(config.QUERY_CACHE_SIZE)
+
+    def _create_data_obj(self) -> _handler.DataHandler:
+        """
+        Create the storage backend selected by the "storage" preference.
+
+        The SQLite database lives next to the JSON data file. It is migrated from the JSON data file the first time
+        the "sqlite" storage is selected.
+
+        :return: Storage backend.
+        :rtype: _handler.DataHandler
+        """
+        data_file = self.preferences.data_file
+
+        if self.preferences.storage == 'sqlite':
+            sqlite_file = f'{os.path.splitext(data_file)[0]}{config.SQLITE_FILE_SUFFIX}'
+
+            if not os.path.isfile(sqlite_file) and os.path.isfile(data_file):
+                _sqlite_handler.migrate_json(data_file, sqlite_file)
+
+            return _sqlite_handler.DataSQLite(sqlite_file)
+
+        return _handler.DataJson(data_file, journaled=self.preferences.storage == 'journal')
 
     def groups(self) -> Generator[str, None, None]:
         """
@@ -68,9 +105,8 @@ class Data:
         :return: Generator yielding group names.
         :rtype: Generator[str, None, None]
         """
-        if self.__data:
-            for group, _ in self.__data.items():
-                yield group
+        for group in self.data_obj.groups():
+            yield group
 
     def add_group(self, group: str) -> None:
         """
@@ -80,6 +116,7 @@ class Data:
         :type group: str
         """
         self.data_obj.update_data(group=group)
+        self._invalidate_indexes(group)
 
     def remove_group(self, group: str) -> None:
         """
@@ -89,6 +126,7 @@ class Data:
         :type group: str
         """
         self.data_obj.remove_key(group=group)
+        self._invalidate_indexes(group)
 
     def add_category(self, group: str, category: str) -> None:
         """
@@ -100,6 +138,7 @@ class Data:
         :type category: str
         """
         self.data_obj.update_data(group=group, category=category)
+        self._invalidate_indexes(group)
 
     def rename_category(self, group: str, old_category: str, new_category: str) -> None:
         """
@@ -113,6 +152,7 @@ class Data:
         :type new_category: str
         """
         self.data_obj.update_key(group, old_category, new_category)
+        self._invalidate_indexes(group)
 
     def remove_category(self, group: str, category: str) -> None:
         """
@@ -124,6 +164,7 @@ class Data:
         :type category: str
         """
         self.data_obj.remove_key(group=group, category=category)
+        self._invalidate_indexes(group)
 
     def categories(self, group: str) -> Generator[str, None, None]:
         """
@@ -134,9 +175,8 @@ class Data:
         :return: Generator yielding category names.
         :rtype: Generator[str, None, None]
         """
-        if self.__data.get(group):
-            for category in self.__data[group].keys():
-                yield category
+        for category in self.data_obj.categories(group):
+            yield category
 
     def add_proxy_data(self, data: dict, group: str, category: str) -> None:
         """
@@ -150,6 +190,26 @@ class Data:
         :type category: str
         """
         self.data_obj.update_data(group=group, category=category, data=data)
+        self.__tag_index.add_entry(group, category, data)
+        self.__search_index.add_entry(group, category, data)
+        self.__query_cache.invalidate(group, category)
+
+    def add_proxy_entries(self, entries: List[Dict], group: str, category: str) -> None:
+        """
+        Add a batch of proxy data to a category in a group, written to the storage backend at once.
+
+        :param entries: proxy data to add
+        :type entries: List[Dict]
+        :param group: Name of the group.
+        :type group: str
+        :param category: Name of the category.
+        :type category: str
+        """
+        self.data_obj.add_entries(group, category, entries)
+        for data in entries:
+            self.__tag_index.add_entry(group, category, data)
+            self.__search_index.add_entry(group, category, data)
+        self.__query_cache.invalidate(group, category)
 
     def thumbnail_data(self, group: str, category: str, tag: str = None, search_string: str = None) -> List[Dict]:
         """
@@ -166,19 +226,107 @@ class Data:
         :return: List of thumbnail data matching the criteria.
         :rtype: List[Dict]
         """
-        category_data = self.data_obj.data[group].get(category, [])
-
         if not tag and not search_string:
-            return category_data
+            return self.data_obj.entries(group, category)
+
+        return self.__query_cache.get(
+            group, category, tag, search_string, lambda: self._filter(group, category, tag, search_string))
+
+    def _filter(self, group: str, category: str, tag: str = None, search_string: str = None) -> List[Dict]:
+        """
+        Filter the thumbnail data of a category by tag and/or search string through the indexes.
+
+        The SQLite storage filters with its own indexed query, the in-memory indexes would load the whole group.
+
+        :param group: Name of the group.
+        :type group: str
+        :param category: Name of the category.
+        :type category: str
+        :param tag: Tag to filter by.
+        :type tag: Optional[str]
+        :param search_string: String to search in source file names.
+        :type search_string: Optional[str]
+        :return: List of thumbnail data matching the criteria.
+        :rtype: List[Dict]
+        """
+        if self._filters_in_storage():
+            return self.data_obj.entries(group, category, tag=tag, search_string=search_string)
+
+        if tag and not search_string:
+            return self.__tag_index.entries(
+                group, category, tag, lambda: self.__search_index.entries(group, category, self._group_loader(group)))
 
-        elif tag and not search_string:
-            return [data for data in category_data if tag in data['tags']]
+        return self.search(group, search_string, tag=tag, category=category)
 
-        elif not tag and search_string:
-            return [data for data in category_data if search_string.lower() in os.path.basename(data['source']).lower()]
-        else:
-            return [data for data in category_data
-                    if search_string.lower() in os.path.basename(data['source']).lower() and tag in data['tags']]
+    @property
+    def query_cache_stats(self) -> Dict[str, int]:
+        """
+        Get the hit, narrowed and miss counters of the filtered thumbnail data cache.
+
+        :return: Cache counters.
+        :rtype: Dict[str, int]
+        """
+        return self.__query_cache.stats()
+
+    def search(self, group: str, search_string: str, tag: str = None, category: str = None) -> List[Dict]:
+        """
+        Search thumbnail data by source file name, in a category or across all categories of a group.
+
+        :param group: Name of the group.
+        :type group: str
+        :param search_string: Case-insensitive string to search in source file names.
+        :type search_string: str
+        :param tag: Tag to filter by.
+        :type tag: Optional[str]
+        :param category: Name of the category. If None, every category of the group is searched.
+        :type category: Optional[str]
+        :return: List of thumbnail data matching the criteria.
+        :rtype: List[Dict]
+        """
+        if self._filters_in_storage():
+            categories = [category] if category else self.data_obj.categories(group)
+            return [data for category_ in categories
+                    for data in self.data_obj.entries(group, category_, tag=tag, search_string=search_string)]
+
+        found_data = self.__search_index.search(group, search_string, self._group_loader(group), category=category)
+
+        if not tag:
+            return found_data
+
+        return [data for data in found_data if tag in data['tags']]
+
+    def _filters_in_storage(self) -> bool:
+        """
+        Check whether the storage backend filters by tag and search string itself, with indexed queries.
+
+        :return: True for the SQLite storage, False for the JSON storages filtered through the in-memory indexes.
+        :rtype: bool
+        """
+        return isinstance(self.data_obj, _sqlite_handler.DataSQLite)
+
+    def _group_loader(self, group: str) -> Callable[[], Dict[str, List[Dict]]]:
+        """
+        Get a callable loading the thumbnail data of every category of a group, used to build the indexes.
+
+        Both indexes are built from the same data, so tag edits through the tag index are visible in search results.
+
+        :param group: Name of the group.
+        :type group: str
+        :return: Callable returning the thumbnail data by category.
+        :rtype: Callable[[], Dict[str, List[Dict]]]
+        """
+        return lambda: {category: self.data_obj.entries(group, category) for category in self.data_obj.categories(group)}
+
+    def _invalidate_indexes(self, group: str) -> None:
+        """
+        Drop the tag and search indexes and the cached results of a group, they are rebuilt on the next query.
+
+        :param group: Name of the group.
+        :type group: str
+        """
+        self.__tag_index.invalidate(group)
+        self.__search_index.invalidate(group)
+        self.__query_cache.invalidate(group)
 
     def remove_data(self, group: str, category: str, source_files: List[str]) -> None:
         """
@@ -192,6 +340,9 @@ class Data:
         :type source_files: List[str]
         """
         self.data_obj.remove_data(group=group, category=category, source_files=source_files)
+        self.__tag_index.remove_entries(group, category, source_files)
+        self.__search_index.remove_entries(group, category, source_files)
+        self.__query_cache.invalidate(group, category)
 
     @property
     def tags(self) -> List[str]:
@@ -212,6 +363,7 @@ class Data:
         """
         self.data_obj.update_data(data_type='tags', tag=tag)
         self.__tags.append(tag)
+        self.__tag_index.create_tag(tag)
 
     def add_tag(self, group: str, category: str, source_files: List[str], tag: str) -> None:
         """
@@ -227,6 +379,8 @@ class Data:
         :type tag: str
         """
         self.data_obj.update_data(group=group, category=category, source_files=source_files, tag=tag)
+        self.__tag_index.add_tag(group, category, source_files, tag)
+        self.__query_cache.invalidate(group, category)
 
     def remove_tag(self, group: str, category: str, source_files: List[str], tag: str) -> None:
         """
@@ -242,6 +396,8 @@ class Data:
         :type tag: str
         """
         self.data_obj.remove_data(group=group, category=category, source_files=source_files, tag=tag)
+        self.__tag_index.remove_tag(group, category, source_files, tag)
+        self.__query_cache.invalidate(group, category)
 
     def is_category_exists(self, group: str, category: str) -> bool:
         """
@@ -258,10 +414,12 @@ class Data:
 
     def refresh(self) -> None:
         """
-        Refresh the data from the JSON file.
+        Refresh the data from the storage backend.
 
-        Updates the internal data and tags after reloading from the JSON file.
+        Recreates the storage backend, so changes to the data file or the storage preference take effect.
         """
-        self.data_obj.json_file = self.preferences.data_file
-        self.data_obj.refresh_data()
-        self.__data = self.data_obj.data
+        self.data_obj.close()
+        self.data_obj = self._create_data_obj()
+        self.__tag_index.clear()
+        self.__search_index.clear()
+        self.__query_cache.clear()
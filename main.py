@@ -54,10 +54,11 @@ class Ulaavi(QtWidgets.QWidget, mainUI.MainUI):
     def __init__(self):
         """Initialize the Ulaavi application window."""
         super().__init__()
-        self.setupUi(self)
+        self.__ops = _operations.Operations()
+
+        self.setupUi(self, grid=self.__ops.data.preferences.grid)
         self.resize(1400, 700)
 
-        self.__ops = _operations.Operations()
         self._widget_connections()
         self.execute_on_startup()
 
@@ -92,6 +93,13 @@ class Ulaavi(QtWidgets.QWidget, mainUI.MainUI):
         self.thumbnail.on_drop_convert_mov.connect(self.__ops.convert_to_mov)
         self.thumbnail.on_open_in_explorer.connect(self.__ops.on_open_in_explorer)
         self.thumbnail.on_recache_proxy.connect(self.__ops.on_recache_proxy)
+        self.thumbnail.on_load_finished.connect(self.__ops.on_thumbnails_loaded)
+        self.thumbnail.update_status.connect(self.status.set_status)
+        self.thumbnail.on_prioritize_conversions.connect(self.__ops.prioritize_conversions)
+
+        # Conversion queue
+        self.status.on_cancel_conversions.connect(self.__ops.cancel_conversions)
+        self.__ops.op_signals.on_conversion_queue.connect(self.status.set_queue_status)
 
         # Tag management
         self.thumbnail.on_create_tag.connect(self.__ops.on_create_tag)
@@ -141,20 +149,26 @@ class Ulaavi(QtWidgets.QWidget, mainUI.MainUI):
         self.__ops.op_signals.on_reset_preferences.connect(self.settings.preferences_grp.update_pref_ui)
         self.__ops.op_signals.on_render_completed.connect(self.thumbnail.on_render_completed)
         self.__ops.op_signals.on_start_conversion.connect(self.thumbnail.start_thread)
+        self.__ops.op_signals.on_conversion_cancelled.connect(self.thumbnail.on_conversion_cancelled)
+        self.__ops.op_signals.on_conversion_progress.connect(self.thumbnail.on_conversion_progress)
         self.__ops.op_signals.on_load_tags.connect(self.thumbnail.set_tags)
         self.__ops.op_signals.on_load_tags.connect(self.actions_ui.filters.add_tags)
+        self.__ops.op_signals.on_reset_filters.connect(self.thumbnail.reset_attributes)
         self.__ops.op_signals.on_change_filters.connect(self.thumbnail.load_thumbnails)
         self.__ops.op_signals.on_apply_preferences.connect(self.thumbnail.set_max_thread_count)
+        self.__ops.op_signals.on_preview_mode.connect(self.thumbnail.set_preview_mode)
 
     def execute_on_startup(self) -> None:
         """
         Execute startup operations.
         This method initializes the UI by loading groups, categories, and tags,
-        and updates the thumbnail scale based on user preferences.
+        and updates the thumbnail scale, the preview mode and the conversion thread count based on user preferences.
         """
         self.__ops.ui_add_group()
         self.__ops.ui_add_category(self.categories.group.current_group)
         self.__ops.update_thumbnail_scale()
+        self.__ops.update_preview_mode()
+        self.__ops.update_thread_count()
         self.__ops.on_load_tags()
 
     def event(self, event):
@@ -0,0 +1,84 @@
+"""
+Summary:
+
+Tests of `conversion._image_header`, run from the root of the tool with `python -m unittest discover tests`.
+"""
+
+# -------------------------------- built-in Modules ----------------------------------
+import os
+import struct
+import tempfile
+import unittest
+
+# -------------------------------- Custom Modules ------------------------------------
+from conversion import _image_header
+
+
+def _exr_attribute(name: str, type_name: str, value: bytes) -> bytes:
+    """
+    Encode an OpenEXR header attribute.
+
+    :param name: Name of the attribute.
+    :type name: str
+    :param type_name: Type of the attribute.
+    :type type_name: str
+    :param value: Value of the attribute.
+    :type value: bytes
+    :return: The encoded attribute.
+    :rtype: bytes
+    """
+    return name.encode() + b'\0' + type_name.encode() + b'\0' + struct.pack('<i', len(value)) + value
+
+
+def _exr_header(display_window: tuple = None, data_window: tuple = None) -> bytes:
+    """
+    Build the header of a half float RGB OpenEXR image.
+
+    :param display_window: x_min, y_min, x_max and y_max of the display window, omitted if None.
+    :type display_window: tuple, optional
+    :param data_window: x_min, y_min, x_max and y_max of the data window, omitted if None.
+    :type data_window: tuple, optional
+    :return: The header.
+    :rtype: bytes
+    """
+    channels = b''.join(name + b'\0' + struct.pack('<iB3xii', 1, 0, 1, 1) for name in (b'B', b'G', b'R')) + b'\0'
+    header = b'\x76\x2f\x31\x01' + struct.pack('<i', 2) + _exr_attribute('channels', 'chlist', channels)
+
+    if data_window:
+        header += _exr_attribute('dataWindow', 'box2i', struct.pack('<iiii', *data_window))
+    if display_window:
+        header += _exr_attribute('displayWindow', 'box2i', struct.pack('<iiii', *display_window))
+
+    return header + b'\0'
+
+
+class TestReadExr(unittest.TestCase):
+
+    def _read_header(self, header: bytes) -> dict:
+        file_descriptor, image_file = tempfile.mkstemp(suffix='.exr')
+        self.addCleanup(os.remove, image_file)
+        with os.fdopen(file_descriptor, 'wb') as file_:
+            file_.write(header)
+
+        return _image_header.read_header(image_file)
+
+    def test_display_window_sets_the_resolution(self):
+        # overscan: the data window extends past the display window
+        header = self._read_header(_exr_header(display_window=(0, 0, 1919, 1079), data_window=(-64, -36, 1983, 1115)))
+        self.assertEqual((header['width'], header['height']), (1920, 1080))
+
+    def test_cropped_data_window(self):
+        header = self._read_header(_exr_header(display_window=(0, 0, 2047, 1151), data_window=(100, 200, 499, 599)))
+        self.assertEqual((header['width'], header['height']), (2048, 1152))
+
+    def test_data_window_without_display_window(self):
+        header = self._read_header(_exr_header(data_window=(0, 0, 639, 479)))
+        self.assertEqual((header['width'], header['height']), (640, 480))
+
+    def test_channels_and_bit_depth(self):
+        header = self._read_header(_exr_header(display_window=(0, 0, 99, 99), data_window=(0, 0, 99, 99)))
+        self.assertEqual((header['channels'], header['bit_depth']), (3, 16))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,303 @@
+"""
+Summary:
+
+This module provides an in-memory cache of decoded hover preview frames, so a proxy is decoded, scaled and converted
+to RGB only once and replayed from memory on the next hovers instead of reopening a `cv2.VideoCapture`.
+
+FrameCache:
+    Holds the frames of the most recently played clips, as scaled RGB uint8 arrays, keyed by
+    (proxy file, modification time, width, height). The least recently used clips are evicted beyond
+    `config.PREVIEW_FRAME_CACHE_CLIPS` clips or `config.PREVIEW_FRAME_CACHE_MB` megabytes. A clip may only hold its
+    first frames (e.g. playback stopped early, or prefetched by `_preview_prefetch`); `FrameDecoder` then continues
+    decoding from the first missing frame.
+
+The shared instance is `cache`. It is safe to use from worker threads.
+"""
+
+# -------------------------------- built-in Modules ----------------------------------
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+# ------------------------------- ThirdParty Modules ---------------------------------
+import cv2
+
+# -------------------------------- Custom Modules ------------------------------------
+from data import config
+
+
+def resize_with_aspect_ratio(image, width: int, height: int, inter=cv2.INTER_AREA):
+    """
+    Resize an image to fit a size while maintaining its aspect ratio.
+
+    :param image: Input image (numpy array).
+    :type image: numpy.ndarray
+    :param width: The width to fit.
+    :type width: int
+    :param height: The height to fit.
+    :type height: int
+    :param inter: Interpolation method (default is cv2.INTER_AREA).
+    :type inter: int
+    :return: Resized image.
+    :rtype: numpy.ndarray
+    """
+    if width is None and height is None:
+        return image
+
+    image_height, image_width = image.shape[:2]
+    image_aspect_ratio = image_width / image_height
+    label_aspect_ratio = width / height
+
+    if image_aspect_ratio >= label_aspect_ratio:
+        # image is wider than the video_label, scale based on width
+        new_width = width
+        new_height = int(new_width / image_aspect_ratio)
+    else:
+        # image is taller than the video_label, scale based on height
+        new_height = height
+        new_width = int(new_height * image_aspect_ratio)
+
+    return cv2.resize(image, (new_width, new_height), interpolation=inter)
+
+
+def read_frame(cap: cv2.VideoCapture, width: int, height: int):
+    """
+    Read the next frame of a capture, scaled to fit a size and converted to RGB.
+
+    :param cap: The opened video capture.
+    :type cap: cv2.VideoCapture
+    :param width: The width to fit.
+    :type width: int
+    :param height: The height to fit.
+    :type height: int
+    :return: The RGB frame as a contiguous uint8 array, or None at the end of the clip.
+    :rtype: Optional[numpy.ndarray]
+    """
+    ret, frame = cap.read()
+    if not ret:
+        return None
+
+    return cv2.cvtColor(resize_with_aspect_ratio(frame, width, height), cv2.COLOR_BGR2RGB)
+
+
+class Clip:
+    """
+    Decoded frames of a proxy.
+
+    Attributes:
+        fps (float): Frame rate of the proxy.
+        total_frames (int): Number of frames of the proxy.
+        frames (List[numpy.ndarray]): Decoded RGB frames, from the first frame on.
+        is_complete (bool): Whether every frame is decoded.
+        is_truncated (bool): Whether the cache refused more frames, the rest has to be decoded on playback.
+        nbytes (int): Memory used by the frames, in bytes.
+    """
+    __slots__ = ('fps', 'total_frames', 'frames', 'is_complete', 'is_truncated', 'nbytes')
+
+    def __init__(self, fps: float, total_frames: int) -> None:
+        """
+        Initialize a clip without frames.
+
+        :param fps: Frame rate of the proxy.
+        :type fps: float
+        :param total_frames: Number of frames of the proxy.
+        :type total_frames: int
+        """
+        self.fps = fps
+        self.total_frames = total_frames
+        self.frames = []
+        self.is_complete = False
+        self.is_truncated = False
+        self.nbytes = 0
+
+
+class FrameCache:
+    """
+    LRU cache of decoded preview clips with a clip count and memory budget.
+
+    Attributes:
+        max_clips (int): Maximum number of cached clips.
+        budget (int): Maximum memory used by the cached frames, in bytes.
+        size (int): Memory used by the cached frames, in bytes.
+        __clips (OrderedDict): Clips by (proxy file, mtime, width, height), least recently used first.
+        __lock (threading.Lock): Guards the clips and the memory accounting.
+    """
+
+    def __init__(self, max_clips: int, budget: int) -> None:
+        """
+        Initialize an empty cache.
+
+        :param max_clips: Maximum number of cached clips.
+        :type max_clips: int
+        :param budget: Maximum memory used by the cached frames, in bytes.
+        :type budget: int
+        """
+        self.max_clips = max_clips
+        self.budget = budget
+        self.size = 0
+        self.__clips = OrderedDict()
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def key(proxy_file: str, width: int, height: int) -> Optional[Tuple[str, int, int, int]]:
+        """
+        Get the cache key of a proxy played at a size.
+
+        :param proxy_file: The path to the proxy file.
+        :type proxy_file: str
+        :param width: The width of the preview.
+        :type width: int
+        :param height: The height of the preview.
+        :type height: int
+        :return: The cache key, or None if the proxy does not exist.
+        :rtype: Optional[Tuple[str, int, int, int]]
+        """
+        try:
+            mtime = os.stat(proxy_file).st_mtime_ns
+        except OSError:
+            return None
+
+        return proxy_file, mtime, int(width), int(height)
+
+    def get(self, key: Tuple[str, int, int, int]) -> Optional[Clip]:
+        """
+        Get a cached clip.
+
+        :param key: The cache key, from `key`.
+        :type key: Tuple[str, int, int, int]
+        :return: The clip, or None if it is not cached.
+        :rtype: Optional[Clip]
+        """
+        with self.__lock:
+            clip = self.__clips.get(key)
+            if clip is not None:
+                self.__clips.move_to_end(key)
+            return clip
+
+    def add(self, key: Tuple[str, int, int, int], fps: float, total_frames: int) -> Clip:
+        """
+        Add an empty clip, or get the clip already cached for the key.
+
+        :param key: The cache key, from `key`.
+        :type key: Tuple[str, int, int, int]
+        :param fps: Frame rate of the proxy.
+        :type fps: float
+        :param total_frames: Number of frames of the proxy.
+        :type total_frames: int
+        :return: The clip.
+        :rtype: Clip
+        """
+        with self.__lock:
+            clip = self.__clips.get(key)
+            if clip is None:
+                clip = self.__clips[key] = Clip(fps, total_frames)
+                self._evict(keep=clip)
+            self.__clips.move_to_end(key)
+            return clip
+
+    def append(self, clip: Clip, frame) -> bool:
+        """
+        Append the next frame to a clip.
+
+        Other clips are evicted to make room. A frame that does not fit even then is refused and the clip is marked
+        truncated.
+
+        :param clip: The clip, from `add`.
+        :type clip: Clip
+        :param frame: The next RGB frame.
+        :type frame: numpy.ndarray
+        :return: True if the frame was cached.
+        :rtype: bool
+        """
+        with self.__lock:
+            if clip.is_truncated or clip.nbytes + frame.nbytes > self.budget:
+                clip.is_truncated = True
+                return False
+
+            clip.frames.append(frame)
+            clip.nbytes += frame.nbytes
+            if clip.total_frames and len(clip.frames) >= clip.total_frames:
+                clip.is_complete = True
+
+            if any(cached is clip for cached in self.__clips.values()):
+                self.size += frame.nbytes
+                self._evict(keep=clip)
+            return True
+
+    def prefill(self, key: Tuple[str, int, int, int], fps: float, total_frames: int, frames: list) -> bool:
+        """
+        Add a clip holding its first frames, e.g. decoded ahead of the first hover, unless the key is cached already.
+
+        :param key: The cache key, from `key`.
+        :type key: Tuple[str, int, int, int]
+        :param fps: Frame rate of the proxy.
+        :type fps: float
+        :param total_frames: Number of frames of the proxy.
+        :type total_frames: int
+        :param frames: The first RGB frames of the proxy.
+        :type frames: List[numpy.ndarray]
+        :return: True if the clip was added.
+        :rtype: bool
+        """
+        with self.__lock:
+            if key in self.__clips:
+                return False
+
+            clip = self.__clips[key] = Clip(fps, total_frames)
+            clip.frames = list(frames)
+            clip.nbytes = sum(frame.nbytes for frame in frames)
+            clip.is_complete = 0 < total_frames <= len(frames)
+            self.size += clip.nbytes
+            self._evict(keep=clip)
+            return True
+
+    def complete(self, clip: Clip) -> None:
+        """
+        Mark a clip as complete once its last frame is decoded, unless frames were refused.
+
+        :param clip: The clip.
+        :type clip: Clip
+        """
+        with self.__lock:
+            clip.is_complete = not clip.is_truncated
+            clip.total_frames = len(clip.frames) if clip.is_complete else clip.total_frames
+
+    def _evict(self, keep: Clip) -> None:
+        """
+        Evict the least recently used clips beyond the clip count and the memory budget. Called with the lock held.
+
+        :param keep: A clip that must not be evicted.
+        :type keep: Clip
+        """
+        for key in list(self.__clips):
+            if len(self.__clips) <= self.max_clips and self.size <= self.budget:
+                break
+
+            clip = self.__clips[key]
+            if clip is keep:
+                continue
+
+            self.__clips.pop(key)
+            self.size -= clip.nbytes
+
+    def clear(self) -> None:
+        """Drop every cached clip."""
+        with self.__lock:
+            self.__clips.clear()
+            self.size = 0
+
+    def stats(self) -> dict:
+        """
+        Get the cache usage.
+
+        :return: Number of cached clips and frames, and used memory in bytes.
+        :rtype: dict
+        """
+        with self.__lock:
+            return {'clips': len(self.__clips),
+                    'frames': sum(len(clip.frames) for clip in self.__clips.values()),
+                    'size': self.size}
+
+
+cache = FrameCache(config.PREVIEW_FRAME_CACHE_CLIPS, config.PREVIEW_FRAME_CACHE_MB * 1024 * 1024)
@@ -0,0 +1,160 @@
+"""
+Summary:
+
+This module decodes thumbnail images off the GUI thread. The grids request a (image file, mtime, width, height) key
+from `_pixmap_cache`; a `QRunnable` reads and scales the image to a `QImage` on a thread pool, and the loader turns
+it into a pixmap, stores it in the shared pixmap cache and notifies the grid, which repaints the cells waiting on
+that key.
+
+ImageLoader:
+    Queues at most one decode per key. Requests can be cancelled, e.g. for cells scrolled out of view; a cancelled
+    request that has not started yet returns without reading the file.
+"""
+
+# -------------------------------- built-in Modules ----------------------------------
+from typing import Tuple
+
+# ------------------------------- ThirdParty Modules ---------------------------------
+try:
+    from PySide2.QtCore import QObject, Signal, QRunnable, QThreadPool, Qt
+    from PySide2.QtGui import QImage, QImageReader, QPixmap
+except ModuleNotFoundError:
+    from PySide6.QtCore import QObject, Signal, QRunnable, QThreadPool, Qt
+    from PySide6.QtGui import QImage, QImageReader, QPixmap
+
+# -------------------------------- Custom Modules ------------------------------------
+from data import config
+from . import _pixmap_cache
+
+
+class Signals(QObject):
+    """
+    Signals of the decode tasks, delivered to the GUI thread.
+
+    :Signals:
+        - **on_image_decoded**: Emitted when an image is decoded.
+            - Args:
+                - `key (tuple)`: The pixmap cache key.
+                - `image (QImage)`: The scaled image, null if it could not be read.
+    """
+    on_image_decoded = Signal(tuple, QImage)
+
+
+class DecodeImage(QRunnable):
+    """
+    Reads an image scaled to fit a size, keeping its aspect ratio.
+
+    Attributes:
+        key (tuple): The pixmap cache key (image file, mtime, width, height).
+        signals (Signals): The signals to deliver the image.
+        is_cancelled (bool): Set by `ImageLoader.cancel`, skips the decoding if it has not started yet.
+    """
+
+    def __init__(self, key: Tuple[str, int, int, int], signals: Signals) -> None:
+        """
+        Initialize the task.
+
+        :param key: The pixmap cache key.
+        :type key: Tuple[str, int, int, int]
+        :param signals: The signals to deliver the image.
+        :type signals: Signals
+        """
+        super().__init__()
+        self.key = key
+        self.signals = signals
+        self.is_cancelled = False
+
+    def run(self) -> None:
+        """
+        Decode the image and deliver it.
+        """
+        if self.is_cancelled:
+            return
+
+        image_file, _, width, height = self.key
+        reader = QImageReader(image_file)
+
+        size = reader.size()
+        if size.isValid():
+            # let the reader decode at the target size where the format supports it
+            reader.setScaledSize(size.scaled(width, height, Qt.KeepAspectRatio))
+
+        image = reader.read()
+        if not image.isNull() and (image.width() > width or image.height() > height):
+            image = image.scaled(width, height, Qt.KeepAspectRatio)
+
+        self.signals.on_image_decoded.emit(self.key, image)
+
+
+class ImageLoader(QObject):
+    """
+    Decodes thumbnail images on a thread pool and stores them in `_pixmap_cache.cache`.
+
+    :Signals:
+        - **on_image_ready**: Emitted when a requested image is in the pixmap cache.
+            - Args:
+                - `key (tuple)`: The pixmap cache key.
+    """
+    on_image_ready = Signal(tuple)
+
+    def __init__(self, parent=None) -> None:
+        """
+        Initialize the loader.
+
+        :param parent: The parent object.
+        :type parent: QObject, optional
+        """
+        super().__init__(parent)
+        self.__signals = Signals()
+        self.__signals.on_image_decoded.connect(self._on_image_decoded)
+        self.__threadpool = QThreadPool()
+        self.__threadpool.setMaxThreadCount(config.IMAGE_LOADER_THREADS)
+        self.__pending = {}
+
+    def request(self, key: Tuple[str, int, int, int]) -> None:
+        """
+        Request the decoding of an image, unless it is already requested.
+
+        :param key: The pixmap cache key, from `_pixmap_cache.cache.key`.
+        :type key: Tuple[str, int, int, int]
+        """
+        if key in self.__pending:
+            return
+
+        task = DecodeImage(key, self.__signals)
+        self.__pending[key] = task
+        self.__threadpool.start(task)
+
+    def cancel(self, key: Tuple[str, int, int, int]) -> None:
+        """
+        Cancel the request of an image.
+
+        :param key: The pixmap cache key.
+        :type key: Tuple[str, int, int, int]
+        """
+        task = self.__pending.pop(key, None)
+        if task is not None:
+            task.is_cancelled = True
+
+    def cancel_all(self) -> None:
+        """Cancel every pending request."""
+        for key in list(self.__pending):
+            self.cancel(key)
+
+    def _on_image_decoded(self, key: Tuple[str, int, int, int], image: QImage) -> None:
+        """
+        Store a decoded image in the pixmap cache and notify the requester.
+
+        :param key: The pixmap cache key.
+        :type key: Tuple[str, int, int, int]
+        :param image: The decoded image, null if it could not be read.
+        :type image: QImage
+        """
+        if image.isNull():
+            pixmap = _pixmap_cache.cache.pixmap(_pixmap_cache.ERROR_IMAGE, key[2], key[3])
+        else:
+            pixmap = QPixmap.fromImage(image)
+        _pixmap_cache.cache.insert(key, pixmap)
+
+        if self.__pending.pop(key, None) is not None:
+            self.on_image_ready.emit(key)
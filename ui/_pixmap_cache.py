@@ -0,0 +1,219 @@
+"""
+Summary:
+
+This module provides a process-wide LRU cache of scaled thumbnail pixmaps, shared by the thumbnail grids
+(`_thumbnail.Thumbnails`, `_thumbnailView.ThumbnailDelegate`) and the hover preview (`_preview_proxy.ProxyPreview`),
+so a thumbnail PNG is only read and scaled once per cell size instead of on every category switch, filter change
+and mouse leave.
+
+PixmapCache:
+    Caches pixmaps by (image file, modification time, width, height) under a memory budget, evicting the least
+    recently used pixmaps first. A rewritten image (e.g. after refreshing a proxy) gets a new modification time and
+    therefore a new entry.
+
+The shared instance is `cache`. Pixmaps must only be created and used on the GUI thread.
+"""
+
+# -------------------------------- built-in Modules ----------------------------------
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+# ------------------------------- ThirdParty Modules ---------------------------------
+try:
+    from PySide2.QtCore import Qt
+    from PySide2.QtGui import QPixmap
+except ModuleNotFoundError:
+    from PySide6.QtCore import Qt
+    from PySide6.QtGui import QPixmap
+
+# -------------------------------- Custom Modules ------------------------------------
+from data import config
+
+ERROR_IMAGE = f'{os.path.dirname(os.path.dirname(__file__))}/icons/error.png'
+
+
+class PixmapCache:
+    """
+    LRU cache of scaled pixmaps with a memory budget.
+
+    Attributes:
+        budget (int): Maximum memory used by the cached pixmaps, in bytes.
+        size (int): Memory used by the cached pixmaps, in bytes.
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that had to load an image.
+        __pixmaps (OrderedDict): Pixmaps by (image file, mtime, width, height), least recently used first.
+        __mtimes (Dict[str, Tuple[float, int]]): Checked time and modification time by image file.
+    """
+
+    def __init__(self, budget: int) -> None:
+        """
+        Initialize an empty cache.
+
+        :param budget: Maximum memory used by the cached pixmaps, in bytes.
+        :type budget: int
+        """
+        self.budget = budget
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.__pixmaps = OrderedDict()
+        self.__mtimes = {}
+
+    def _mtime(self, image_file: str) -> Optional[int]:
+        """
+        Get the modification time of an image file.
+
+        File system lookups are remembered for `config.PIXMAP_CACHE_STAT_TTL` seconds, as cells are repainted often
+        and the proxy root may be on a network mount.
+
+        :param image_file: The path to the image file.
+        :type image_file: str
+        :return: The modification time in nanoseconds, or None if the file does not exist.
+        :rtype: Optional[int]
+        """
+        now = time.monotonic()
+        checked = self.__mtimes.get(image_file)
+
+        if checked is not None and now - checked[0] < config.PIXMAP_CACHE_STAT_TTL:
+            return checked[1]
+
+        try:
+            mtime = os.stat(image_file).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        self.__mtimes[image_file] = (now, mtime)
+        return mtime
+
+    def key(self, image_file: str, width: int, height: int) -> Tuple[str, int, int, int]:
+        """
+        Get the cache key of an image scaled to a size, falling back to the error image if the file is missing.
+
+        :param image_file: The path to the image file.
+        :type image_file: str
+        :param width: The width to fit.
+        :type width: int
+        :param height: The height to fit.
+        :type height: int
+        :return: The cache key.
+        :rtype: Tuple[str, int, int, int]
+        """
+        mtime = self._mtime(image_file) if image_file else None
+
+        if mtime is None:
+            image_file = ERROR_IMAGE
+            mtime = self._mtime(image_file) or 0
+
+        return image_file, mtime, int(width), int(height)
+
+    def get(self, key: Tuple[str, int, int, int]) -> Optional[QPixmap]:
+        """
+        Get a cached pixmap.
+
+        :param key: The cache key, from `key`.
+        :type key: Tuple[str, int, int, int]
+        :return: The pixmap, or None if it is not cached.
+        :rtype: Optional[QPixmap]
+        """
+        pixmap = self.__pixmaps.get(key)
+
+        if pixmap is not None:
+            self.hits += 1
+            self.__pixmaps.move_to_end(key)
+        return pixmap
+
+    def insert(self, key: Tuple[str, int, int, int], pixmap: QPixmap) -> None:
+        """
+        Cache a pixmap, evicting the least recently used pixmaps beyond the budget.
+
+        :param key: The cache key, from `key`.
+        :type key: Tuple[str, int, int, int]
+        :param pixmap: The scaled pixmap.
+        :type pixmap: QPixmap
+        """
+        previous = self.__pixmaps.pop(key, None)
+        if previous is not None:
+            self.size -= self._cost(previous)
+
+        self.__pixmaps[key] = pixmap
+        self.size += self._cost(pixmap)
+
+        while self.size > self.budget and len(self.__pixmaps) > 1:
+            _, evicted = self.__pixmaps.popitem(last=False)
+            self.size -= self._cost(evicted)
+
+    def pixmap(self, image_file: str, width: int, height: int) -> QPixmap:
+        """
+        Get an image scaled to fit a size keeping its aspect ratio, loading it on a cache miss.
+
+        :param image_file: The path to the image file.
+        :type image_file: str
+        :param width: The width to fit.
+        :type width: int
+        :param height: The height to fit.
+        :type height: int
+        :return: The scaled pixmap, the error image if the file is missing.
+        :rtype: QPixmap
+        """
+        key = self.key(image_file, width, height)
+        pixmap = self.get(key)
+
+        if pixmap is None:
+            self.misses += 1
+            pixmap = QPixmap(key[0]).scaled(key[2], key[3], Qt.KeepAspectRatio)
+            self.insert(key, pixmap)
+
+        return pixmap
+
+    def invalidate(self, image_file: str) -> None:
+        """
+        Forget the modification time of an image file, so a rewritten file is picked up on the next lookup.
+
+        :param image_file: The path to the image file.
+        :type image_file: str
+        """
+        self.__mtimes.pop(image_file, None)
+
+    def retain_size(self, width: int, height: int) -> None:
+        """
+        Drop the pixmaps scaled to any other size, e.g. after the thumbnail scale changed.
+
+        :param width: The width to keep.
+        :type width: int
+        :param height: The height to keep.
+        :type height: int
+        """
+        for key in [key for key in self.__pixmaps if key[2:] != (int(width), int(height))]:
+            self.size -= self._cost(self.__pixmaps.pop(key))
+
+    def clear(self) -> None:
+        """Drop every cached pixmap."""
+        self.__pixmaps.clear()
+        self.__mtimes.clear()
+        self.size = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the cache counters.
+
+        :return: Number of cached pixmaps, used memory in bytes, hits and misses.
+        :rtype: Dict[str, int]
+        """
+        return {'pixmaps': len(self.__pixmaps), 'size': self.size, 'hits': self.hits, 'misses': self.misses}
+
+    @staticmethod
+    def _cost(pixmap: QPixmap) -> int:
+        """
+        Get the memory used by a pixmap.
+
+        :param pixmap: The pixmap.
+        :type pixmap: QPixmap
+        :return: The memory used, in bytes.
+        :rtype: int
+        """
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+
+cache = PixmapCache(config.PIXMAP_CACHE_BUDGET_MB * 1024 * 1024)
@@ -106,6 +106,100 @@ class PreferencesGroup:
 
         self.gridLayout.addWidget(self.lineEdit_thread_count, 3, 1, 1, 1)
 
+        self.label_storage = QLabel(self.frame_preferences)
+        self.label_storage.setObjectName(u"label_storage")
+        self.label_storage.setAlignment(Qt.AlignRight | Qt.AlignTrailing | Qt.AlignVCenter)
+
+        self.gridLayout.addWidget(self.label_storage, 5, 0, 1, 1)
+
+        self.comboBox_storage = QComboBox(self.frame_preferences)
+        self.comboBox_storage.setObjectName(u"comboBox_storage")
+        self.comboBox_storage.setMinimumSize(QSize(100, 0))
+        self.comboBox_storage.setMaximumSize(QSize(100, 16777215))
+        self.comboBox_storage.setFocusPolicy(Qt.ClickFocus)
+
+        self.gridLayout.addWidget(self.comboBox_storage, 5, 1, 1, 1)
+
+        self.label_grid = QLabel(self.frame_preferences)
+        self.label_grid.setObjectName(u"label_grid")
+        self.label_grid.setAlignment(Qt.AlignRight | Qt.AlignTrailing | Qt.AlignVCenter)
+
+        self.gridLayout.addWidget(self.label_grid, 6, 0, 1, 1)
+
+        self.comboBox_grid = QComboBox(self.frame_preferences)
+        self.comboBox_grid.setObjectName(u"comboBox_grid")
+        self.comboBox_grid.setMinimumSize(QSize(100, 0))
+        self.comboBox_grid.setMaximumSize(QSize(100, 16777215))
+        self.comboBox_grid.setFocusPolicy(Qt.ClickFocus)
+
+        self.gridLayout.addWidget(self.comboBox_grid, 6, 1, 1, 1)
+
+        self.label_filmstrip = QLabel(self.frame_preferences)
+        self.label_filmstrip.setObjectName(u"label_filmstrip")
+        self.label_filmstrip.setAlignment(Qt.AlignRight | Qt.AlignTrailing | Qt.AlignVCenter)
+
+        self.gridLayout.addWidget(self.label_filmstrip, 7, 0, 1, 1)
+
+        self.checkBox_filmstrip = QCheckBox(self.frame_preferences)
+        self.checkBox_filmstrip.setObjectName(u"checkBox_filmstrip")
+        self.checkBox_filmstrip.setFocusPolicy(Qt.ClickFocus)
+
+        self.gridLayout.addWidget(self.checkBox_filmstrip, 7, 1, 1, 1)
+
+        self.label_preview_mode = QLabel(self.frame_preferences)
+        self.label_preview_mode.setObjectName(u"label_preview_mode")
+        self.label_preview_mode.setAlignment(Qt.AlignRight | Qt.AlignTrailing | Qt.AlignVCenter)
+
+        self.gridLayout.addWidget(self.label_preview_mode, 8, 0, 1, 1)
+
+        self.comboBox_preview_mode = QComboBox(self.frame_preferences)
+        self.comboBox_preview_mode.setObjectName(u"comboBox_preview_mode")
+        self.comboBox_preview_mode.setMinimumSize(QSize(100, 0))
+        self.comboBox_preview_mode.setMaximumSize(QSize(100, 16777215))
+        self.comboBox_preview_mode.setFocusPolicy(Qt.ClickFocus)
+
+        self.gridLayout.addWidget(self.comboBox_preview_mode, 8, 1, 1, 1)
+
+        self.label_thumbnail_source = QLabel(self.frame_preferences)
+        self.label_thumbnail_source.setObjectName(u"label_thumbnail_source")
+        self.label_thumbnail_source.setAlignment(Qt.AlignRight | Qt.AlignTrailing | Qt.AlignVCenter)
+
+        self.gridLayout.addWidget(self.label_thumbnail_source, 9, 0, 1, 1)
+
+        self.comboBox_thumbnail_source = QComboBox(self.frame_preferences)
+        self.comboBox_thumbnail_source.setObjectName(u"comboBox_thumbnail_source")
+        self.comboBox_thumbnail_source.setMinimumSize(QSize(100, 0))
+        self.comboBox_thumbnail_source.setMaximumSize(QSize(100, 16777215))
+        self.comboBox_thumbnail_source.setFocusPolicy(Qt.ClickFocus)
+
+        self.gridLayout.addWidget(self.comboBox_thumbnail_source, 9, 1, 1, 1)
+
+        self.label_encoding_profile = QLabel(self.frame_preferences)
+        self.label_encoding_profile.setObjectName(u"label_encoding_profile")
+        self.label_encoding_profile.setAlignment(Qt.AlignRight | Qt.AlignTrailing | Qt.AlignVCenter)
+
+        self.gridLayout.addWidget(self.label_encoding_profile, 10, 0, 1, 1)
+
+        self.comboBox_encoding_profile = QComboBox(self.frame_preferences)
+        self.comboBox_encoding_profile.setObjectName(u"comboBox_encoding_profile")
+        self.comboBox_encoding_profile.setMinimumSize(QSize(100, 0))
+        self.comboBox_encoding_profile.setMaximumSize(QSize(140, 16777215))
+        self.comboBox_encoding_profile.setFocusPolicy(Qt.ClickFocus)
+
+        self.gridLayout.addWidget(self.comboBox_encoding_profile, 10, 1, 1, 1)
+
+        self.label_auto_thread_count = QLabel(self.frame_preferences)
+        self.label_auto_thread_count.setObjectName(u"label_auto_thread_count")
+        self.label_auto_thread_count.setAlignment(Qt.AlignRight | Qt.AlignTrailing | Qt.AlignVCenter)
+
+        self.gridLayout.addWidget(self.label_auto_thread_count, 11, 0, 1, 1)
+
+        self.checkBox_auto_thread_count = QCheckBox(self.frame_preferences)
+        self.checkBox_auto_thread_count.setObjectName(u"checkBox_auto_thread_count")
+        self.checkBox_auto_thread_count.setFocusPolicy(Qt.ClickFocus)
+
+        self.gridLayout.addWidget(self.checkBox_auto_thread_count, 11, 1, 1, 1)
+
         self.horizontalLayout_5 = QHBoxLayout()
         self.horizontalLayout_5.setSpacing(0)
         self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
@@ -197,6 +291,13 @@ class PreferencesGroup:
         self.label_proxy.setText("Proxy")
         self.label_scale.setText("Thumbnail Scale")
         self.label_thread_count.setText("Thread Count")
+        self.label_storage.setText("Storage")
+        self.label_grid.setText("Grid")
+        self.label_filmstrip.setText("Filmstrip")
+        self.label_preview_mode.setText("Preview")
+        self.label_thumbnail_source.setText("Thumbnail From")
+        self.label_encoding_profile.setText("Proxy Encoding")
+        self.label_auto_thread_count.setText("Auto Threads")
         self.btn_apply.setText("Apply")
         self.btn_reset.setText("Reset")
         self.btn_close.setText("Close")
\ No newline at end of file
@@ -2,7 +2,9 @@
 This module provides a `Preferences` widget for managing application settings in a Qt-based application.
 
 The `Preferences` widget allows users to:
-- Set and update preferences such as proxy directory, JSON file path, thread count, resolution, and thumbnail scale.
+- Set and update preferences such as proxy directory, JSON file path, thread count, resolution, thumbnail scale
+  storage backend, thumbnail grid mode, filmstrip generation, hover preview mode, thumbnail source, proxy
+  encoding profile and automatic thread count.
 - Browse and select directories for proxy and JSON file paths.
 - Reset preferences to their default values.
 - Apply changes and emit signals for integration with other parts of the application.
@@ -74,6 +76,27 @@ class Preferences(_preferences_grp.PreferencesGroup, QtWidgets.QWidget):
         self.lineEdit_res_width.setValidator(QtGui.QIntValidator(100, 600))
         self.lineEdit_res_height.setValidator(QtGui.QIntValidator(100, 600))
         self.lineEdit_thread_count.setValidator(QtGui.QIntValidator(1, 8))
+        self.comboBox_storage.addItems(config.STORAGE_BACKENDS)
+        self.comboBox_grid.addItems(config.GRID_MODES)
+        self.comboBox_grid.setToolTip('Applied the next time the panel is opened.')
+        self.checkBox_filmstrip.setToolTip('Generate a filmstrip with new proxies, hover previews play it '
+                                           'without decoding the proxy.')
+        self.comboBox_preview_mode.addItems(config.PREVIEW_MODES)
+        self.comboBox_preview_mode.setToolTip('play: loop the proxy on hover.\n'
+                                              'scrub: the mouse position over a thumbnail picks the frame.')
+        self.comboBox_thumbnail_source.addItems(config.THUMBNAIL_SOURCES)
+        self.comboBox_thumbnail_source.setToolTip('proxy: extract thumbnails from the converted proxy, falling back '
+                                                  'to the source.\nsource: extract thumbnails from the source.')
+        self.comboBox_encoding_profile.addItems(config.PROXY_ENCODING_PROFILES)
+        self.comboBox_encoding_profile.setToolTip('h264: smallest proxies, slowest to seek.\n'
+                                                  'h264_short_gop: a keyframe every '
+                                                  f'{config.PROXY_SHORT_GOP_SIZE} frames.\n'
+                                                  'h264_intra: every frame is a keyframe.\n'
+                                                  'mjpeg: fastest to seek and decode, largest proxies.\n'
+                                                  'Applies to new proxies, recache a proxy to re-encode it.')
+        self.checkBox_auto_thread_count.setToolTip('Size the conversions running at once and the ffmpeg threads of '
+                                                   'each from the cores, the load\nof the machine and the observed '
+                                                   'throughput, instead of the thread count.')
 
     def _set_widget_connections(self) -> None:
         """
@@ -83,6 +106,8 @@ class Preferences(_preferences_grp.PreferencesGroup, QtWidgets.QWidget):
         self.btn_apply.clicked.connect(self._apply_pref)
         self.btn_browse_proxy.clicked.connect(self._set_proxy_directory)
         self.btn_browse_json.clicked.connect(self._set_json_file_path)
+        self.checkBox_auto_thread_count.toggled.connect(
+            lambda checked: self.lineEdit_thread_count.setEnabled(not checked))
 
     def _reset_pref(self) -> None:
         """
@@ -103,7 +128,14 @@ class Preferences(_preferences_grp.PreferencesGroup, QtWidgets.QWidget):
                 'thread_count': str(self.lineEdit_thread_count.text().strip()),
                 'res_width': str(self.lineEdit_res_width.text().strip()),
                 'res_height': str(self.lineEdit_res_height.text().strip()),
-                'thumbnail': str(self.slider_thumbnail_scale.value())}
+                'thumbnail': str(self.slider_thumbnail_scale.value()),
+                'storage': self.comboBox_storage.currentText(),
+                'grid': self.comboBox_grid.currentText(),
+                'filmstrip': str(int(self.checkBox_filmstrip.isChecked())),
+                'preview_mode': self.comboBox_preview_mode.currentText(),
+                'thumbnail_source': self.comboBox_thumbnail_source.currentText(),
+                'encoding_profile': self.comboBox_encoding_profile.currentText(),
+                'auto_thread_count': str(int(self.checkBox_auto_thread_count.isChecked()))}
 
         self.on_apply.emit(data)
 
@@ -120,6 +152,15 @@ class Preferences(_preferences_grp.PreferencesGroup, QtWidgets.QWidget):
         self.lineEdit_res_width.setText(data.get('res_width', ''))
         self.lineEdit_res_height.setText(data.get('res_height', ''))
         self.slider_thumbnail_scale.setValue(int(data.get('thumbnail', 1)))
+        self.comboBox_storage.setCurrentText(data.get('storage', config.STORAGE_BACKENDS[0]))
+        self.comboBox_grid.setCurrentText(data.get('grid', config.GRID_MODES[0]))
+        self.checkBox_filmstrip.setChecked(bool(int(data.get('filmstrip', 1))))
+        self.comboBox_preview_mode.setCurrentText(data.get('preview_mode', config.PREVIEW_MODES[0]))
+        self.comboBox_thumbnail_source.setCurrentText(data.get('thumbnail_source', config.THUMBNAIL_SOURCES[0]))
+        self.comboBox_encoding_profile.setCurrentText(
+            data.get('encoding_profile', config.PROXY_ENCODING_PROFILES[0]))
+        self.checkBox_auto_thread_count.setChecked(bool(int(data.get('auto_thread_count', 1))))
+        self.lineEdit_thread_count.setEnabled(not self.checkBox_auto_thread_count.isChecked())
 
     def _set_proxy_directory(self) -> None:
         """
@@ -0,0 +1,151 @@
+"""
+Summary:
+
+This module decodes the first frames of the proxies visible in the thumbnail grid ahead of the first hover, so
+`_preview_proxy.ProxyPreview` starts playing from `_frame_cache` instead of opening and decoding the proxy first.
+
+PreviewPrefetcher:
+    Waits until the grid has been idle (no scrolling, loading or resizing) for `config.PREVIEW_PREFETCH_IDLE_MS`,
+    then queues the visible proxies on its own thread pool of `config.PREVIEW_PREFETCH_THREADS` threads. Each task
+    decodes `config.PREVIEW_PREFETCH_SECONDS` of its proxy at the lowest thread priority and adds it to the frame
+    cache. While proxies are being converted, prefetching is postponed so it never competes with `ConvertMov` jobs.
+    Queued tasks are cancelled as soon as the grid changes again.
+"""
+
+# -------------------------------- built-in Modules ----------------------------------
+import math
+import os
+from typing import Callable, List, Tuple
+
+# ------------------------------- ThirdParty Modules ---------------------------------
+import cv2
+
+try:
+    from PySide2.QtCore import QObject, QRunnable, QThread, QThreadPool, QTimer
+except ModuleNotFoundError:
+    from PySide6.QtCore import QObject, QRunnable, QThread, QThreadPool, QTimer
+
+# -------------------------------- Custom Modules ------------------------------------
+from data import config
+from . import _frame_cache
+import _utilities
+
+
+class PrefetchClip(QRunnable):
+    """
+    Decodes the first frames of a proxy into the frame cache.
+
+    Attributes:
+        key (tuple): The frame cache key (proxy file, mtime, width, height).
+        is_cancelled (bool): Set by `PreviewPrefetcher.cancel_all`, skips or stops the decoding.
+    """
+
+    def __init__(self, key: Tuple[str, int, int, int]) -> None:
+        """
+        Initialize the task.
+
+        :param key: The frame cache key.
+        :type key: Tuple[str, int, int, int]
+        """
+        super().__init__()
+        self.key = key
+        self.is_cancelled = False
+
+    def run(self) -> None:
+        """
+        Decode the first `config.PREVIEW_PREFETCH_SECONDS` of the proxy and add them to the frame cache.
+        """
+        if self.is_cancelled or _frame_cache.cache.get(self.key) is not None:
+            return
+
+        QThread.currentThread().setPriority(QThread.LowestPriority)
+
+        proxy_file, _, width, height = self.key
+        cap = cv2.VideoCapture(proxy_file)
+
+        try:
+            if not cap.isOpened():
+                return
+
+            fps = cap.get(cv2.CAP_PROP_FPS)
+            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            frame_count = math.ceil((fps or 24) * config.PREVIEW_PREFETCH_SECONDS)
+
+            frames = []
+            while len(frames) < frame_count and not self.is_cancelled:
+                frame = _frame_cache.read_frame(cap, width, height)
+                if frame is None:
+                    break
+                frames.append(frame)
+        finally:
+            cap.release()
+
+        if frames and not self.is_cancelled:
+            _frame_cache.cache.prefill(self.key, fps, total_frames, frames)
+
+
+class PreviewPrefetcher(QObject):
+    """
+    Prefetches the hover preview frames of the visible cells of a grid while it is idle.
+    """
+
+    def __init__(self,
+                 visible_previews: Callable[[], List[Tuple[str, int, int]]],
+                 is_busy: Callable[[], bool],
+                 parent=None) -> None:
+        """
+        Initialize the prefetcher.
+
+        :param visible_previews: Callable returning the (proxy file, width, height) of the visible previews.
+        :type visible_previews: Callable[[], List[Tuple[str, int, int]]]
+        :param is_busy: Callable returning True while proxies are being converted.
+        :type is_busy: Callable[[], bool]
+        :param parent: The parent object.
+        :type parent: QObject, optional
+        """
+        super().__init__(parent)
+        self.__visible_previews = visible_previews
+        self.__is_busy = is_busy
+        self.__tasks = []
+        self.__threadpool = QThreadPool()
+        self.__threadpool.setMaxThreadCount(config.PREVIEW_PREFETCH_THREADS)
+        self.__idle_timer = QTimer(self)
+        self.__idle_timer.setSingleShot(True)
+        self.__idle_timer.setInterval(config.PREVIEW_PREFETCH_IDLE_MS)
+        self.__idle_timer.timeout.connect(self._prefetch)
+
+    def schedule(self) -> None:
+        """
+        Cancel the queued tasks and prefetch the visible previews once the grid is idle again.
+        """
+        self.cancel_all()
+        self.__idle_timer.start()
+
+    def cancel_all(self) -> None:
+        """Cancel every queued or running task."""
+        self.__idle_timer.stop()
+
+        for task in self.__tasks:
+            task.is_cancelled = True
+        self.__tasks.clear()
+
+    def _prefetch(self) -> None:
+        """
+        Queue the visible previews missing from the frame cache, or wait while proxies are being converted.
+        """
+        if self.__is_busy():
+            self.__idle_timer.start()
+            return
+
+        for proxy_file, width, height in self.__visible_previews()[:config.PREVIEW_PREFETCH_MAX_CLIPS]:
+            if os.path.isfile(_utilities.get_filmstrip_from_proxy(proxy_file)[0]):
+                # played from its filmstrip, nothing to decode
+                continue
+
+            key = _frame_cache.cache.key(proxy_file, width, height)
+            if key is None or _frame_cache.cache.get(key) is not None:
+                continue
+
+            task = PrefetchClip(key)
+            self.__tasks.append(task)
+            self.__threadpool.start(task)
@@ -8,14 +8,22 @@ Key Features:
     Progress Bar: Shows a progress bar indicating the current playback position.
     Aspect Ratio Maintenance: Resizes the video while maintaining its aspect ratio.
     Dynamic Frame Update: Updates the video frame dynamically during playback.
+    Frame Cache: Decoded frames are kept in `_frame_cache`, so hovering a clip again plays it from memory.
+    Decoder Thread: Frames are decoded by a `FrameDecoder` thread into a bounded queue; the GUI thread only presents
+        them, counting dropped and late frames.
+    Scrubbing: In scrub mode the horizontal mouse position maps to a frame, decoded by `_scrub.ScrubDecoder`; the
+        nearest filmstrip tile is shown until the exact frame is ready.
+    Filmstrip: If the proxy has a filmstrip (see `_utilities.get_filmstrip_from_proxy`), its tiles are played
+        instead of decoding the proxy.
 
 Dependencies:
-    Built-in Modules: os
+    Built-in Modules: os, json, queue, time
     Third-Party Modules:
         PySide2 or PySide6 for GUI components.
         cv2 (OpenCV) for video processing.
 
 Classes:
+    FrameDecoder: A thread decoding the frames of a preview.
     ProxyPreview: A custom widget for video preview and playback control.
 
 Attributes:
@@ -29,13 +37,19 @@ Methods:
     _set_widget_properties: Configures widget properties, such as layout margins and geometry.
     eventFilter: Handles mouse enter and leave events to start/stop video preview.
     start_video_preview: Starts the video preview when the mouse enters the widget.
+    start_scrub_preview: Starts scrubbing when the mouse enters the widget in scrub mode.
+    scrub_to: Shows the frame at a horizontal position.
     stop_video_preview: Stops the video preview when the mouse leaves the widget.
-    update_video_frame: Updates the video frame displayed in the label.
+    update_video_frame: Presents the next decoded frame in the label.
     resize_with_aspect_ratio: Resizes an image while maintaining its aspect ratio.
 """
 
 # -------------------------------- built-in Modules ----------------------------------
 import os
+import json
+import queue
+import time
+from typing import Optional, Tuple
 
 # ------------------------------- ThirdParty Modules ---------------------------------
 import cv2
@@ -47,6 +61,127 @@ except ModuleNotFoundError:
 
 
 # -------------------------------- Custom Modules ------------------------------------
+from data import config
+from . import _pixmap_cache
+from . import _frame_cache
+from . import _scrub
+import _utilities
+
+
+class FrameDecoder(QtCore.QThread):
+    """
+    Decodes the frames of a proxy for a hover preview into a small bounded queue of ready images.
+
+    Frames already in `_frame_cache.cache` are taken from memory, the missing ones are decoded from the proxy and
+    appended to the clip, which is marked complete at the end of the proxy. Playback loops until `stop` is called.
+
+    Attributes:
+        key (tuple): The frame cache key (proxy file, mtime, width, height).
+        frames (queue.Queue): Ready (QImage, numpy.ndarray) pairs, at most `config.PREVIEW_FRAME_QUEUE_SIZE`; the
+            array backs the image memory.
+
+    :Signals:
+        - **on_opened**: Emitted once the clip is known.
+            - Args:
+                - `fps (float)`: Frame rate of the proxy.
+                - `total_frames (int)`: Number of frames of the proxy.
+    """
+    on_opened = QtCore.Signal(float, int)
+
+    def __init__(self, key: Tuple[str, int, int, int], parent=None) -> None:
+        """
+        Initialize the decoder.
+
+        :param key: The frame cache key.
+        :type key: Tuple[str, int, int, int]
+        :param parent: The parent object.
+        :type parent: QObject, optional
+        """
+        super().__init__(parent)
+        self.key = key
+        self.frames = queue.Queue(maxsize=config.PREVIEW_FRAME_QUEUE_SIZE)
+        self.__is_stopped = False
+
+    def stop(self) -> None:
+        """
+        Stop decoding and wait for the thread to finish.
+        """
+        self.__is_stopped = True
+        self.wait()
+
+    def run(self) -> None:
+        """
+        Decode frames in playback order until stopped.
+        """
+        proxy_file, _, width, height = self.key
+        clip = _frame_cache.cache.get(self.key)
+        cap = None
+
+        try:
+            if clip is None:
+                cap = cv2.VideoCapture(proxy_file)
+                if not cap.isOpened():
+                    return
+                clip = _frame_cache.cache.add(
+                    self.key, cap.get(cv2.CAP_PROP_FPS), int(cap.get(cv2.CAP_PROP_FRAME_COUNT)))
+
+            self.on_opened.emit(float(clip.fps or 0), int(clip.total_frames))
+
+            index = 0
+            cap_position = 0
+            while not self.__is_stopped:
+                if index >= len(clip.frames) and (clip.is_complete or index >= clip.total_frames > 0):
+                    index = 0
+
+                if index < len(clip.frames):
+                    self._put(clip.frames[index])
+                    index += 1
+                    continue
+
+                if cap is None:
+                    cap = cv2.VideoCapture(proxy_file)
+                if not cap.isOpened():
+                    return
+
+                if cap_position != index:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, index)
+
+                frame = _frame_cache.read_frame(cap, width, height)
+                if frame is None:
+                    # end of the proxy, seek again before the next read
+                    _frame_cache.cache.complete(clip)
+                    if index == 0:
+                        return
+                    cap_position = -1
+                    index = 0
+                    continue
+
+                cap_position = index + 1
+                if index == len(clip.frames):
+                    _frame_cache.cache.append(clip, frame)
+
+                self._put(frame)
+                index += 1
+        finally:
+            if cap is not None:
+                cap.release()
+
+    def _put(self, frame) -> None:
+        """
+        Queue a frame as an image, waiting while the queue is full.
+
+        :param frame: The RGB frame.
+        :type frame: numpy.ndarray
+        """
+        height, width, channels = frame.shape
+        image = QtGui.QImage(frame.data, width, height, channels * width, QtGui.QImage.Format_RGB888)
+
+        while not self.__is_stopped:
+            try:
+                self.frames.put((image, frame), timeout=0.05)
+                return
+            except queue.Full:
+                continue
 
 
 class ProxyPreview(QtWidgets.QWidget):
@@ -61,6 +196,9 @@ class ProxyPreview(QtWidgets.QWidget):
         thumbnail_width (int): The width of the video preview.
         thumbnail_height (int): The height of the video preview.
         proxy_file (str): The path to the video file.
+        dropped_frames (int): Frames of the current preview skipped because the timer fired too late.
+        late_frames (int): Timer ticks of the current preview where the decoder had no frame ready.
+        scrub_mode (bool): Whether hovering scrubs through the proxy instead of playing it.
         __total_frames (int): The total number of frames in the video.
     """
 
@@ -68,6 +206,7 @@ class ProxyPreview(QtWidgets.QWidget):
     on_leave = QtCore.Signal()
     set_range = QtCore.Signal(int)
     update_progress_value = QtCore.Signal(int)
+    set_progress_value = QtCore.Signal(int)
 
     def __init__(self, proxy_file: str, thumbnail_width: int, thumbnail_height: int) -> None:
         """
@@ -84,6 +223,17 @@ class ProxyPreview(QtWidgets.QWidget):
         self.thumbnail_width = thumbnail_width
         self.thumbnail_height = thumbnail_height
         self.__total_frames = 0
+        self.__frame_index = 0
+        self.__filmstrip = None
+        self.__decoder = None
+        self.__fps = 24
+        self.__frame_position = 0
+        self.__started_at = 0
+        self.dropped_frames = 0
+        self.late_frames = 0
+        self.scrub_mode = False
+        self.__scrub_decoder = None
+        self.__scrub_frame = -1
 
         self.proxy_file = proxy_file
 
@@ -101,6 +251,7 @@ class ProxyPreview(QtWidgets.QWidget):
         """
         self.vLayout.setSpacing(0)
         self.video_label.setContentsMargins(0, 0, 0, 0)
+        self.video_label.setMouseTracking(True)
         self.vLayout.setContentsMargins(0, 0, 0, 0)
         # self.progress_bar.setContentsMargins(0, 0, 0, 0)
         self.setGeometry(0, 0, self.thumbnail_width, self.thumbnail_height)
@@ -118,7 +269,13 @@ class ProxyPreview(QtWidgets.QWidget):
         """
         if event.type() == event.Type.Enter:
             self.on_enter.emit()
-            self.start_video_preview(obj)
+            if self.scrub_mode:
+                self.start_scrub_preview(obj)
+            else:
+                self.start_video_preview(obj)
+
+        elif event.type() == event.Type.MouseMove and self.scrub_mode:
+            self.scrub_to(obj, event.pos().x())
 
         elif event.type() == event.Type.Leave:
             self.stop_video_preview(obj)
@@ -130,24 +287,52 @@ class ProxyPreview(QtWidgets.QWidget):
         """
         Start the video preview when the mouse enters the widget.
 
+        Frames are decoded by a `FrameDecoder` thread; the timer only presents them, see `update_video_frame`.
+
         :param video_label: The label used to display the video.
         :type video_label: QtWidgets.QLabel
         """
         if not self.proxy_file or not os.path.isfile(self.proxy_file):
             return
 
-        video_label.cap = cv2.VideoCapture(self.proxy_file)
-        if not video_label.cap.isOpened():
+        if self._start_filmstrip_preview(video_label):
             return
 
-        self.__total_frames = int(video_label.cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        key = _frame_cache.cache.key(self.proxy_file, self.thumbnail_width, self.thumbnail_height)
+        if key is None:
+            return
+
+        self.dropped_frames = 0
+        self.late_frames = 0
+        self.__decoder = FrameDecoder(key)
+        self.__decoder.on_opened.connect(self._on_decoder_opened)
+        self.__decoder.start()
+
+    def _on_decoder_opened(self, fps: float, total_frames: int) -> None:
+        """
+        Start presenting the frames of the decoder once its clip is known.
+
+        :param fps: Frame rate of the proxy.
+        :type fps: float
+        :param total_frames: Number of frames of the proxy.
+        :type total_frames: int
+        """
+        if self.__decoder is None or self.sender() is not self.__decoder:
+            # the preview was stopped meanwhile
+            return
+
+        video_label = self.video_label
+
+        self.__fps = fps or 24
+        self.__total_frames = total_frames
+        self.__frame_position = 0
+        self.__started_at = time.monotonic()
 
         self.set_range.emit(self.__total_frames)
 
-        fps = video_label.cap.get(cv2.CAP_PROP_FPS)
         video_label.timer = QtCore.QTimer()
         video_label.timer.timeout.connect(lambda: self.update_video_frame(video_label))
-        video_label.timer.start(round(1000 / fps))
+        video_label.timer.start(round(1000 / self.__fps))
 
     def stop_video_preview(self, video_label: QtWidgets.QLabel) -> None:
         """
@@ -163,43 +348,208 @@ class ProxyPreview(QtWidgets.QWidget):
             except RuntimeError:
                 pass
 
-        if hasattr(video_label, 'cap'):
-            video_label.cap.release()
+        if self.__decoder is not None:
+            self.__decoder.stop()
+            self.__decoder = None
+
+        if self.__scrub_decoder is not None:
+            self.__scrub_decoder.stop()
+            self.__scrub_decoder = None
+
+        self.__filmstrip = None
 
         if hasattr(video_label, 'thumbnail'):
-            pixmap = QtGui.QPixmap(video_label.thumbnail)
             self.video_label.setPixmap(
-                pixmap.scaled(
-                    self.thumbnail_width,
-                    self.thumbnail_height,
-                    QtCore.Qt.KeepAspectRatio)
-            )
+                _pixmap_cache.cache.pixmap(video_label.thumbnail, self.thumbnail_width, self.thumbnail_height))
 
-    def update_video_frame(self, video_label: QtWidgets.QLabel) -> None:
+    def _load_filmstrip(self) -> Optional[Tuple[QtGui.QPixmap, int, int, int, float]]:
+        """
+        Load the filmstrip of the proxy scaled to the preview size, if it has one.
+
+        :return: The filmstrip pixmap, the tile width, the number of tiles, the frame step between tiles and the FPS,
+                 or None if the proxy has no filmstrip.
+        :rtype: Optional[Tuple[QtGui.QPixmap, int, int, int, float]]
+        """
+        filmstrip_image, filmstrip_info = _utilities.get_filmstrip_from_proxy(self.proxy_file)
+        if not filmstrip_image or not os.path.isfile(filmstrip_image) or not os.path.isfile(filmstrip_info):
+            return None
+
+        try:
+            with open(filmstrip_info, 'r') as file:
+                info = json.load(file)
+            frames, step, fps = int(info['frames']), max(int(info['step']), 1), float(info['fps'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        if frames < 1:
+            return None
+
+        strip = _pixmap_cache.cache.pixmap(filmstrip_image, frames * self.thumbnail_width, self.thumbnail_height)
+        tile_width = strip.width() // frames
+        if not tile_width:
+            return None
+
+        return strip, tile_width, frames, step, fps
+
+    def _start_filmstrip_preview(self, video_label: QtWidgets.QLabel) -> bool:
         """
-        Update the video frame displayed in the label.
+        Start playing the filmstrip of the proxy, if it has one.
 
         :param video_label: The label used to display the video.
         :type video_label: QtWidgets.QLabel
+        :return: True if the filmstrip is playing.
+        :rtype: bool
         """
+        filmstrip = self._load_filmstrip()
+        if filmstrip is None:
+            return False
 
-        ret, frame = video_label.cap.read()
+        _, _, frames, step, fps = filmstrip
+        self.__filmstrip = filmstrip
+        self.__frame_index = 0
+        self.__total_frames = frames
 
-        if not ret:
-            video_label.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-            ret, frame = video_label.cap.read()
-            if not ret:
-                return
+        self.set_range.emit(frames)
 
-        frame = self.resize_with_aspect_ratio(frame)
+        video_label.timer = QtCore.QTimer()
+        video_label.timer.timeout.connect(lambda: self.update_filmstrip_frame(video_label))
+        video_label.timer.start(round(1000 * step / (fps or 24)))
+        return True
+
+    def update_filmstrip_frame(self, video_label: QtWidgets.QLabel) -> None:
+        """
+        Display the next tile of the filmstrip in the label.
 
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        height, width, channels = frame_rgb.shape
-        bytes_per_line = channels * width
+        :param video_label: The label used to display the video.
+        :type video_label: QtWidgets.QLabel
+        """
+        if self.__filmstrip is None:
+            return
 
-        q_image = QtGui.QImage(frame_rgb.data, width, height, bytes_per_line, QtGui.QImage.Format_RGB888)
-        video_label.setPixmap(QtGui.QPixmap.fromImage(q_image))
+        strip, tile_width, frames, _, _ = self.__filmstrip
+        index = self.__frame_index % frames
+        self.__frame_index = index + 1
 
+        video_label.setPixmap(strip.copy(index * tile_width, 0, tile_width, strip.height()))
+        self.update_progress_value.emit(self.__total_frames)
+
+    def start_scrub_preview(self, video_label: QtWidgets.QLabel) -> None:
+        """
+        Start scrubbing when the mouse enters the widget in scrub mode.
+
+        :param video_label: The label used to display the video.
+        :type video_label: QtWidgets.QLabel
+        """
+        if not self.proxy_file or not os.path.isfile(self.proxy_file):
+            return
+
+        key = _frame_cache.cache.key(self.proxy_file, self.thumbnail_width, self.thumbnail_height)
+        if key is None:
+            return
+
+        self.__filmstrip = self._load_filmstrip()
+        self.__total_frames = 0
+        self.__scrub_frame = -1
+        self.__scrub_decoder = _scrub.ScrubDecoder(key)
+        self.__scrub_decoder.on_opened.connect(self._on_scrub_opened)
+        self.__scrub_decoder.on_frame_ready.connect(self._on_scrub_frame_ready)
+        self.__scrub_decoder.start()
+
+    def _on_scrub_opened(self, total_frames: int) -> None:
+        """
+        Show the frame under the mouse cursor once the proxy is opened.
+
+        :param total_frames: Number of frames of the proxy.
+        :type total_frames: int
+        """
+        if self.__scrub_decoder is None or self.sender() is not self.__scrub_decoder:
+            # the preview was stopped meanwhile
+            return
+
+        self.__total_frames = total_frames
+        self.set_range.emit(total_frames)
+        self.scrub_to(self.video_label, self.video_label.mapFromGlobal(QtGui.QCursor.pos()).x())
+
+    def scrub_to(self, video_label: QtWidgets.QLabel, x: int) -> None:
+        """
+        Show the frame at a horizontal position of the label, the left edge being the first frame.
+
+        The nearest filmstrip tile is shown at once, the exact frame when decoded.
+
+        :param video_label: The label used to display the video.
+        :type video_label: QtWidgets.QLabel
+        :param x: The horizontal position in the label.
+        :type x: int
+        """
+        if self.__scrub_decoder is None or self.__total_frames < 1:
+            return
+
+        frame = min(max(int(x * self.__total_frames / max(video_label.width(), 1)), 0), self.__total_frames - 1)
+        if frame == self.__scrub_frame:
+            return
+
+        self.__scrub_frame = frame
+        if self.__filmstrip is not None:
+            strip, tile_width, frames, step, _ = self.__filmstrip
+            tile = min(frame // step, frames - 1)
+            video_label.setPixmap(strip.copy(tile * tile_width, 0, tile_width, strip.height()))
+
+        self.__scrub_decoder.request(frame)
+        self.set_progress_value.emit(frame)
+
+    def _on_scrub_frame_ready(self, frame: int, image: QtGui.QImage) -> None:
+        """
+        Show a decoded frame, unless the mouse has moved to another frame meanwhile.
+
+        :param frame: The frame number.
+        :type frame: int
+        :param image: The frame.
+        :type image: QtGui.QImage
+        """
+        if self.sender() is not self.__scrub_decoder or frame != self.__scrub_frame:
+            return
+
+        self.video_label.setPixmap(QtGui.QPixmap.fromImage(image))
+
+    def update_video_frame(self, video_label: QtWidgets.QLabel) -> None:
+        """
+        Present the frame due at the current playback time.
+
+        Frames the timer is too late for are dropped from the queue; if the decoder has not queued the due frame
+        yet, the current frame stays on screen and the frame is counted as late.
+
+        :param video_label: The label used to display the video.
+        :type video_label: QtWidgets.QLabel
+        """
+        if self.__decoder is None:
+            return
+
+        behind = int((time.monotonic() - self.__started_at) * self.__fps) + 1 - self.__frame_position
+        if behind <= 0:
+            return
+
+        for _ in range(behind - 1):
+            try:
+                self.__decoder.frames.get_nowait()
+            except queue.Empty:
+                break
+            self.dropped_frames += 1
+            self._advance()
+
+        try:
+            image, _ = self.__decoder.frames.get_nowait()
+        except queue.Empty:
+            self.late_frames += 1
+            return
+
+        video_label.setPixmap(QtGui.QPixmap.fromImage(image))
+        self._advance()
+
+    def _advance(self) -> None:
+        """
+        Move the playback position and the progress bar by one frame.
+        """
+        self.__frame_position += 1
         self.update_progress_value.emit(self.__total_frames)
 
     def resize_with_aspect_ratio(self, image, inter=cv2.INTER_AREA):
@@ -213,21 +563,4 @@ class ProxyPreview(QtWidgets.QWidget):
         :return: Resized image.
         :rtype: numpy.ndarray
         """
-
-        if self.thumbnail_width is None and self.thumbnail_height is None:
-            return image
-
-        image_height, image_width = image.shape[:2]
-        image_aspect_ratio = image_width / image_height
-        label_aspect_ratio = self.thumbnail_width / self.thumbnail_height
-
-        if image_aspect_ratio >= label_aspect_ratio:
-            # image is wider than the video_label, scale based on width
-            new_width = self.thumbnail_width
-            new_height = int(new_width / image_aspect_ratio)
-        else:
-            # image is taller than the video_label, scale based on height
-            new_height = self.thumbnail_height
-            new_width = int(new_height * image_aspect_ratio)
-
-        return cv2.resize(image, (new_width, new_height), interpolation=inter)
+        return _frame_cache.resize_with_aspect_ratio(image, self.thumbnail_width, self.thumbnail_height, inter)
@@ -0,0 +1,283 @@
+"""
+Summary:
+
+This module provides frame-accurate scrubbing for the hover preview: the horizontal mouse position over a cell is
+mapped to a frame by `_preview_proxy.ProxyPreview`, and the frame is decoded here off the GUI thread.
+
+KeyframeTable:
+    The keyframes of a proxy, listed once with ffprobe and cached on disk next to the thumbnail image (see
+    `_utilities.get_keyframes_from_proxy`). It holds the preceding keyframe of every frame, so finding where to
+    seek for a frame is a single lookup.
+
+ScrubDecoder:
+    A thread decoding the latest requested frame. Frames already in `_frame_cache` are taken from memory; otherwise
+    the decoder reads forward from its current position if that lies in the same GOP, or seeks to the preceding
+    keyframe and reads forward from there. Requests made while a frame is decoded are coalesced to the latest one.
+"""
+
+# -------------------------------- built-in Modules ----------------------------------
+import bisect
+import json
+import os
+import subprocess
+import threading
+from typing import List, Optional, Tuple
+
+# ------------------------------- ThirdParty Modules ---------------------------------
+import cv2
+
+try:
+    from PySide2 import QtCore, QtGui
+except ModuleNotFoundError:
+    from PySide6 import QtCore, QtGui
+
+# -------------------------------- Custom Modules ------------------------------------
+from conversion import _commands
+from data import config
+from . import _frame_cache
+import _utilities
+
+
+class KeyframeTable:
+    """
+    Keyframe lookup table of a proxy.
+
+    Attributes:
+        keyframes (List[int]): Frame numbers of the keyframes, ascending.
+        __preceding (List[int]): Preceding keyframe by frame number.
+    """
+
+    def __init__(self, keyframes: List[int], total_frames: int) -> None:
+        """
+        Initialize the table.
+
+        :param keyframes: Frame numbers of the keyframes.
+        :type keyframes: List[int]
+        :param total_frames: Number of frames of the proxy.
+        :type total_frames: int
+        """
+        self.keyframes = sorted(set(keyframes) | {0})
+        self.__preceding = []
+
+        keyframes = iter(self.keyframes[1:])
+        next_keyframe = next(keyframes, None)
+        keyframe = 0
+        for frame in range(max(total_frames, 1)):
+            if frame == next_keyframe:
+                keyframe = frame
+                next_keyframe = next(keyframes, None)
+            self.__preceding.append(keyframe)
+
+    def keyframe_before(self, frame: int) -> int:
+        """
+        Get the keyframe to seek to for decoding a frame.
+
+        :param frame: The frame number.
+        :type frame: int
+        :return: The frame number of the last keyframe at or before the frame.
+        :rtype: int
+        """
+        if frame < len(self.__preceding):
+            return self.__preceding[max(frame, 0)]
+        return self.keyframes[bisect.bisect_right(self.keyframes, frame) - 1]
+
+    @classmethod
+    def load(cls, proxy_file: str, fps: float, total_frames: int) -> 'KeyframeTable':
+        """
+        Load the keyframe table of a proxy from disk, building and saving it if missing or outdated.
+
+        Without ffprobe every frame is treated as a keyframe, i.e. the decoder always seeks.
+
+        :param proxy_file: The path to the proxy file.
+        :type proxy_file: str
+        :param fps: Frame rate of the proxy.
+        :type fps: float
+        :param total_frames: Number of frames of the proxy.
+        :type total_frames: int
+        :return: The keyframe table.
+        :rtype: KeyframeTable
+        """
+        table_file = _utilities.get_keyframes_from_proxy(proxy_file)
+        mtime = os.stat(proxy_file).st_mtime_ns
+
+        try:
+            with open(table_file, 'r') as file:
+                data = json.load(file)
+            if data['mtime'] == mtime:
+                return cls(data['keyframes'], total_frames)
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        keyframes = _probe_keyframes(proxy_file, fps)
+        if keyframes is None:
+            return cls(list(range(total_frames)), total_frames)
+
+        try:
+            with open(table_file, 'w') as file:
+                json.dump({'mtime': mtime, 'keyframes': keyframes}, file)
+        except OSError:
+            pass
+
+        return cls(keyframes, total_frames)
+
+
+def _probe_keyframes(proxy_file: str, fps: float) -> Optional[List[int]]:
+    """
+    List the keyframes of a proxy with ffprobe.
+
+    The probe is killed after `config.FFPROBE_TIMEOUT_S`: `ScrubDecoder.stop` waits for the decoder thread on the GUI
+    thread, so a stalled read must not block it.
+
+    :param proxy_file: The path to the proxy file.
+    :type proxy_file: str
+    :param fps: Frame rate of the proxy.
+    :type fps: float
+    :return: Frame numbers of the keyframes, or None if ffprobe failed or timed out.
+    :rtype: Optional[List[int]]
+    """
+    try:
+        process = subprocess.Popen(
+            _commands.extract_keyframes(proxy_file), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    except OSError:
+        return None
+
+    try:
+        out, _ = process.communicate(timeout=config.FFPROBE_TIMEOUT_S)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.communicate()
+        print(f'ffprobe timed out after {config.FFPROBE_TIMEOUT_S} s: {proxy_file}')
+        return None
+
+    if process.returncode:
+        return None
+
+    keyframes = []
+    for line in out.decode().splitlines():
+        try:
+            keyframes.append(round(float(line.strip().strip(',')) * fps))
+        except ValueError:
+            continue
+
+    return keyframes or None
+
+
+class ScrubDecoder(QtCore.QThread):
+    """
+    Decodes the latest requested frame of a proxy for scrubbing.
+
+    Attributes:
+        key (tuple): The frame cache key (proxy file, mtime, width, height).
+
+    :Signals:
+        - **on_opened**: Emitted once the proxy is opened.
+            - Args:
+                - `total_frames (int)`: Number of frames of the proxy.
+        - **on_frame_ready**: Emitted when a requested frame is decoded.
+            - Args:
+                - `frame (int)`: The frame number.
+                - `image (QImage)`: The frame.
+    """
+    on_opened = QtCore.Signal(int)
+    on_frame_ready = QtCore.Signal(int, QtGui.QImage)
+
+    def __init__(self, key: Tuple[str, int, int, int], parent=None) -> None:
+        """
+        Initialize the decoder.
+
+        :param key: The frame cache key.
+        :type key: Tuple[str, int, int, int]
+        :param parent: The parent object.
+        :type parent: QObject, optional
+        """
+        super().__init__(parent)
+        self.key = key
+        self.__requested_frame = None
+        self.__is_stopped = False
+        self.__wake = threading.Event()
+
+    def request(self, frame: int) -> None:
+        """
+        Request a frame, replacing a request that has not been served yet.
+
+        :param frame: The frame number.
+        :type frame: int
+        """
+        self.__requested_frame = frame
+        self.__wake.set()
+
+    def stop(self) -> None:
+        """
+        Stop decoding and wait for the thread to finish.
+        """
+        self.__is_stopped = True
+        self.__wake.set()
+        self.wait()
+
+    def run(self) -> None:
+        """
+        Serve frame requests until stopped.
+        """
+        proxy_file, _, width, height = self.key
+        cap = cv2.VideoCapture(proxy_file)
+
+        try:
+            if not cap.isOpened():
+                return
+
+            fps = cap.get(cv2.CAP_PROP_FPS) or 24
+            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            table = KeyframeTable.load(proxy_file, fps, total_frames)
+            self.on_opened.emit(total_frames)
+
+            position = 0
+            while not self.__is_stopped:
+                self.__wake.wait()
+                self.__wake.clear()
+
+                frame_number = self.__requested_frame
+                if self.__is_stopped or frame_number is None:
+                    continue
+
+                clip = _frame_cache.cache.get(self.key)
+                if clip is not None and frame_number < len(clip.frames):
+                    self._emit_frame(frame_number, clip.frames[frame_number])
+                    continue
+
+                keyframe = table.keyframe_before(frame_number)
+                if not keyframe <= position <= frame_number:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, keyframe)
+                    position = keyframe
+
+                frame = None
+                while position <= frame_number and not self.__wake.is_set():
+                    if position < frame_number:
+                        # frames before the requested one only need to be decoded, not converted
+                        is_read = cap.grab()
+                    else:
+                        frame = _frame_cache.read_frame(cap, width, height)
+                        is_read = frame is not None
+
+                    if not is_read:
+                        # end of the proxy, seek again next time
+                        position = -1
+                        break
+                    position += 1
+
+                if frame is not None:
+                    self._emit_frame(frame_number, frame)
+        finally:
+            cap.release()
+
+    def _emit_frame(self, frame_number: int, frame) -> None:
+        """
+        Deliver a frame as an image.
+
+        :param frame_number: The frame number.
+        :type frame_number: int
+        :param frame: The RGB frame.
+        :type frame: numpy.ndarray
+        """
+        height, width, channels = frame.shape
+        image = QtGui.QImage(frame.data, width, height, channels * width, QtGui.QImage.Format_RGB888)
+        self.on_frame_ready.emit(frame_number, image.copy())
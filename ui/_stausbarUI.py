@@ -7,11 +7,14 @@ It is designed to be simple and reusable, with support for updating the status t
 
 Key Features:
     - **Status Display**: Displays a status message in a label.
+    - **Conversion Queue**: Displays the number of queued and running proxy conversions, their throughput and the
+      estimated time left, with a button cancelling them.
     - **Customizable Height**: Allows setting a fixed height for the status bar.
     - **Minimal Design**: No frame or shadow for a clean look.
 
 Usage:
     - Use the `set_status` method to update the status text.
+    - Use the `set_queue_status` method to update the conversion queue, connect `on_cancel_conversions`.
     - Add the widget to the main layout to display status messages.
 
 """
@@ -37,7 +40,11 @@ class StatusBar(QtWidgets.QFrame):
 
    :param parent: The parent widget, defaults to None.
    :type parent: QWidget, optional
+
+   :Signals:
+        - **on_cancel_conversions**: Emitted when the cancel button of the conversion queue is clicked.
    """
+    on_cancel_conversions = QtCore.Signal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -45,7 +52,17 @@ class StatusBar(QtWidgets.QFrame):
         self.__hLayout = QtWidgets.QHBoxLayout(self)
 
         self.label_status = QtWidgets.QLabel()
-        self.__hLayout.addWidget(self.label_status)
+        self.__hLayout.addWidget(self.label_status, 1)
+
+        self.label_queue = QtWidgets.QLabel()
+        self.__hLayout.addWidget(self.label_queue)
+
+        self.button_cancel = QtWidgets.QPushButton('Cancel')
+        self.button_cancel.setToolTip('Cancel the queued and running proxy conversions.')
+        self.button_cancel.clicked.connect(lambda: self.on_cancel_conversions.emit())
+        self.__hLayout.addWidget(self.button_cancel)
+        self.label_queue.hide()
+        self.button_cancel.hide()
 
         self.__hLayout.setContentsMargins(3, 3, 3, 3)
         self.setFrameShape(QtWidgets.QFrame.NoFrame)
@@ -60,3 +77,22 @@ class StatusBar(QtWidgets.QFrame):
         :type text: str
         """
         self.label_status.setText(text)
+
+    def set_queue_status(self, queued: int, running: int, throughput: float, eta: float) -> None:
+        """
+        Set the state of the conversion queue, hidden while it is empty.
+
+        :param queued: Number of conversions waiting for a thread.
+        :type queued: int
+        :param running: Number of conversions running.
+        :type running: int
+        :param throughput: Conversions finished per minute.
+        :type throughput: float
+        :param eta: Estimated seconds until every conversion is done, -1 if unknown.
+        :type eta: float
+        """
+        is_busy = bool(queued or running)
+        eta_text = f'{int(eta) // 60}:{int(eta) % 60:02d}' if eta >= 0 else '--:--'
+        self.label_queue.setText(f'Converting {running}, queued {queued} | {throughput:.1f}/min | ETA {eta_text}')
+        self.label_queue.setVisible(is_busy)
+        self.button_cancel.setVisible(is_busy)
@@ -20,7 +20,7 @@ Usage:
 
 # -------------------------------- built-in Modules ----------------------------------
 import os
-from typing import List
+from typing import List, Tuple
 
 # ------------------------------- ThirdParty Modules ---------------------------------
 try:
@@ -30,6 +30,60 @@ except ModuleNotFoundError:
 
 # -------------------------------- Custom Modules ------------------------------------
 from . import _preview_proxy
+from . import _pixmap_cache
+
+
+def metadata_overlay_text(metadata: dict, tags: List[str]) -> Tuple[str, str]:
+    """
+    Build the left and right texts of a thumbnail overlay from metadata and tags.
+
+    :param metadata: A dictionary containing metadata information.
+    :type metadata: dict
+    :param tags: A list of tags associated with the thumbnail.
+    :type tags: list[str]
+    :return: The texts of the left and right overlay labels.
+    :rtype: Tuple[str, str]
+    """
+    resolution = ''
+    metadata['Tags'] = ','.join(tags) if tags else '-'
+    width = metadata.get('width')
+    height = metadata.get('height')
+    if width and height:
+        resolution = f'{width}x{height}'
+
+    length = len(list(metadata)) - 2
+    half_the_length = round(length) * 0.5
+
+    meta_string_left = f'Resolution: {resolution}'
+    meta_string_right = ''
+
+    for index, (key, value) in enumerate(metadata.items()):
+        if key in ('width', 'height'):
+            continue
+
+        if index < half_the_length:
+            meta_string_left += '\n'
+            meta_string_left += f'{key}: {value}'
+
+        else:
+            meta_string_right += '\n'
+            meta_string_right += f'{key}: {value}'
+
+    return meta_string_left, meta_string_right
+
+
+def conversion_progress_text(frame: int, total_frames: int) -> Tuple[str, str]:
+    """
+    Build the left and right texts of the overlay of a thumbnail being converted.
+
+    :param frame: Number of frames converted.
+    :type frame: int
+    :param total_frames: Number of frames of the source.
+    :type total_frames: int
+    :return: The texts of the left and right overlay labels.
+    :rtype: Tuple[str, str]
+    """
+    return f'Converting: {frame}/{total_frames}', f'{100 * frame // max(total_frames, 1)}%'
 
 
 class ThumbnailOverlay(QtWidgets.QFrame):
@@ -160,30 +214,21 @@ class Thumbnails(QtWidgets.QFrame):
         :param tags: A list of tags associated with the thumbnail.
         :type tags: list[str]
         """
-        resolution = ''
-        metadata['Tags'] = ','.join(tags) if tags else '-'
-        width = metadata.get('width')
-        height = metadata.get('height')
-        if width and height:
-            resolution = f'{width}x{height}'
-
-        length = len(list(metadata)) - 2
-        half_the_length = round(length) * 0.5
+        meta_string_left, meta_string_right = metadata_overlay_text(metadata, tags)
 
-        meta_string_left = f'Resolution: {resolution}'
-        meta_string_right = ''
-
-        for index, (key, value) in enumerate(metadata.items()):
-            if key in ('width', 'height'):
-                continue
+        self.thumbnail_overlay.label_left.setText(meta_string_left)
+        self.thumbnail_overlay.label_right.setText(meta_string_right)
 
-            if index < half_the_length:
-                meta_string_left += '\n'
-                meta_string_left += f'{key}: {value}'
+    def set_conversion_progress(self, frame: int, total_frames: int) -> None:
+        """
+        Shows the progress of the conversion in the overlay.
 
-            else:
-                meta_string_right += '\n'
-                meta_string_right += f'{key}: {value}'
+        :param frame: Number of frames converted.
+        :type frame: int
+        :param total_frames: Number of frames of the source.
+        :type total_frames: int
+        """
+        meta_string_left, meta_string_right = conversion_progress_text(frame, total_frames)
 
         self.thumbnail_overlay.label_left.setText(meta_string_left)
         self.thumbnail_overlay.label_right.setText(meta_string_right)
@@ -201,6 +246,14 @@ class Thumbnails(QtWidgets.QFrame):
         self.video.video_label.setGraphicsEffect(opacity)
         self.movie.start()
 
+    def set_placeholder(self) -> None:
+        """
+        Shows an empty frame until the thumbnail image is decoded.
+        """
+        pixmap = QtGui.QPixmap(self.thumbnail_width, self.thumbnail_height)
+        pixmap.fill(QtGui.QColor(45, 45, 45))
+        self.video.video_label.setPixmap(pixmap)
+
     def update_image_thumbnail(self, image_file: str) -> None:
         """
        Updates the thumbnail with the provided image file.
@@ -217,13 +270,8 @@ class Thumbnails(QtWidgets.QFrame):
             image_file = self.__error_image
 
         if os.path.isfile(image_file):
-            pixmap = QtGui.QPixmap(image_file)
             self.video.video_label.setPixmap(
-                pixmap.scaled(
-                    self.thumbnail_width,
-                    self.thumbnail_height,
-                    QtCore.Qt.KeepAspectRatio)
-            )
+                _pixmap_cache.cache.pixmap(image_file, self.thumbnail_width, self.thumbnail_height))
 
         self.video.video_label.thumbnail = image_file
 
@@ -13,6 +13,11 @@ Key Features:
     - **Context Menu**: Provides a context menu for actions like creating tags, adding/removing tags, refreshing proxies, and deleting proxies.
     - **Dynamic Resizing**: Automatically adjusts the number of columns based on the widget's width.
     - **Threading**: Utilizes a thread pool for asynchronous operations like thumbnail rendering.
+    - **Progressive Loading**: The first screenful of thumbnails is added at once, the rest in time-sliced batches.
+    - **Asynchronous Decoding**: Thumbnail images are decoded by `_image_loader` off the GUI thread, visible cells
+      first; cells show a placeholder until their image is ready.
+    - **Preview Prefetching**: The first frames of the visible proxies are decoded by `_preview_prefetch` while the
+      grid is idle.
     - **Signals**: Emits signals for various events such as file drops, drags, tag creation, and proxy updates.
 
 Classes:
@@ -30,17 +35,18 @@ Dependencies:
 # -------------------------------- built-in Modules ----------------------------------
 import math
 import os
+import time
 from typing import List, Tuple, Callable, Optional
 from functools import partial
 
 # ------------------------------- ThirdParty Modules ---------------------------------
 try:
     from PySide2.QtWidgets import QTableWidget, QFrame, QMenu, QAction, QTableWidgetItem, QVBoxLayout, QWidget
-    from PySide2.QtCore import Signal, Qt, QMimeData, QThreadPool, QRunnable, QCoreApplication, QPoint
+    from PySide2.QtCore import Signal, Qt, QMimeData, QThreadPool, QRunnable, QPoint, QTimer
     from PySide2.QtGui import QIcon, QDrag
 except ModuleNotFoundError:
     from PySide6.QtWidgets import QTableWidget, QFrame, QMenu, QTableWidgetItem, QVBoxLayout, QWidget
-    from PySide6.QtCore import Signal, Qt, QMimeData, QThreadPool, QRunnable, QCoreApplication, QPoint
+    from PySide6.QtCore import Signal, Qt, QMimeData, QThreadPool, QRunnable, QPoint, QTimer
     from PySide6.QtGui import QAction, QIcon, QDrag
 
 # -------------------------------- Custom Modules ------------------------------------
@@ -48,6 +54,9 @@ from . import _thumbnail
 from data import config
 from . import commonWidgets
 from . import _progressbar
+from . import _pixmap_cache
+from . import _image_loader
+from . import _preview_prefetch
 
 
 class ThumbnailUI(QTableWidget):
@@ -110,6 +119,14 @@ class ThumbnailUI(QTableWidget):
                 - `category (str)`: The current category.
                 - `source_files (list)`: List of source files to untag.
                 - `tag (str)`: The tag to remove.
+        - **on_load_finished**: Emitted when a `load_thumbnails` finishes or is cancelled.
+            - Args:
+                - `total_items (int)`: The number of loaded thumbnails.
+                - `is_cancelled (bool)`: Whether the loading was cancelled by `reset_attributes`.
+        - **on_prioritize_conversions**: Emitted once scrolling or dropping settles, to convert the visible cells
+          first.
+            - Args:
+                - `source_files (list)`: The source files of the visible cells being converted.
     """
     on_drop = Signal(str, str, str)
     on_drag = Signal(str)
@@ -123,6 +140,8 @@ class ThumbnailUI(QTableWidget):
     on_create_tag = Signal(str)
     on_add_tag = Signal(str, str, list, str)
     on_remove_tag = Signal(str, str, list, str)
+    on_load_finished = Signal(int, bool)
+    on_prioritize_conversions = Signal(list)
 
     def __init__(self, parent=None):
         """
@@ -141,10 +160,24 @@ class ThumbnailUI(QTableWidget):
         self.rows = 0
         self.total_columns = 0
         self.overlay_font_size = 10
+        self.preview_mode = config.PREVIEW_MODES[0]
         self.__tags = []
         self.__threadpool = QThreadPool()
         self.__total_files = 0
         self.__last_cell = (0, 0)
+        self.__pending_load = None
+        self.__load_timer = QTimer(self)
+        self.__load_timer.timeout.connect(self._load_next_batch)
+        self.__image_loader = _image_loader.ImageLoader(self)
+        self.__image_loader.on_image_ready.connect(self._on_image_ready)
+        self.__waiting_cells = {}
+        self.__deferred_cells = {}
+        self.__prefetcher = _preview_prefetch.PreviewPrefetcher(
+            self._visible_previews, lambda: self.__threadpool.activeThreadCount() > 0, self)
+        self.__priority_timer = QTimer(self)
+        self.__priority_timer.setSingleShot(True)
+        self.__priority_timer.setInterval(config.CONVERSION_PRIORITY_DEBOUNCE_MS)
+        self.__priority_timer.timeout.connect(self._prioritize_visible_conversions)
 
         self.__cell_position_updated = False
         self._set_widget_properties()
@@ -185,10 +218,33 @@ class ThumbnailUI(QTableWidget):
         """
         self.__threadpool.setMaxThreadCount(thread_count)
 
+    def set_preview_mode(self, preview_mode: str) -> None:
+        """
+        Set the hover preview interaction of the cells.
+
+        :param preview_mode: One of `config.PREVIEW_MODES`.
+        :type preview_mode: str
+        """
+        self.preview_mode = preview_mode
+
+        for row in range(self.rowCount()):
+            for column in range(self.columnCount()):
+                widget = self.cellWidget(row, column)
+                if isinstance(widget, _thumbnail.Thumbnails):
+                    widget.video.scrub_mode = preview_mode == 'scrub'
+
     def reset_attributes(self) -> None:
         """
         Reset the attributes of the widget to their initial state.
+
+        Cancels a `load_thumbnails` still in progress.
         """
+        self._cancel_pending_load()
+        self.__waiting_cells.clear()
+        self.__deferred_cells.clear()
+        self.__image_loader.cancel_all()
+        self.__prefetcher.cancel_all()
+        self.__priority_timer.start()
         self.rows = 0
         self.setRowCount(self.rows)
         self.__total_files = 0
@@ -227,6 +283,8 @@ class ThumbnailUI(QTableWidget):
         self.cell_width = cell_width
         self.cell_height = cell_height
         self.calculate_column()
+        _pixmap_cache.cache.retain_size(cell_width, cell_height)
+        self.__prefetcher.schedule()
 
     def dragEnterEvent(self, event) -> None:
         """
@@ -451,22 +509,146 @@ class ThumbnailUI(QTableWidget):
             self.on_drop_convert_mov.emit(
                 source_file, proxy_file, is_image_seq, self.__last_cell, self.current_group, self.current_category)
 
+        self.__priority_timer.start()
+        self._disable_cells()
+
+    def on_conversion_progress(self, source_file: str, cell_position: Tuple[int, int], frame: int,
+                               total_frames: int) -> None:
+        """
+        Show the progress of the conversion of a cell.
+
+        :param source_file: The path of the source file.
+        :type source_file: str
+        :param cell_position: The position of the cell.
+        :type cell_position: tuple
+        :param frame: Number of frames converted.
+        :type frame: int
+        :param total_frames: Number of frames of the source.
+        :type total_frames: int
+        """
+        item = self.item(*cell_position)
+        widget = self.cellWidget(*cell_position)
+        if item is None or item.data(Qt.UserRole) != source_file or not isinstance(widget, _thumbnail.Thumbnails):
+            return
+
+        widget.set_conversion_progress(frame, total_frames)
+
+    def on_conversion_cancelled(self, source_file: str, cell_position: Tuple[int, int]) -> None:
+        """
+        Remove the cell of a dropped file once its conversion is cancelled or failed, it is not in the library.
+
+        Dropped cells hold their source file until their proxy is rendered, cells of the library (e.g. a failed
+        recache) are kept. The last cell is given back to the next drop, other cells are left empty and disabled,
+        as the cells after them keep their position for their own conversions.
+
+        :param source_file: The path of the source file.
+        :type source_file: str
+        :param cell_position: The position of the cell.
+        :type cell_position: tuple
+        """
+        item = self.item(*cell_position)
+        if item is None or item.data(Qt.UserRole) != source_file:
+            return
+
+        self.removeCellWidget(*cell_position)
+
+        if tuple(cell_position) != self.__last_cell:
+            empty_item = QTableWidgetItem()
+            empty_item.setFlags(Qt.NoItemFlags)
+            self.setItem(cell_position[0], cell_position[1], empty_item)
+            return
+
+        self.takeItem(*cell_position)
+        row, column = self.__last_cell
+
+        if column:
+            self.__last_cell = row, column - 1
+        elif row:
+            self.setRowCount(row)
+            self.__last_cell = row - 1, self.total_columns - 1
+        else:
+            self.setRowCount(0)
+
         self._disable_cells()
 
     def load_thumbnails(self, thumbnail_list: List[dict], get_thumbnail_fn: Callable[[str], str]) -> None:
         """
         Load thumbnails from a list of data.
 
+        The first screenful is added at once, the rest in batches from a timer, each batch stopping after
+        `config.THUMBNAIL_LOAD_FRAME_BUDGET_MS` so the UI stays responsive. `reset_attributes` cancels the
+        remaining batches.
+
         :param thumbnail_list: List of thumbnail data.
         :type thumbnail_list: list
         :param get_thumbnail_fn: get thumbnail from proxy file callable function (from _utilities)
         :type get_thumbnail_fn: Callable
         """
-        for data in thumbnail_list:
+        self._cancel_pending_load()
+        self.__pending_load = [thumbnail_list, 0, get_thumbnail_fn]
+
+        columns = max(self.total_columns, 1)
+        visible_rows = math.ceil(self.viewport().height() / max(self.cell_height, 1))
+        self._add_batch(count=visible_rows * columns)
+
+        if self.__pending_load is not None:
+            self.__load_timer.start(0)
+
+    def _load_next_batch(self) -> None:
+        """
+        Add the next batch of thumbnails within the frame budget.
+        """
+        if self.__pending_load is None:
+            self.__load_timer.stop()
+            return
+
+        self._add_batch(deadline=time.perf_counter() + config.THUMBNAIL_LOAD_FRAME_BUDGET_MS / 1000)
+
+    def _add_batch(self, count: Optional[int] = None, deadline: Optional[float] = None) -> None:
+        """
+        Add thumbnails of the pending load, up to a count or until a deadline, and finish the load when it is done.
+
+        :param count: The maximum number of thumbnails to add.
+        :type count: int, optional
+        :param deadline: The `time.perf_counter` time to stop at.
+        :type deadline: float, optional
+        """
+        thumbnail_list, index, get_thumbnail_fn = self.__pending_load
+        end = len(thumbnail_list) if count is None else min(index + count, len(thumbnail_list))
+
+        while index < end:
+            data = thumbnail_list[index]
             self._update_cell_positions(data['source'])
             self._add_item(data, is_dropped=False, thumbnail_fn=get_thumbnail_fn)
-            QCoreApplication.processEvents()
+            index += 1
+
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+        self.__pending_load[1] = index
+        total_items = len(thumbnail_list)
+
+        if index < total_items:
+            self.update_status.emit(f'Loading thumbnails: {index}/{total_items}')
+            return
+
+        self.__pending_load = None
+        self.__load_timer.stop()
         self._disable_cells()
+        self.update_status.emit(f'Loaded {total_items} thumbnail(s)')
+        self.__prefetcher.schedule()
+        self.on_load_finished.emit(total_items, False)
+
+    def _cancel_pending_load(self) -> None:
+        """
+        Cancel the remaining batches of a load in progress.
+        """
+        self.__load_timer.stop()
+
+        if self.__pending_load is not None:
+            loaded_items = self.__pending_load[1]
+            self.__pending_load = None
+            self.on_load_finished.emit(loaded_items, True)
 
     def _update_cell_positions(self, dropped_file: list or str) -> None:
         """
@@ -522,19 +704,28 @@ class ThumbnailUI(QTableWidget):
 
         if not is_dropped:
             thumbnail_image = thumbnail_fn(proxy_file)
-            self.on_render_completed(data, thumbnail_image, cell_position=self.__last_cell)
+            self._update_cell(data, thumbnail_image, cell_position=self.__last_cell)
 
     def _thumbnail_widget_connections(self, thumbnail_widget):
         thumbnail_widget.video.on_enter.connect(partial(self.progress_bar.add_progress_bar, thumbnail_widget.video))
         thumbnail_widget.video.on_leave.connect(self.progress_bar.remove_progress_bar)
         thumbnail_widget.video.set_range.connect(self.progress_bar.set_range)
         thumbnail_widget.video.update_progress_value.connect(self.progress_bar.update_value)
+        thumbnail_widget.video.set_progress_value.connect(self.progress_bar.setValue)
+        thumbnail_widget.video.scrub_mode = self.preview_mode == 'scrub'
 
     def _disable_cells(self) -> None:
         """"
         Disable empty cells in the table widget.
+
+        Cells are filled left to right, so rows whose last cell is set are skipped.
         """
+        last_column = self.columnCount() - 1
+
         for row in range(self.rowCount()):
+            if self.item(row, last_column):
+                continue
+
             for col in range(self.columnCount()):
                 if self.item(row, col):
                     continue
@@ -562,6 +753,21 @@ class ThumbnailUI(QTableWidget):
         """
         Handle the completion of thumbnail rendering.
 
+        :param data: The data associated with the thumbnail.
+        :type data: dict
+        :param thumbnail_image: The path to the thumbnail image.
+        :type thumbnail_image: str
+        :param cell_position: The position of the cell.
+        :type cell_position: tuple
+        """
+        _pixmap_cache.cache.invalidate(thumbnail_image)
+        self._update_cell(data, thumbnail_image, cell_position)
+        self.__prefetcher.schedule()
+
+    def _update_cell(self, data: dict, thumbnail_image: str, cell_position: Tuple[int, int]) -> None:
+        """
+        Update the thumbnail, overlay and data of a cell.
+
         :param data: The data associated with the thumbnail.
         :type data: dict
         :param thumbnail_image: The path to the thumbnail image.
@@ -572,10 +778,134 @@ class ThumbnailUI(QTableWidget):
         proxy_file = data['proxy']
 
         widget = self.cellWidget(*cell_position)
-        widget.update_image_thumbnail(thumbnail_image)
+        self._set_cell_image(widget, thumbnail_image, cell_position)
         widget.set_metadata_overlay(data['metadata'], data['tags'])
         item = self.item(*cell_position)
         item.setData(Qt.UserRole, data)
 
         if proxy_file.endswith('.mov') and os.path.isfile(thumbnail_image):
             widget.update_video_thumbnail(proxy_file)
+
+    def _set_cell_image(self, widget: _thumbnail.Thumbnails, thumbnail_image: str, cell_position: Tuple[int, int]):
+        """
+        Show the thumbnail image of a cell if it is decoded, otherwise show a placeholder and request it.
+
+        Cells outside the viewport are only requested once they are scrolled into view.
+
+        :param widget: The thumbnail widget of the cell.
+        :type widget: _thumbnail.Thumbnails
+        :param thumbnail_image: The path to the thumbnail image.
+        :type thumbnail_image: str
+        :param cell_position: The position of the cell.
+        :type cell_position: tuple
+        """
+        key = _pixmap_cache.cache.key(thumbnail_image, widget.thumbnail_width, widget.thumbnail_height)
+
+        if _pixmap_cache.cache.get(key) is not None:
+            widget.update_image_thumbnail(thumbnail_image)
+            return
+
+        widget.set_placeholder()
+        if self._is_cell_visible(cell_position):
+            self.__waiting_cells.setdefault(key, set()).add(cell_position)
+            self.__image_loader.request(key)
+        else:
+            self.__deferred_cells[cell_position] = key
+
+    def _on_image_ready(self, key: Tuple[str, int, int, int]) -> None:
+        """
+        Show a decoded thumbnail image in the cells waiting on it.
+
+        :param key: The pixmap cache key.
+        :type key: tuple
+        """
+        for cell_position in self.__waiting_cells.pop(key, ()):
+            widget = self.cellWidget(*cell_position)
+            if widget is not None:
+                widget.update_image_thumbnail(key[0])
+
+    def _is_cell_visible(self, cell_position: Tuple[int, int]) -> bool:
+        """
+        Check whether a cell intersects the viewport.
+
+        :param cell_position: The position of the cell.
+        :type cell_position: tuple
+        :return: True if the cell is visible.
+        :rtype: bool
+        """
+        return self.visualRect(self.model().index(*cell_position)).intersects(self.viewport().rect())
+
+    def scrollContentsBy(self, dx: int, dy: int) -> None:
+        """
+        Cancel the thumbnail requests of cells scrolled out of view and request the ones scrolled into view, and
+        prefetch the previews scrolled into view.
+
+        :param dx: The horizontal scroll offset.
+        :type dx: int
+        :param dy: The vertical scroll offset.
+        :type dy: int
+        """
+        super().scrollContentsBy(dx, dy)
+
+        for key, cell_positions in list(self.__waiting_cells.items()):
+            if any(self._is_cell_visible(cell_position) for cell_position in cell_positions):
+                continue
+
+            self.__waiting_cells.pop(key)
+            self.__image_loader.cancel(key)
+            for cell_position in cell_positions:
+                self.__deferred_cells[cell_position] = key
+
+        for cell_position, key in list(self.__deferred_cells.items()):
+            if self._is_cell_visible(cell_position):
+                self.__deferred_cells.pop(cell_position)
+                self.__waiting_cells.setdefault(key, set()).add(cell_position)
+                self.__image_loader.request(key)
+
+        self.__prefetcher.schedule()
+        self.__priority_timer.start()
+
+    def _visible_rows(self) -> range:
+        """
+        Get the rows intersecting the viewport.
+
+        :return: The visible rows.
+        :rtype: range
+        """
+        first_row = max(self.rowAt(0), 0)
+        last_row = self.rowAt(self.viewport().height() - 1)
+        last_row = self.rowCount() - 1 if last_row < 0 else last_row
+        return range(first_row, last_row + 1)
+
+    def _prioritize_visible_conversions(self) -> None:
+        """
+        Request the conversions of the visible cells to be started first.
+        """
+        source_files = []
+
+        for row in self._visible_rows():
+            for column in range(self.columnCount()):
+                item = self.item(row, column)
+                if item is not None and isinstance(item.data(Qt.UserRole), str):
+                    # dropped cells hold their source file until their proxy is rendered
+                    source_files.append(item.data(Qt.UserRole))
+
+        self.on_prioritize_conversions.emit(source_files)
+
+    def _visible_previews(self) -> List[Tuple[str, int, int]]:
+        """
+        Get the hover previews of the visible cells whose proxy is converted.
+
+        :return: The (proxy file, width, height) of the previews, in cell order.
+        :rtype: List[Tuple[str, int, int]]
+        """
+        previews = []
+
+        for row in self._visible_rows():
+            for column in range(self.columnCount()):
+                widget = self.cellWidget(row, column)
+                if not isinstance(widget, _thumbnail.Thumbnails) or not widget.video.proxy_file.endswith('.mov'):
+                    continue
+                previews.append((widget.video.proxy_file, widget.video.thumbnail_width, widget.video.thumbnail_height))
+
+        return previews
@@ -0,0 +1,1041 @@
+"""
+ThumbnailView Module
+====================
+
+This module provides a virtualized, model/view based alternative to `_thumbnailUI.ThumbnailUI`. Instead of creating a
+`Thumbnails` widget for every cell, the entries are held by a list model and painted by a delegate, so only the visible
+thumbnails are ever drawn and memory and load time stay flat regardless of the category size.
+
+Key Features:
+    - **ThumbnailModel**: A list model holding the thumbnail data of the current category.
+    - **ThumbnailDelegate**: Paints the thumbnail image, the processing placeholder and the metadata overlay.
+    - **ThumbnailView**: A `QListView` in icon mode exposing the same signals and slots as `ThumbnailUI`.
+    - **Hover Preview**: A single `ProxyPreview` is moved over the hovered cell to play its proxy.
+    - **Asynchronous Decoding**: Thumbnails missing from the pixmap cache are decoded by `_image_loader` while a
+      placeholder is painted; requests of cells scrolled out of view are cancelled.
+    - **Preview Prefetching**: The first frames of the visible proxies are decoded by `_preview_prefetch` while the
+      view is idle.
+
+Cell positions exchanged with `_operations.Operations` are `(row, 0)`, `row` being the model row.
+"""
+
+# -------------------------------- built-in Modules ----------------------------------
+import os
+from typing import List, Tuple, Callable, Optional, Dict
+
+# ------------------------------- ThirdParty Modules ---------------------------------
+try:
+    from PySide2.QtWidgets import QListView, QStyledItemDelegate, QStyle, QFrame, QMenu, QAction, QAbstractItemView
+    from PySide2.QtCore import (Signal, Qt, QMimeData, QThreadPool, QRunnable, QPoint, QSize, QRect,
+                                QAbstractListModel, QModelIndex, QTimer)
+    from PySide2.QtGui import QIcon, QDrag, QPixmap, QColor, QLinearGradient, QPainter
+except ModuleNotFoundError:
+    from PySide6.QtWidgets import QListView, QStyledItemDelegate, QStyle, QFrame, QMenu, QAbstractItemView
+    from PySide6.QtCore import (Signal, Qt, QMimeData, QThreadPool, QRunnable, QPoint, QSize, QRect,
+                                QAbstractListModel, QModelIndex, QTimer)
+    from PySide6.QtGui import QAction, QIcon, QDrag, QPixmap, QColor, QLinearGradient, QPainter
+
+# -------------------------------- Custom Modules ------------------------------------
+from data import config
+from . import _thumbnail
+from . import _preview_proxy
+from . import commonWidgets
+from . import _progressbar
+from . import _pixmap_cache
+from . import _image_loader
+from . import _preview_prefetch
+
+_ICONS_DIR = f'{os.path.dirname(os.path.dirname(__file__))}/icons'
+_CELL_MARGIN = 3
+_PLACEHOLDER_COLOR = QColor(45, 45, 45)
+
+
+class _ThumbnailItem:
+    """
+    A single thumbnail of the model.
+
+    Attributes:
+        data (dict): The thumbnail data (source, proxy, metadata and tags).
+        thumbnail (str): The path to the thumbnail image, empty until known.
+        is_processing (bool): Whether the proxy is still being converted.
+        overlay (Tuple[str, str]): The left and right texts of the metadata overlay, or of the conversion progress
+            while processing.
+    """
+    __slots__ = ('data', 'thumbnail', 'is_processing', 'overlay')
+
+    def __init__(self, data: dict, thumbnail: str = '', is_processing: bool = False) -> None:
+        """
+        Initialize the item.
+
+        :param data: The thumbnail data.
+        :type data: dict
+        :param thumbnail: The path to the thumbnail image.
+        :type thumbnail: str
+        :param is_processing: Whether the proxy is still being converted.
+        :type is_processing: bool
+        """
+        self.data = data
+        self.thumbnail = thumbnail
+        self.is_processing = is_processing
+        self.overlay = ('', '') if is_processing else \
+            _thumbnail.metadata_overlay_text(dict(data.get('metadata') or {}), data.get('tags'))
+
+
+class ThumbnailModel(QAbstractListModel):
+    """
+    A list model holding the thumbnails of the current category.
+
+    `Qt.UserRole` returns the thumbnail data, like the items of `ThumbnailUI`.
+    """
+    ThumbnailRole = Qt.UserRole + 1
+    ProcessingRole = Qt.UserRole + 2
+    OverlayRole = Qt.UserRole + 3
+
+    def __init__(self, parent=None) -> None:
+        """
+        Initialize an empty model.
+
+        :param parent: The parent object.
+        :type parent: QObject, optional
+        """
+        super().__init__(parent)
+        self.__items = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """
+        Get the number of thumbnails.
+
+        :param parent: The parent index, always invalid for a list model.
+        :type parent: QModelIndex
+        :return: The number of thumbnails.
+        :rtype: int
+        """
+        return 0 if parent.isValid() else len(self.__items)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """
+        Get the data of a thumbnail for a role.
+
+        :param index: The index of the thumbnail.
+        :type index: QModelIndex
+        :param role: The data role.
+        :type role: int
+        :return: The data, or None for unsupported roles.
+        """
+        if not index.isValid() or not 0 <= index.row() < len(self.__items):
+            return None
+
+        item = self.__items[index.row()]
+        if role == Qt.UserRole:
+            return item.data
+        if role == self.ThumbnailRole:
+            return item.thumbnail
+        if role == self.ProcessingRole:
+            return item.is_processing
+        if role == self.OverlayRole:
+            return item.overlay
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return os.path.basename(item.data['source'])
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        """
+        Get the item flags of a thumbnail.
+
+        :param index: The index of the thumbnail.
+        :type index: QModelIndex
+        :return: The item flags.
+        :rtype: Qt.ItemFlag
+        """
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+
+    def set_items(self, thumbnail_list: List[dict], get_thumbnail_fn: Callable[[str], str]) -> None:
+        """
+        Replace the thumbnails of the model.
+
+        :param thumbnail_list: List of thumbnail data.
+        :type thumbnail_list: list
+        :param get_thumbnail_fn: get thumbnail from proxy file callable function (from _utilities)
+        :type get_thumbnail_fn: Callable
+        """
+        self.beginResetModel()
+        self.__items = [_ThumbnailItem(data, get_thumbnail_fn(data.get('proxy', '')))
+                        for data in thumbnail_list if data.get('source')]
+        self.endResetModel()
+
+    def append(self, source_file: str) -> int:
+        """
+        Append a dropped file, shown as processing until its proxy is rendered.
+
+        :param source_file: The path of the source file.
+        :type source_file: str
+        :return: The row of the new thumbnail.
+        :rtype: int
+        """
+        row = len(self.__items)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.__items.append(
+            _ThumbnailItem({'source': source_file, 'proxy': '', 'metadata': {}, 'tags': []}, is_processing=True))
+        self.endInsertRows()
+        return row
+
+    def update_item(self, row: int, data: dict, thumbnail_image: str) -> None:
+        """
+        Update a thumbnail with its rendered data, see `_trusted_row`.
+
+        :param row: The row of the thumbnail.
+        :type row: int
+        :param data: The thumbnail data.
+        :type data: dict
+        :param thumbnail_image: The path to the thumbnail image.
+        :type thumbnail_image: str
+        """
+        row = self._trusted_row(row, data['source'])
+        if row is None:
+            return
+
+        self.__items[row] = _ThumbnailItem(data, thumbnail_image)
+        self.dataChanged.emit(self.index(row), self.index(row))
+
+    def set_progress(self, row: int, source_file: str, frame: int, total_frames: int) -> None:
+        """
+        Show the conversion progress of a processing thumbnail in its overlay.
+
+        :param row: The row of the thumbnail.
+        :type row: int
+        :param source_file: The path of the source file.
+        :type source_file: str
+        :param frame: Number of frames converted.
+        :type frame: int
+        :param total_frames: Number of frames of the source.
+        :type total_frames: int
+        """
+        row = self._trusted_row(row, source_file)
+        if row is None:
+            return
+
+        item = self.__items[row]
+        if item.is_processing:
+            item.overlay = _thumbnail.conversion_progress_text(frame, total_frames)
+            self.dataChanged.emit(self.index(row), self.index(row))
+
+    def set_tags(self, row: int, tags: List[str]) -> None:
+        """
+        Update the tags of a thumbnail.
+
+        :param row: The row of the thumbnail.
+        :type row: int
+        :param tags: The tags of the thumbnail.
+        :type tags: list
+        """
+        item = self.__items[row]
+        item.data['tags'] = tags
+        self.__items[row] = _ThumbnailItem(item.data, item.thumbnail, item.is_processing)
+        self.dataChanged.emit(self.index(row), self.index(row))
+
+    def remove_processing(self, row: int, source_file: str) -> None:
+        """
+        Remove a dropped thumbnail whose conversion was cancelled or failed. Thumbnails of the library are kept.
+
+        :param row: The row of the thumbnail.
+        :type row: int
+        :param source_file: The path of the source file.
+        :type source_file: str
+        """
+        row = self._trusted_row(row, source_file)
+        if row is None or not self.__items[row].is_processing:
+            return
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.__items[row]
+        self.endRemoveRows()
+
+    def _trusted_row(self, row: int, source_file: str) -> Optional[int]:
+        """
+        Get the row of a source file, trusting the given row only if it still holds the source file, as rows move
+        when thumbnails are removed or the model is reloaded while a proxy is rendering.
+
+        :param row: The row of the thumbnail when its conversion started.
+        :type row: int
+        :param source_file: The path of the source file.
+        :type source_file: str
+        :return: The row, or None if the source file is not in the model.
+        :rtype: Optional[int]
+        """
+        if 0 <= row < len(self.__items) and self.__items[row].data['source'] == source_file:
+            return row
+        return self.row_of(source_file)
+
+    def row_of(self, source_file: str) -> Optional[int]:
+        """
+        Get the row of a source file.
+
+        :param source_file: The path of the source file.
+        :type source_file: str
+        :return: The row, or None if the source file is not in the model.
+        :rtype: Optional[int]
+        """
+        for row, item in enumerate(self.__items):
+            if item.data['source'] == source_file:
+                return row
+        return None
+
+    def clear(self) -> None:
+        """Remove every thumbnail."""
+        self.beginResetModel()
+        self.__items = []
+        self.endResetModel()
+
+
+class ThumbnailDelegate(QStyledItemDelegate):
+    """
+    Paints a thumbnail cell: the thumbnail image (or a processing placeholder) and the metadata overlay.
+
+    Thumbnails are only painted from the pixmap cache. A missing one is painted as a placeholder and requested
+    through `on_pixmap_missing`.
+
+    :Signals:
+        - **on_pixmap_missing**: Emitted when a cell is painted before its thumbnail is decoded.
+            - Args:
+                - `key (tuple)`: The pixmap cache key.
+                - `row (int)`: The row of the cell.
+
+    Attributes:
+        cell_width (int): The width of a cell.
+        cell_height (int): The height of a cell.
+        font_size (float): The pixel size of the overlay font.
+        hovered_row (int): The row under the hover preview, drawn without overlay.
+    """
+    on_pixmap_missing = Signal(tuple, int)
+
+    def __init__(self, parent=None) -> None:
+        """
+        Initialize the delegate.
+
+        :param parent: The parent object.
+        :type parent: QObject, optional
+        """
+        super().__init__(parent)
+        self.cell_width = 0
+        self.cell_height = 0
+        self.font_size = 10
+        self.hovered_row = -1
+
+    def sizeHint(self, option, index: QModelIndex) -> QSize:
+        """
+        Get the size of a cell.
+
+        :param option: The style options of the item.
+        :type option: QStyleOptionViewItem
+        :param index: The index of the thumbnail.
+        :type index: QModelIndex
+        :return: The cell size.
+        :rtype: QSize
+        """
+        return QSize(int(self.cell_width), int(self.cell_height))
+
+    def pixmap(self, image_file: str, width: int, height: int) -> QPixmap:
+        """
+        Get an image scaled to fit a size, keeping the aspect ratio, from the shared pixmap cache.
+
+        :param image_file: The path to the image file.
+        :type image_file: str
+        :param width: The width to fit.
+        :type width: int
+        :param height: The height to fit.
+        :type height: int
+        :return: The scaled pixmap, the error image if the file is missing.
+        :rtype: QPixmap
+        """
+        return _pixmap_cache.cache.pixmap(image_file, width, height)
+
+    def paint(self, painter: QPainter, option, index: QModelIndex) -> None:
+        """
+        Paint a cell.
+
+        :param painter: The painter.
+        :type painter: QPainter
+        :param option: The style options of the item.
+        :type option: QStyleOptionViewItem
+        :param index: The index of the thumbnail.
+        :type index: QModelIndex
+        """
+        rect = option.rect.adjusted(_CELL_MARGIN, _CELL_MARGIN, -_CELL_MARGIN, -_CELL_MARGIN)
+        is_processing = index.data(ThumbnailModel.ProcessingRole)
+
+        painter.save()
+        if option.state & QStyle.State_Selected:
+            painter.fillRect(option.rect, option.palette.highlight())
+
+        if is_processing:
+            painter.setOpacity(0.3)
+            pixmap = self.pixmap(f'{_ICONS_DIR}/processing.gif', rect.width(), rect.height())
+        else:
+            key = _pixmap_cache.cache.key(index.data(ThumbnailModel.ThumbnailRole), rect.width(), rect.height())
+            pixmap = _pixmap_cache.cache.get(key)
+
+            if pixmap is None:
+                painter.fillRect(rect, _PLACEHOLDER_COLOR)
+                self.on_pixmap_missing.emit(key, index.row())
+
+        if pixmap is not None:
+            painter.drawPixmap(
+                rect.x() + (rect.width() - pixmap.width()) // 2,
+                rect.y() + (rect.height() - pixmap.height()) // 2,
+                pixmap)
+        painter.setOpacity(1)
+
+        overlay = index.data(ThumbnailModel.OverlayRole)
+        if (is_processing and any(overlay)) or (not is_processing and index.row() != self.hovered_row):
+            # processing cells only show an overlay once their conversion reports progress
+            self._paint_overlay(painter, option.rect, overlay)
+        painter.restore()
+
+    def _paint_overlay(self, painter: QPainter, rect: QRect, overlay: Tuple[str, str]) -> None:
+        """
+        Paint the metadata overlay of a cell, as `_thumbnail.ThumbnailOverlay` does.
+
+        :param painter: The painter.
+        :type painter: QPainter
+        :param rect: The rectangle of the cell.
+        :type rect: QRect
+        :param overlay: The left and right overlay texts.
+        :type overlay: Tuple[str, str]
+        """
+        width, height = rect.width(), rect.height()
+
+        gradient = QLinearGradient(0, rect.y() + width / 2, 0, rect.y() + height)
+        gradient.setColorAt(0, QColor(60, 60, 60, 150))
+        gradient.setColorAt(1, QColor(60, 60, 60, 255))
+        painter.fillRect(
+            rect.x() + _CELL_MARGIN, int(rect.y() + height / 1.3), width - 2 * _CELL_MARGIN,
+            int(height - height / 1.3) - _CELL_MARGIN, gradient)
+
+        font = painter.font()
+        font.setPixelSize(max(1, int(self.font_size)))
+        painter.setFont(font)
+        painter.setPen(QColor('#cacaca'))
+
+        text_rect = rect.adjusted(4 * _CELL_MARGIN, 0, -4 * _CELL_MARGIN, -3 * _CELL_MARGIN)
+        painter.drawText(text_rect, Qt.AlignBottom | Qt.AlignLeft, overlay[0])
+        painter.drawText(text_rect, Qt.AlignBottom | Qt.AlignRight, overlay[1])
+
+
+class ThumbnailView(QListView):
+    """
+    A virtualized thumbnail grid, a drop-in replacement of `_thumbnailUI.ThumbnailUI`.
+
+    :Signals:
+        Same as `_thumbnailUI.ThumbnailUI`. Cell positions are `(row, 0)`.
+    """
+    on_drop = Signal(str, str, str)
+    on_drag = Signal(str)
+    on_add_preview = Signal(str, tuple)
+    on_drop_convert_mov = Signal(str, str, bool, tuple, str, str)
+    update_status = Signal(str)
+    on_context_menu = Signal()
+    on_open_in_explorer = Signal(str)
+    on_recache_proxy = Signal(str, tuple, str, str)
+    on_delete_proxy = Signal(str, str, list, set)
+    on_create_tag = Signal(str)
+    on_add_tag = Signal(str, str, list, str)
+    on_remove_tag = Signal(str, str, list, str)
+    on_load_finished = Signal(int, bool)
+    on_prioritize_conversions = Signal(list)
+
+    def __init__(self, parent=None):
+        """
+        Initialize the ThumbnailView widget.
+
+        :param parent: The parent widget.
+        :type parent: QWidget, optional
+        """
+        super().__init__(parent=parent)
+        self.current_category = None
+        self.current_group = None
+        self.progress_bar = _progressbar.ThumbnailProgressBar()
+        self.thumbnail_scale = 1
+        self.cell_width = 0
+        self.cell_height = 0
+        self.__tags = []
+        self.__threadpool = QThreadPool()
+        self.__image_loader = _image_loader.ImageLoader(self)
+        self.__waiting_rows = {}
+        self.__prefetcher = _preview_prefetch.PreviewPrefetcher(
+            self._visible_previews, lambda: self.__threadpool.activeThreadCount() > 0, self)
+        self.__priority_timer = QTimer(self)
+        self.__priority_timer.setSingleShot(True)
+        self.__priority_timer.setInterval(config.CONVERSION_PRIORITY_DEBOUNCE_MS)
+        self.__priority_timer.timeout.connect(self._prioritize_visible_conversions)
+
+        self.__model = ThumbnailModel(self)
+        self.__delegate = ThumbnailDelegate(self)
+        self.__preview = _preview_proxy.ProxyPreview('', 0, 0)
+        self.__preview.setParent(self.viewport())
+        self.__preview.hide()
+
+        self._set_widget_properties()
+        self._set_widget_connections()
+
+    def _set_widget_properties(self) -> None:
+        """
+        Set the initial properties of the widget.
+        """
+        self.setModel(self.__model)
+        self.setItemDelegate(self.__delegate)
+        self.setViewMode(QListView.IconMode)
+        self.setResizeMode(QListView.Adjust)
+        self.setMovement(QListView.Static)
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(200)
+        self.setUniformItemSizes(True)
+        self.setWrapping(True)
+        self.setSpacing(0)
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setDragEnabled(True)
+        self.setAcceptDrops(True)
+        self.setMouseTracking(True)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setFrameShape(QFrame.NoFrame)
+        self.setFrameShadow(QFrame.Plain)
+        self.setContextMenuPolicy(Qt.CustomContextMenu)
+
+    def _set_widget_connections(self) -> None:
+        """
+        Connect the context menu, the image loader and the hover preview signals.
+        """
+        self.customContextMenuRequested.connect(self._context_menu)
+        self.__delegate.on_pixmap_missing.connect(self._request_image)
+        self.__image_loader.on_image_ready.connect(self._on_image_ready)
+        self.__preview.on_enter.connect(lambda: self.progress_bar.add_progress_bar(self.__preview))
+        self.__preview.on_leave.connect(self._hide_preview)
+        self.__preview.set_range.connect(self.progress_bar.set_range)
+        self.__preview.update_progress_value.connect(self.progress_bar.update_value)
+        self.__preview.set_progress_value.connect(self.progress_bar.setValue)
+
+    def set_max_thread_count(self, thread_count: int) -> None:
+        """
+        set max thread count of QThreadPool.
+
+        :param thread_count: thread count
+        :type thread_count: int
+        """
+        self.__threadpool.setMaxThreadCount(thread_count)
+
+    def set_preview_mode(self, preview_mode: str) -> None:
+        """
+        Set the hover preview interaction.
+
+        :param preview_mode: One of `config.PREVIEW_MODES`.
+        :type preview_mode: str
+        """
+        self._hide_preview()
+        self.__preview.scrub_mode = preview_mode == 'scrub'
+
+    def reset_attributes(self) -> None:
+        """
+        Reset the attributes of the widget to their initial state.
+        """
+        self._hide_preview()
+        self._cancel_image_requests()
+        self.__prefetcher.cancel_all()
+        self.__priority_timer.start()
+        self.__model.clear()
+
+    def set_tags(self, tags: List[str]) -> None:
+        """
+        Set the list of tags available for the context menu.
+
+        :param tags: List of tags.
+        :type tags: list
+        """
+        self.__tags = tags
+
+    def update_thumbnail_scale(self, cell_width: int, cell_height: int, thumbnail_scale: float) -> None:
+        """
+        Update the thumbnail scale and cell dimensions.
+
+        :param cell_width: The width of each cell.
+        :type cell_width: int
+        :param cell_height: The height of each cell.
+        :type cell_height: int
+        :param thumbnail_scale: The scale factor for the thumbnails.
+        :type thumbnail_scale: float
+        """
+        self.thumbnail_scale = thumbnail_scale
+        self.cell_width = int(cell_width)
+        self.cell_height = int(cell_height)
+
+        self.__delegate.cell_width = self.cell_width
+        self.__delegate.cell_height = self.cell_height
+        self.__delegate.font_size = thumbnail_scale
+        self.setGridSize(QSize(self.cell_width, self.cell_height))
+        self.scheduleDelayedItemsLayout()
+        _pixmap_cache.cache.retain_size(self.cell_width - 2 * _CELL_MARGIN, self.cell_height - 2 * _CELL_MARGIN)
+        self.__prefetcher.schedule()
+
+    def dragEnterEvent(self, event) -> None:
+        """
+        Handle the drag enter event.
+
+        :param event: The drag enter event.
+        :type event: QDragEnterEvent
+        """
+        if event.mimeData():
+            event.accept()
+        else:
+            event.ignore()
+
+    def dragMoveEvent(self, event) -> None:
+        """
+        Handle the drag move event.
+
+        :param event: The drag move event.
+        :type event: QDragMoveEvent
+        """
+        if event.mimeData().hasUrls():
+            event.accept()
+        else:
+            event.ignore()
+
+    def dropEvent(self, event) -> None:
+        """
+        Handle the drop event.
+
+        :param event: The drop event.
+        :type event: QDropEvent
+        """
+        if not self.current_category:
+            return
+
+        for url_ in event.mimeData().urls():
+            self.on_drop.emit(url_.toLocalFile(), self.current_group, self.current_category)
+
+    def startDrag(self, supported_actions) -> None:
+        """
+        Drag the source files of the selected thumbnails, as text.
+
+        :param supported_actions: The supported drop actions.
+        :type supported_actions: Qt.DropActions
+        """
+        data = '\n'.join(str(data['source']) for data in self._selected_data() if data.get('source'))
+
+        drag = QDrag(self)
+        mime_data = QMimeData()
+        mime_data.setText(data)
+        drag.setMimeData(mime_data)
+        drag.exec_(Qt.MoveAction)
+
+    def mouseMoveEvent(self, event) -> None:
+        """
+        Handle the mouse move event to move the hover preview over the hovered cell.
+
+        :param event: The mouse move event.
+        :type event: QMouseEvent
+        """
+        super().mouseMoveEvent(event)
+
+        if event.buttons() == Qt.NoButton:
+            self._update_hover(event.pos())
+
+    def leaveEvent(self, event) -> None:
+        """
+        Hide the hover preview when the mouse cursor leaves the widget.
+
+        :param event: The leave event.
+        :type event: QEvent
+        """
+        self._hide_preview()
+        super().leaveEvent(event)
+
+    def scrollContentsBy(self, dx: int, dy: int) -> None:
+        """
+        Hide the hover preview when scrolling, as its cell moves away, and prefetch the previews scrolled into view.
+
+        :param dx: The horizontal scroll offset.
+        :type dx: int
+        :param dy: The vertical scroll offset.
+        :type dy: int
+        """
+        self._hide_preview()
+        super().scrollContentsBy(dx, dy)
+        self._cancel_hidden_image_requests()
+        self.__prefetcher.schedule()
+        self.__priority_timer.start()
+
+    def _visible_indexes(self) -> List[QModelIndex]:
+        """
+        Get the indexes of the cells intersecting the viewport.
+
+        :return: The visible indexes, in row order.
+        :rtype: List[QModelIndex]
+        """
+        viewport_rect = self.viewport().rect()
+        first_index = self.indexAt(QPoint(_CELL_MARGIN, _CELL_MARGIN))
+        indexes = []
+
+        for row in range(first_index.row() if first_index.isValid() else 0, self.__model.rowCount()):
+            index = self.__model.index(row)
+            rect = self.visualRect(index)
+            if rect.top() > viewport_rect.bottom():
+                break
+            if rect.intersects(viewport_rect):
+                indexes.append(index)
+
+        return indexes
+
+    def _prioritize_visible_conversions(self) -> None:
+        """
+        Request the conversions of the visible cells to be started first.
+        """
+        self.on_prioritize_conversions.emit([index.data(Qt.UserRole)['source'] for index in self._visible_indexes()
+                                             if index.data(ThumbnailModel.ProcessingRole)])
+
+    def _visible_previews(self) -> List[Tuple[str, int, int]]:
+        """
+        Get the hover previews of the visible cells whose proxy is converted.
+
+        :return: The (proxy file, width, height) of the previews, in row order.
+        :rtype: List[Tuple[str, int, int]]
+        """
+        previews = []
+
+        for index in self._visible_indexes():
+            if index.data(ThumbnailModel.ProcessingRole):
+                continue
+
+            proxy_file = index.data(Qt.UserRole).get('proxy', '')
+            if proxy_file.endswith('.mov'):
+                rect = self.visualRect(index).adjusted(_CELL_MARGIN, _CELL_MARGIN, -_CELL_MARGIN, -_CELL_MARGIN)
+                previews.append((proxy_file, rect.width(), rect.height()))
+
+        return previews
+
+    def _request_image(self, key: Tuple[str, int, int, int], row: int) -> None:
+        """
+        Request the decoding of the thumbnail of a cell.
+
+        :param key: The pixmap cache key.
+        :type key: Tuple[str, int, int, int]
+        :param row: The row of the cell.
+        :type row: int
+        """
+        self.__waiting_rows.setdefault(key, set()).add(row)
+        self.__image_loader.request(key)
+
+    def _on_image_ready(self, key: Tuple[str, int, int, int]) -> None:
+        """
+        Repaint the cells waiting on a decoded thumbnail.
+
+        :param key: The pixmap cache key.
+        :type key: Tuple[str, int, int, int]
+        """
+        for row in self.__waiting_rows.pop(key, ()):
+            self.update(self.__model.index(row))
+
+    def _cancel_hidden_image_requests(self) -> None:
+        """
+        Cancel the thumbnail requests of cells scrolled out of view, they are requested again when repainted.
+        """
+        viewport_rect = self.viewport().rect()
+
+        for key, rows in list(self.__waiting_rows.items()):
+            if any(self.visualRect(self.__model.index(row)).intersects(viewport_rect) for row in rows):
+                continue
+
+            self.__waiting_rows.pop(key)
+            self.__image_loader.cancel(key)
+
+    def _cancel_image_requests(self) -> None:
+        """
+        Cancel every thumbnail request, e.g. before the model is reset.
+        """
+        self.__waiting_rows.clear()
+        self.__image_loader.cancel_all()
+
+    def _update_hover(self, position: QPoint) -> None:
+        """
+        Attach the hover preview to the cell at a position, if its proxy can be played.
+
+        :param position: The position in the viewport.
+        :type position: QPoint
+        """
+        index = self.indexAt(position)
+        row = index.row() if index.isValid() else -1
+        if row == self.__delegate.hovered_row:
+            return
+
+        self._hide_preview()
+        if row < 0 or index.data(ThumbnailModel.ProcessingRole):
+            return
+
+        proxy_file = index.data(Qt.UserRole).get('proxy', '')
+        thumbnail_image = index.data(ThumbnailModel.ThumbnailRole)
+        if not proxy_file.endswith('.mov') or not os.path.isfile(thumbnail_image):
+            return
+
+        rect = self.visualRect(index).adjusted(_CELL_MARGIN, _CELL_MARGIN, -_CELL_MARGIN, -_CELL_MARGIN)
+        self.__preview.thumbnail_width = rect.width()
+        self.__preview.thumbnail_height = rect.height()
+        self.__preview.proxy_file = proxy_file
+        self.__preview.setGeometry(rect)
+        self.__preview.video_label.thumbnail = thumbnail_image
+        self.__preview.video_label.setPixmap(self.__delegate.pixmap(thumbnail_image, rect.width(), rect.height()))
+        self.__preview.show()
+        self.__preview.raise_()
+
+        self.__delegate.hovered_row = row
+        self.update(index)
+
+    def _hide_preview(self) -> None:
+        """
+        Stop and hide the hover preview.
+        """
+        row = self.__delegate.hovered_row
+        if row < 0:
+            return
+
+        self.__delegate.hovered_row = -1
+        self.__preview.stop_video_preview(self.__preview.video_label)
+        self.progress_bar.remove_progress_bar()
+        self.__preview.hide()
+        self.update(self.__model.index(row))
+
+    def _selected_rows(self) -> List[int]:
+        """
+        Get the selected rows, in order.
+
+        :return: The selected rows.
+        :rtype: list
+        """
+        return sorted(index.row() for index in self.selectionModel().selectedIndexes())
+
+    def _selected_data(self) -> List[Dict]:
+        """
+        Get the thumbnail data of the selected rows.
+
+        :return: The thumbnail data.
+        :rtype: list
+        """
+        return [self.__model.index(row).data(Qt.UserRole) for row in self._selected_rows()]
+
+    def _context_menu(self, position: QPoint) -> None:
+        """
+        Display a context menu at the given position.
+
+        :param position: The position to display the context menu.
+        :type position: QPoint
+        """
+        selected_data = self._selected_data()
+        if not selected_data:
+            return
+
+        menu = QMenu(self)
+        create_tag = menu.addAction(QIcon(f"{_ICONS_DIR}/create_tag.png"), "Create Tag")
+
+        add_tags_menu = QMenu('Add Tags', menu)
+        add_tags_menu.setIcon(QIcon(f"{_ICONS_DIR}/tags.png"))
+        menu.addMenu(add_tags_menu)
+        for tag in self.__tags:
+            tags_action = QAction(tag, add_tags_menu)
+            tags_action.triggered.connect(lambda chk=False, item=tag: self._add_tags(item))
+            add_tags_menu.addAction(tags_action)
+
+        added_tags = [tag for data in selected_data for tag in data['tags'] if tag]
+        if added_tags:
+            remove_tag_menu = QMenu('Remove Tag', menu)
+            remove_tag_menu.setIcon(QIcon(f"{_ICONS_DIR}/remove_tag.png"))
+
+            menu.addMenu(remove_tag_menu)
+            for tag in added_tags:
+                tags_action = QAction(tag, remove_tag_menu)
+                tags_action.triggered.connect(lambda chk=False, item=tag: self._remove_tag(item))
+                remove_tag_menu.addAction(tags_action)
+        menu.addSeparator()
+
+        refresh_preview = menu.addAction(QIcon(f"{_ICONS_DIR}/recache.png"), "Refresh Proxy")
+        delete_proxy = menu.addAction(QIcon(f"{_ICONS_DIR}/delete.png"), "Delete Proxy")
+
+        menu.addSeparator()
+
+        open_in_explorer = menu.addAction(QIcon(f"{_ICONS_DIR}/explore.png"), "Show in Explorer")
+
+        refresh_preview.triggered.connect(self._recache_proxy)
+        delete_proxy.triggered.connect(self._delete_proxy)
+        open_in_explorer.triggered.connect(self._open_in_explorer)
+        create_tag.triggered.connect(self._create_tag)
+
+        menu.exec_(self.mapToGlobal(position))
+
+    def _create_tag(self) -> None:
+        """
+        Create a new tag based on user input.
+        """
+        tag, is_ok = commonWidgets.get_input_widget(title='Create Tag', label='Enter the Tag name:', parent=self)
+        if is_ok:
+            self.on_create_tag.emit(tag)
+
+    def _add_tags(self, tag: str) -> None:
+        """
+        Add a tag to the selected items.
+
+        :param tag: The tag to add.
+        :type tag: str
+        """
+        selected_source_files = [data['source'] for data in self._selected_data()]
+        self._update_tag_in_overlay_label(tag)
+        self.on_add_tag.emit(self.current_group, self.current_category, selected_source_files, tag)
+
+    def _remove_tag(self, tag: str) -> None:
+        """
+        Remove a tag from the selected items.
+
+        :param tag: The tag to remove.
+        :type tag: str
+        """
+        selected_source_files = [data['source'] for data in self._selected_data()]
+        self._update_tag_in_overlay_label(tag, action='remove')
+        self.on_remove_tag.emit(self.current_group, self.current_category, selected_source_files, tag)
+
+    def _open_in_explorer(self) -> None:
+        """
+        Open the selected item in the file explorer.
+        """
+        selected_data = self._selected_data()
+        if 0 < len(selected_data) < 2:
+            self.on_open_in_explorer.emit(selected_data[0].get('source'))
+
+    def _recache_proxy(self) -> None:
+        """
+        Recache the proxy for the selected items.
+        """
+        for row in self._selected_rows():
+            self.on_recache_proxy.emit(
+                self.__model.index(row).data(Qt.UserRole)['source'],
+                (row, 0),
+                self.current_group,
+                self.current_category)
+
+    def _delete_proxy(self) -> None:
+        """
+        Delete the proxy for the selected items.
+        """
+        if commonWidgets.popup_message(
+                'Delete Items', 'Are you sure want to delete the selected item(s)?', 'question'):
+
+            selected_data = self._selected_data()
+            self.on_delete_proxy.emit(
+                self.current_group,
+                self.current_category,
+                [data.get('source') for data in selected_data],
+                {data.get('proxy') for data in selected_data})
+
+    def _update_tag_in_overlay_label(self, tag: str, action: str = 'add') -> None:
+        """
+        Update the tag in the overlay of the selected items.
+
+        :param tag: The tag to update.
+        :type tag: str
+        :param action: The action to perform ('add' or 'remove').
+        :type action: str
+        """
+        for row in self._selected_rows():
+            tags = list(self.__model.index(row).data(Qt.UserRole)['tags'])
+
+            if action == 'add' and tag not in tags:
+                tags.append(tag)
+            elif action == 'remove' and tag in tags:
+                tags.remove(tag)
+            self.__model.set_tags(row, tags)
+
+    def start_thread(self, runnable_object: QRunnable) -> None:
+        """
+        Start a new thread using the thread pool.
+
+        :param runnable_object: The runnable object to execute.
+        :type runnable_object: QRunnable
+        """
+        self.__threadpool.start(runnable_object)
+
+    def dropped_data(self, dropped_files: list):
+        """
+        Add the dropped files as processing thumbnails and request their conversion.
+
+        :param dropped_files: List of (source file, proxy file, is image sequence).
+        :type dropped_files: list
+        """
+        for data in dropped_files:
+            source_file, proxy_file, is_image_seq = data
+            if not source_file:
+                continue
+
+            row = self.__model.append(source_file)
+            self.on_drop_convert_mov.emit(
+                source_file, proxy_file, is_image_seq, (row, 0), self.current_group, self.current_category)
+
+        self.__priority_timer.start()
+
+    def on_conversion_progress(self, source_file: str, cell_position: Tuple[int, int], frame: int,
+                               total_frames: int) -> None:
+        """
+        Show the progress of the conversion of a cell.
+
+        :param source_file: The path of the source file.
+        :type source_file: str
+        :param cell_position: The position of the cell.
+        :type cell_position: tuple
+        :param frame: Number of frames converted.
+        :type frame: int
+        :param total_frames: Number of frames of the source.
+        :type total_frames: int
+        """
+        self.__model.set_progress(cell_position[0], source_file, frame, total_frames)
+
+    def on_conversion_cancelled(self, source_file: str, cell_position: Tuple[int, int]) -> None:
+        """
+        Remove the thumbnail of a dropped file once its conversion is cancelled or failed, it is not in the library.
+
+        :param source_file: The path of the source file.
+        :type source_file: str
+        :param cell_position: The position of the cell.
+        :type cell_position: tuple
+        """
+        self._hide_preview()
+        self.__model.remove_processing(cell_position[0], source_file)
+
+    def load_thumbnails(self, thumbnail_list: List[dict], get_thumbnail_fn: Callable[[str], str]) -> None:
+        """
+        Load thumbnails from a list of data.
+
+        Only the model is filled here, cells are painted when they become visible.
+
+        :param thumbnail_list: List of thumbnail data.
+        :type thumbnail_list: list
+        :param get_thumbnail_fn: get thumbnail from proxy file callable function (from _utilities)
+        :type get_thumbnail_fn: Callable
+        """
+        self._hide_preview()
+        self._cancel_image_requests()
+        self.__model.set_items(thumbnail_list, get_thumbnail_fn)
+        self.__prefetcher.schedule()
+        self.on_load_finished.emit(self.__model.rowCount(), False)
+
+    def on_render_completed(self, data: dict, thumbnail_image: str, cell_position: Tuple[int, int]) -> None:
+        """
+        Handle the completion of thumbnail rendering.
+
+        :param data: The data associated with the thumbnail.
+        :type data: dict
+        :param thumbnail_image: The path to the thumbnail image.
+        :type thumbnail_image: str
+        :param cell_position: The position of the cell.
+        :type cell_position: tuple
+        """
+        if self.__delegate.hovered_row == cell_position[0]:
+            self._hide_preview()
+        _pixmap_cache.cache.invalidate(thumbnail_image)
+        self.__model.update_item(cell_position[0], data, thumbnail_image)
+        self.__prefetcher.schedule()
@@ -9,7 +9,7 @@ organizing and managing the layout and interactions between these components.
 Key Components:
     - **Categories**: Manages grouping and categorization of items.
     - **ActionsUI**: Provides action buttons (e.g., settings, filters).
-    - **ThumbnailUI**: Displays thumbnails for items.
+    - **ThumbnailUI**: Displays thumbnails for items, or **ThumbnailView** in the virtual grid mode.
     - **SettingsUI**: Handles application settings.
     - **StatusBar**: Displays status information.
 
@@ -28,7 +28,8 @@ except ModuleNotFoundError:
     from PySide6 import QtWidgets, QtCore
 
 # -------------------------------- Custom Modules ------------------------------------
-from ui import _categoriesUI, _settingsUI, _actionsUI, _thumbnailUI, _stausbarUI
+from data import config
+from ui import _categoriesUI, _settingsUI, _actionsUI, _thumbnailUI, _thumbnailView, _stausbarUI
 
 
 class MainUI:
@@ -41,12 +42,14 @@ class MainUI:
     :param mainWidget: The main widget where the UI will be set up.
     :type mainWidget: QWidget
     """
-    def setupUi(self, mainWidget: QtWidgets.QWidget):
+    def setupUi(self, mainWidget: QtWidgets.QWidget, grid: str = config.GRID_MODES[0]):
         """
         Set up the main user interface.
 
         :param mainWidget: The main widget to set up the UI in.
         :type mainWidget: QWidget
+        :param grid: The thumbnail grid mode, one of `config.GRID_MODES`.
+        :type grid: str
         """
         if not mainWidget.objectName():
             mainWidget.setObjectName("Ulaavi")
@@ -54,7 +57,7 @@ class MainUI:
 
         self.categories = _categoriesUI.Categories()
         self.actions_ui = _actionsUI.ActionsUI()
-        self.thumbnail = _thumbnailUI.ThumbnailUI()
+        self.thumbnail = _thumbnailView.ThumbnailView() if grid == 'virtual' else _thumbnailUI.ThumbnailUI()
         self.settings = _settingsUI.SettingsUI()
         self.status = _stausbarUI.StatusBar()
 